@@ -0,0 +1,249 @@
+# 工具目录各操作的基准：加载、分类树、搜索、分类筛选、列表刷新、绘制与保存
+# 在 Qt offscreen 平台下运行，无需显示器；每个规模在独立子进程中执行，峰值内存互不影响
+# 用法: python benchmarks/bench_catalog.py [--sizes 100,1000,10000,100000] [--repeat 5]
+#       [--save benchmarks/baseline.json] [--compare benchmarks/baseline.json] [--threshold 1.3]
+# --compare 时最小耗时或峰值内存超过基线 threshold 倍的项目记为退化，返回码为 1
+# （比较最小值而非中位数，受机器上其它负载的干扰更小）
+import os
+import sys
+import gc
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic_catalog
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+SEARCH_QUERIES = ["扫描", "哥斯拉", "gsl", "burp", "nuclei检测", "不存在的工具"]
+TYPING_SEQUENCE = ["x", "xr", "xra", "xray"]
+CATEGORY_CLICKS = ["信息收集", "漏洞利用/中间件", "内网渗透/权限提升/Windows", "__all__"]
+# 绝对差值低于此值的变化视为噪声，不算退化
+NOISE_MS = 2.0
+NOISE_KB = 10 * 1024
+
+def memory_kb():
+    # 返回 (当前 RSS, 进程峰值 RSS)，单位 KB；拿不到时为 None
+    current = peak = None
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            peak //= 1024  # macOS 单位为字节
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        try:
+            import psutil
+            info = psutil.Process().memory_info()
+            current = info.rss // 1024
+            peak = getattr(info, 'peak_wset', info.rss) // 1024 if peak is None else peak
+        except ImportError:
+            pass
+    return current, peak
+
+class Bench:
+    def __init__(self, app, window, repeat):
+        self.app = app
+        self.window = window
+        self.repeat = repeat
+        self.results = {}
+
+    def qt_counts(self):
+        from PyQt5.QtCore import QObject
+        return len(self.window.findChildren(QObject)), len(self.app.allWidgets())
+
+    def measure(self, name, func, setup=None, repeat=None):
+        times = []
+        before, _ = memory_kb()
+        for _ in range(repeat or self.repeat):
+            if setup is not None:
+                setup()
+            self.app.processEvents()
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            times.append((time.perf_counter() - start) * 1000)
+            # 排队的模型/视图事件在计时外处理
+            self.app.processEvents()
+        after, peak = memory_kb()
+        objects, widgets = self.qt_counts()
+        self.results[name] = {
+            "wall_ms": round(statistics.median(times), 3),
+            "min_ms": round(min(times), 3),
+            "max_ms": round(max(times), 3),
+            "peak_rss_kb": peak,
+            "rss_delta_kb": after - before if after is not None and before is not None else None,
+            "qt_objects": objects,
+            "widgets": widgets,
+        }
+
+def run_size(count, repeat, seed):
+    # 在当前进程内跑一个规模，返回 {操作: 指标}
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    tmp_dir = tempfile.mkdtemp(prefix="quickstart-bench-")
+    config_path = os.path.join(tmp_dir, 'config.json')
+    synthetic_catalog.write(config_path, count, seed)
+    from PyQt5.QtWidgets import QApplication
+    import quickstart_gui as gui
+    gui.CONFIG_PATH = config_path  # load_tools 与配置监视读取模块级路径
+    app = QApplication.instance() or QApplication([])
+    window = gui.QuickStartMainWindow()
+    window._catalog_pending = False  # 不走自动加载，由基准逐步驱动
+    window.config_store.close()
+    window.config_store = gui.ConfigStore(config_path, on_error=window.configSaveFailed.emit)
+    window.launch_journal = gui.LaunchJournal(os.path.join(tmp_dir, 'launches.jsonl'))
+    if window.tool_store is not None:
+        window.tool_store.close()
+        window.tool_store = None
+    window.resize(1100, 800)
+    window.show()
+    app.processEvents()
+    bench = Bench(app, window, repeat)
+    try:
+        loaded = {}
+        def load():
+            loaded['tools'] = window.load_tools()
+            window.frecency.build(loaded['tools'], window.launch_history())
+        bench.measure("load_tools", load)
+        window.tools = window.filtered_tools = loaded['tools']
+        bench.measure("build_category_tree", window.build_category_tree)
+        bench.measure("search_index_build", lambda: window.search_index.build(window.tools))
+        def show_all():
+            window.filtered_tools = window.tools
+            window.show_tools()
+        bench.measure("show_tools", show_all)
+        def search():
+            # 与搜索线程返回结果后的处理一致：查询 + 按匹配度刷新列表
+            for query in SEARCH_QUERIES:
+                window.on_search_results(0, query, window.search_index.search_pages(query), 0)
+        bench.measure("search", search)
+        def typing():
+            # 逐字输入，每次都重新查询并刷新列表
+            for query in TYPING_SEQUENCE:
+                window.on_search_results(0, query, window.search_index.search_pages(query), 0)
+        bench.measure("search_typing", typing)
+        items = [window.category_items.get('' if path == "__all__" else path) for path in CATEGORY_CLICKS]
+        def category_clicks():
+            for item in items:
+                if item is not None:
+                    window.on_category_clicked(item)
+        bench.measure("category_click", category_clicks)
+        viewport = window.tool_view.viewport()
+        bench.measure("render_first_page", viewport.repaint, setup=show_all)
+        def scroll_middle():
+            bar = window.tool_view.verticalScrollBar()
+            bar.setValue(bar.maximum() // 2)
+        bench.measure("render_scrolled", viewport.repaint, setup=scroll_middle)
+        def save():
+            window.save_tools()
+            window.config_store.flush()
+        bench.measure("save_tools", save)
+    finally:
+        window.close()
+        app.processEvents()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return bench.results
+
+def machine_info():
+    try:
+        from PyQt5.QtCore import QT_VERSION_STR
+    except ImportError:
+        QT_VERSION_STR = None
+    return {
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def run_all(sizes, repeat, seed, baseline=None):
+    results = {}
+    for size in sizes:
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", str(size), "--repeat", str(repeat), "--seed", str(seed)]
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, encoding='utf-8')
+        if proc.returncode != 0:
+            raise SystemExit(f"规模 {size} 运行失败（返回码 {proc.returncode}）")
+        # 子进程最后一行输出为 JSON 结果
+        results[str(size)] = json.loads(proc.stdout.strip().splitlines()[-1])
+        print_size(size, results[str(size)], (baseline or {}).get("results", {}).get(str(size)))
+    return results
+
+def print_size(size, ops, baseline=None):
+    print(f"\n== {size} 个工具 ==")
+    print(f"{'操作':<22} {'中位(ms)':>10} {'最小(ms)':>10} {'峰值RSS(MB)':>12} {'Qt对象':>8} {'控件':>6}" + (f" {'基线最小(ms)':>12} {'倍数':>6}" if baseline else ""))
+    for name, m in ops.items():
+        peak = f"{m['peak_rss_kb'] / 1024:.1f}" if m.get('peak_rss_kb') is not None else "-"
+        line = f"{name:<22} {m['wall_ms']:>10.2f} {m['min_ms']:>10.2f} {peak:>12} {m['qt_objects']:>8} {m['widgets']:>6}"
+        if baseline:
+            base = baseline.get(name)
+            if base:
+                line += f" {base['min_ms']:>12.2f} {m['min_ms'] / base['min_ms'] if base['min_ms'] else 0:>6.2f}"
+        print(line)
+
+def compare(results, baseline, threshold):
+    # 返回退化项列表：(规模, 操作, 指标, 基线值, 当前值)
+    regressions = []
+    for size, ops in results.items():
+        base_ops = baseline.get("results", {}).get(size, {})
+        for name, m in ops.items():
+            base = base_ops.get(name)
+            if not base:
+                continue
+            if m['min_ms'] > base['min_ms'] * threshold and m['min_ms'] - base['min_ms'] > NOISE_MS:
+                regressions.append((size, name, "min_ms", base['min_ms'], m['min_ms']))
+            if m.get('peak_rss_kb') and base.get('peak_rss_kb') and m['peak_rss_kb'] > base['peak_rss_kb'] * threshold \
+                    and m['peak_rss_kb'] - base['peak_rss_kb'] > NOISE_KB:
+                regressions.append((size, name, "peak_rss_kb", base['peak_rss_kb'], m['peak_rss_kb']))
+            if m['qt_objects'] > base['qt_objects'] * threshold:
+                regressions.append((size, name, "qt_objects", base['qt_objects'], m['qt_objects']))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="quickstart 工具目录基准")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="逗号分隔的工具数量")
+    parser.add_argument("--repeat", type=int, default=5, help="每个操作重复次数，取中位数")
+    parser.add_argument("--seed", type=int, default=0, help="合成目录的随机种子")
+    parser.add_argument("--save", metavar="JSON", help="把结果保存为基线文件")
+    parser.add_argument("--compare", metavar="JSON", help="与基线文件比较")
+    parser.add_argument("--threshold", type=float, default=1.3, help="超过基线多少倍算退化")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker is not None:
+        results = run_size(args.worker, args.repeat, args.seed)
+        sys.stdout.write(json.dumps(results, ensure_ascii=False) + "\n")
+        return 0
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    results = run_all(sizes, args.repeat, args.seed, baseline)
+    report = {"meta": dict(machine_info(), repeat=args.repeat, seed=args.seed), "results": results}
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已保存到 {args.save}")
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n发现 {len(regressions)} 项退化（阈值 {args.threshold}x）:")
+            for size, name, metric, old, new in regressions:
+                print(f"  {size} 个工具 / {name} / {metric}: {old} -> {new}")
+            return 1
+        print(f"\n与基线相比没有超过 {args.threshold}x 的退化")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# Tool 内存占用与加载耗时基准
+# 用法: python benchmarks/bench_tool_memory.py [数量 ...]
+import os
+import sys
+import gc
+import json
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from quickstart_core import Tool
+
+CATEGORIES = ["流量代理/抓包工具", "流量代理/代理逃逸", "WebShell管理器", "RedTeam/综合工具", "信息收集/端口扫描", "信息收集/子域名", "漏洞利用/Web", "漏洞利用/中间件", "内网渗透/横向移动", "内网渗透/隧道代理"]
+TYPES = ["exe", "batch", "vbs", "java8_gui", "java11_gui", "python", "url", "folder"]
+
+# 旧版 Tool（每个实例一个 __dict__，tags 单独复制一份列表），作为对照
+class LegacyTool:
+    def __init__(self, data):
+        self.name = data.get('name', '')
+        self.path = data.get('path', '')
+        self.tool_type = data.get('tool_type', '')
+        self.description = data.get('description', '')
+        self.icon_path = data.get('icon_path', None)
+        self.args = data.get('args', '')
+        self.category = data.get('category', '')
+        self.launch_count = data.get('launch_count', 0)
+        self.last_launch = data.get('last_launch', '')
+        self.tags = []
+        if 'category' in data and data['category']:
+            self.tags.append(data['category'])
+
+def make_config(count, seed=0):
+    rng = random.Random(seed)
+    tools = []
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        folder = f"E:/Penetration/{category}/tool_{i % 500}/"
+        tools.append({
+            "name": f"tool_{i}",
+            "path": folder + f"tool_{i}.exe",
+            "tool_type": rng.choice(TYPES),
+            "description": "常用利器" if i % 3 else "",
+            "icon_path": folder + "icon.ico",
+            "category": category,
+            "launch_count": rng.randint(0, 100),
+            "last_launch": "2025-07-18T17:54:17",
+            "args": ""
+        })
+    return json.dumps({"tools": tools}, ensure_ascii=False)
+
+def measure(cls, text):
+    # 内存：解析 JSON 并构造 Tool 后丢弃原始字典，统计 Tool 列表常驻的内存
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(text)['tools']
+    start = time.perf_counter()
+    tools = [cls(item) for item in items]
+    build_time = time.perf_counter() - start
+    del items
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(tools)
+    del tools
+    gc.collect()
+    # 加载耗时：从 JSON 文本到 Tool 列表（不启用 tracemalloc）
+    start = time.perf_counter()
+    tools = [cls(item) for item in json.loads(text)['tools']]
+    load_time = time.perf_counter() - start
+    return size / count, build_time, load_time
+
+def main(counts):
+    print(f"{'数量':>8} {'实现':<10} {'字节/工具':>10} {'构造(s)':>9} {'加载(s)':>9}")
+    for count in counts:
+        text = make_config(count)
+        for label, cls in (("legacy", LegacyTool), ("slots", Tool.from_dict)):
+            per_tool, build_time, load_time = measure(cls, text)
+            print(f"{count:>8} {label:<10} {per_tool:>10.0f} {build_time:>9.3f} {load_time:>9.3f}")
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000])
@@ -0,0 +1,91 @@
+# 合成工具目录：多级中文分类、中英混合的工具名与描述，同一种子生成的结果完全一致
+# 用法: python benchmarks/synthetic_catalog.py 数量 [输出文件] [--seed N]
+import sys
+import json
+import random
+
+# 一级分类 -> 二级分类 -> 三级分类（空列表表示没有第三级）
+CATEGORY_TREE = {
+    "信息收集": {"端口扫描": [], "子域名": ["被动收集", "爆破"], "指纹识别": [], "目录扫描": []},
+    "漏洞利用": {"Web": ["框架漏洞", "CMS", "反序列化"], "中间件": ["WebLogic", "Tomcat", "JBoss"], "数据库": []},
+    "流量代理": {"抓包工具": [], "代理逃逸": [], "隧道代理": ["HTTP隧道", "DNS隧道", "ICMP隧道"]},
+    "内网渗透": {"横向移动": ["凭据利用", "远程执行"], "域渗透": [], "权限提升": ["Windows", "Linux"]},
+    "WebShell管理器": {"Java": [], "PHP": [], "综合": []},
+    "RedTeam": {"综合工具": [], "免杀": ["加载器", "混淆"], "C2": []},
+    "密码破解": {"在线爆破": [], "哈希破解": []},
+    "应急响应": {"日志分析": [], "进程排查": [], "Webshell查杀": []},
+}
+NAME_WORDS = ["哥斯拉", "冰蝎", "蚁剑", "天蝎", "扫描", "探测", "利用", "检测", "收集", "爆破", "穿透", "隧道",
+              "指纹", "识别", "资产", "漏洞", "代理", "横向", "提权", "免杀", "破解", "分析", "巡检", "综合"]
+ASCII_WORDS = ["Burp", "Yakit", "Nuclei", "Fscan", "Xray", "Ehole", "Frp", "Nps", "Sqlmap", "Hydra", "Mimikatz", "Dirsearch"]
+DESC_WORDS = ["常用利器", "支持批量", "图形界面", "命令行版本", "需要 Java 环境", "内网专用", "速度快", "误报低", "持续更新"]
+TYPES = [("exe", 40), ("java8_gui", 12), ("java11_gui", 10), ("python", 15), ("batch", 8), ("vbs", 5), ("url", 5), ("folder", 5)]
+EXTENSIONS = {"exe": ".exe", "java8_gui": ".jar", "java11_gui": ".jar", "python": ".py", "batch": ".bat", "vbs": ".vbs"}
+
+def categories():
+    result = []
+    for top, subs in CATEGORY_TREE.items():
+        for sub, leaves in subs.items():
+            result.append(f"{top}/{sub}")
+            result.extend(f"{top}/{sub}/{leaf}" for leaf in leaves)
+    return result
+
+def make_name(rng, i):
+    # 中文词组 + 可选英文名/版本号，编号保证唯一
+    words = "".join(rng.sample(NAME_WORDS, rng.randint(1, 3)))
+    if rng.random() < 0.4:
+        words = rng.choice(ASCII_WORDS) + words
+    if rng.random() < 0.3:
+        words += f"v{rng.randint(1, 5)}.{rng.randint(0, 9)}"
+    return f"{words}_{i}"
+
+def generate(count, seed=0):
+    rng = random.Random(seed)
+    all_categories = categories()
+    types, weights = zip(*TYPES)
+    tools = []
+    for i in range(count):
+        # 分类按幂律分布，少数分类工具很多
+        category = all_categories[min(int(rng.paretovariate(1.2)) - 1, len(all_categories) - 1)] if rng.random() < 0.7 else rng.choice(all_categories)
+        tool_type = rng.choices(types, weights)[0]
+        name = make_name(rng, i)
+        folder = f"E:/Penetration/{category}/{name}/"
+        if tool_type == "url":
+            path = f"https://tools.example.com/{i}"
+        elif tool_type == "folder":
+            path = folder.rstrip('/')
+        else:
+            path = folder + name + EXTENSIONS.get(tool_type, ".exe")
+        launches = int(rng.expovariate(0.1)) if rng.random() < 0.6 else 0
+        tools.append({
+            "name": name,
+            "path": path,
+            "tool_type": tool_type,
+            "description": "，".join(rng.sample(DESC_WORDS, rng.randint(0, 3))),
+            "icon_path": folder + "icon.ico" if rng.random() < 0.5 else None,
+            "category": category,
+            "launch_count": launches,
+            "last_launch": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00" if launches else "",
+            "args": "--gui" if rng.random() < 0.1 else ""
+        })
+    return {"tools": tools}
+
+def write(path, count, seed=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(generate(count, seed), f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    seed = 0
+    if "--seed" in args:
+        i = args.index("--seed")
+        seed = int(args[i + 1])
+        del args[i:i + 2]
+    if not args:
+        print("用法: python benchmarks/synthetic_catalog.py 数量 [输出文件] [--seed N]", file=sys.stderr)
+        sys.exit(2)
+    count = int(args[0])
+    if len(args) > 1:
+        write(args[1], count, seed)
+    else:
+        json.dump(generate(count, seed), sys.stdout, ensure_ascii=False, indent=2)
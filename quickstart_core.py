@@ -0,0 +1,2150 @@
+# quickstart 核心：工具数据、配置与启动日志、SQLite 存储、搜索索引、分类树、常用度排序、启动引擎与命令行模式
+# 不依赖 Qt，命令行模式只导入本模块；图形界面（quickstart_gui.py）在此之上构建
+import sys
+import os
+import json
+import subprocess
+import threading
+import time
+import math
+import bisect
+import heapq
+import hashlib
+import re
+import shutil
+from datetime import datetime
+from functools import lru_cache
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
+CONFIG_FLUSH_DELAY = 1.0
+LAUNCH_JOURNAL_PATH = os.path.join(os.path.dirname(CONFIG_PATH), 'launches.jsonl')
+TOOLS_DB_PATH = os.path.join(os.path.dirname(CONFIG_PATH), 'tools.db')
+DEPENDENCY_CACHE_PATH = os.path.join(os.path.dirname(CONFIG_PATH), '.dependency_cache.json')
+VENV_ROOT = os.path.join(os.path.dirname(CONFIG_PATH), '.venvs')
+WHEEL_CACHE_DIR = os.path.join(os.path.dirname(CONFIG_PATH), '.wheel_cache')
+VENV_WORKERS = 2
+JAVA_RUNTIMES_PATH = os.path.join(os.path.dirname(CONFIG_PATH), '.java_runtimes.json')
+CDS_CACHE_DIR = os.path.join(os.path.dirname(CONFIG_PATH), '.cds_cache')
+CDS_MIN_LAUNCHES = 3
+IPC_TIMEOUT_MS = 300
+JOURNAL_COMPACT_THRESHOLD = 2000
+JOURNAL_KEEP_PER_TOOL = 50
+FRECENCY_HALF_LIFE_DAYS = 14
+SQLITE_PAGE_SIZE = 200
+SEARCH_PAGE_SIZE = 100
+SEARCH_DIRECT_LIMIT = 512  # 候选不超过这个数时直接逐个打分
+SEARCH_GROUP_LIMIT = 8192  # 候选不超过这个数时整组求出匹配分组
+METRIC_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+FRECENCY_EPOCH = 1577836800  # 2020-01-01，分数的时间基准
+
+# 可选依赖：pypinyin 提供完整的汉字拼音，未安装时按 GB2312 编码区间推算首字母
+# 导入较慢，第一次需要拼音时才导入，不拖慢命令行模式的启动
+_pinyin = None
+
+def _load_pinyin():
+    global _pinyin
+    if _pinyin is None:
+        try:
+            from pypinyin import lazy_pinyin, Style
+            _pinyin = (lazy_pinyin, Style)
+        except ImportError:
+            _pinyin = False
+    return _pinyin
+
+def _split_path(path):
+    # 目录部分驻留（intern），同目录下的工具路径与图标路径共享同一个字符串对象
+    # 非字符串（None，或手工编辑 config.json 写成了数字等）原样保存，目录部分记为 None
+    if not isinstance(path, str):
+        return None, path
+    head, sep, tail = path.rpartition('/')
+    if '\\' in tail:
+        head, sep, tail = path.rpartition('\\')
+    return sys.intern(head + sep), tail
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+# 工具数据结构：使用 __slots__，分类、类型与路径目录做字符串驻留，大型工具库下更省内存
+class Tool:
+    __slots__ = ('name', 'description', 'args', 'launch_count', 'last_launch', 'id',
+                 '_category', '_tool_type', '_path_dir', '_path_base', '_icon_dir', '_icon_base')
+    def __init__(self, data):
+        get = data.get
+        self.name = get('name', '')
+        self._path_dir, self._path_base = _split_path(get('path', ''))
+        self._tool_type = _intern(get('tool_type', ''))
+        self.description = get('description', '')
+        self._icon_dir, self._icon_base = _split_path(get('icon_path', None))
+        self.args = get('args', '')
+        self._category = _intern(get('category', ''))
+        self.launch_count = get('launch_count', 0)
+        self.last_launch = get('last_launch', '')
+        self.id = get('id')  # 仅 SQLite 存储使用
+
+    @classmethod
+    def from_dict(cls, data):
+        # 与 to_dict 对应的构造入口，等同于 Tool(data)；拆分路径与驻留字符串换来更少的内存，
+        # 加载比每个实例一个 __dict__ 的旧版略慢（见 benchmarks/bench_tool_memory.py）
+        return cls(data)
+
+    def to_dict(self):
+        # 字段顺序与 config.json 保持一致
+        return {
+            "name": self.name,
+            "path": self.path,
+            "tool_type": self.tool_type,
+            "description": self.description,
+            "icon_path": self.icon_path,
+            "category": self.category,
+            "launch_count": self.launch_count,
+            "last_launch": self.last_launch,
+            "args": self.args
+        }
+
+    @property
+    def category(self):
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        self._category = _intern(value)
+
+    @property
+    def tool_type(self):
+        return self._tool_type
+
+    @tool_type.setter
+    def tool_type(self, value):
+        self._tool_type = _intern(value)
+
+    @property
+    def path(self):
+        return self._path_base if self._path_dir is None else self._path_dir + self._path_base
+
+    @path.setter
+    def path(self, value):
+        self._path_dir, self._path_base = _split_path(value)
+
+    @property
+    def icon_path(self):
+        return self._icon_base if self._icon_dir is None else self._icon_dir + self._icon_base
+
+    @icon_path.setter
+    def icon_path(self, value):
+        self._icon_dir, self._icon_base = _split_path(value)
+
+    @property
+    def tags(self):
+        # 标签由分类派生（可扩展更多标签字段）
+        return [self._category] if self._category else []
+
+def tool_key(tool):
+    # 启动日志中用于识别工具的键
+    return (tool.name, tool.path)
+
+# 性能埋点：各关键阶段的耗时按固定分桶聚合为直方图，只保存在内存中
+# 默认关闭，关闭时 span() 返回共享的空上下文，开销只有一次属性判断
+class _NullSpan:
+    __slots__ = ()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ('registry', 'name', 'start')
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+    def __init__(self, size):
+        self.counts = [0] * (size + 1)  # 最后一个桶为 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def copy(self):
+        other = Histogram(len(self.counts) - 1)
+        other.counts = list(self.counts)
+        other.count, other.total, other.min, other.max = self.count, self.total, self.min, self.max
+        return other
+
+    def quantile(self, q, buckets):
+        # 按分桶线性插值估算分位数（毫秒）
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                low = buckets[i - 1] if i else 0.0
+                high = buckets[i] if i < len(buckets) else self.max
+                return min(self.max, max(self.min, low + (high - low) * (rank - seen) / n))
+            seen += n
+        return self.max
+
+class MetricsRegistry:
+    def __init__(self, buckets=METRIC_BUCKETS_MS):
+        self.enabled = False
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def span(self, name):
+        # with metrics.span("阶段"): ...
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def observe(self, name, elapsed_ms):
+        if not self.enabled:
+            return
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram(len(self.buckets))
+            hist.counts[bisect.bisect_left(self.buckets, elapsed_ms)] += 1
+            hist.count += 1
+            hist.total += elapsed_ms
+            hist.min = min(hist.min, elapsed_ms)
+            hist.max = max(hist.max, elapsed_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: hist.copy() for name, hist in self._histograms.items()}
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+    def to_json(self):
+        result = {}
+        for name, hist in sorted(self.snapshot().items()):
+            result[name] = {
+                "count": hist.count,
+                "sum_ms": round(hist.total, 3),
+                "min_ms": round(hist.min, 3) if hist.count else None,
+                "max_ms": round(hist.max, 3),
+                "p50_ms": round(hist.quantile(0.5, self.buckets), 3),
+                "p95_ms": round(hist.quantile(0.95, self.buckets), 3),
+                "p99_ms": round(hist.quantile(0.99, self.buckets), 3),
+                "buckets": {str(le): n for le, n in zip(self.buckets + ("+Inf",), hist.counts)},
+            }
+        return result
+
+    def to_prometheus(self):
+        # Prometheus 文本格式（node_exporter textfile collector 可直接读取），单位为秒，桶计数为累计值
+        lines = ["# HELP quickstart_span_seconds Duration of instrumented quickstart phases.",
+                 "# TYPE quickstart_span_seconds histogram"]
+        for name, hist in sorted(self.snapshot().items()):
+            label = name.replace('\\', '\\\\').replace('"', '\\"')
+            cumulative = 0
+            for le, n in zip(self.buckets, hist.counts):
+                cumulative += n
+                lines.append(f'quickstart_span_seconds_bucket{{span="{label}",le="{le / 1000:g}"}} {cumulative}')
+            lines.append(f'quickstart_span_seconds_bucket{{span="{label}",le="+Inf"}} {hist.count}')
+            lines.append(f'quickstart_span_seconds_sum{{span="{label}"}} {hist.total / 1000:.6f}')
+            lines.append(f'quickstart_span_seconds_count{{span="{label}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        # 扩展名为 .json 时导出 JSON，否则为 Prometheus 文本；先写临时文件再替换，读取方不会看到半个文件
+        if path.lower().endswith('.json'):
+            text = json.dumps({"generated": time.strftime("%Y-%m-%dT%H:%M:%S"), "spans": self.to_json()}, ensure_ascii=False, indent=2)
+        else:
+            text = self.to_prometheus()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+metrics = MetricsRegistry()
+
+# 配置持久化：合并多次修改，由单一写线程延迟落盘，写临时文件后原子替换
+class ConfigStore:
+    def __init__(self, path=CONFIG_PATH, flush_delay=CONFIG_FLUSH_DELAY, on_error=None):
+        self.path = path
+        self.flush_delay = flush_delay
+        self.on_error = on_error
+        self.extra = {}  # tools 以外的配置项（如 java8_path），写回时原样保留
+        self.last_stat = None  # 最近一次由本进程读取或写入后文件的 (mtime_ns, size)，用于区分外部修改
+        self._snapshot = None
+        self._dirty = False
+        self._closed = False
+        self._last_ok = True
+        self._cond = threading.Condition()
+        self._write_lock = threading.RLock()
+        self._thread = threading.Thread(target=self._run, name='config-writer', daemon=True)
+        self._thread.start()
+
+    def load(self):
+        with metrics.span("config.load"), open(self.path, 'r', encoding='utf-8') as f:
+            stat = os.fstat(f.fileno())
+            data = json.load(f)
+        self.extra = {k: v for k, v in data.items() if k != 'tools'}
+        self.last_stat = (stat.st_mtime_ns, stat.st_size)
+        return data
+
+    @staticmethod
+    def stat_key(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def mark_dirty(self, snapshot):
+        # snapshot 为无参回调，返回要写入的顶层字段；真正落盘时才调用，一段时间内的多次修改只序列化一次
+        with self._cond:
+            self._snapshot = snapshot
+            if not self._dirty:
+                self._dirty = True
+                self._cond.notify()
+
+    def flush(self):
+        # 同步写入待保存的修改，返回最近一次写入是否成功
+        with self._write_lock:
+            with self._cond:
+                snapshot = self._take()
+            if snapshot is not None:
+                self._write(snapshot)
+            return self._last_ok
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _take(self):
+        snapshot = self._snapshot if self._dirty else None
+        self._snapshot = None
+        self._dirty = False
+        return snapshot
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + self.flush_delay
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+                snapshot = self._take()
+            if snapshot is not None:
+                self._write(snapshot)
+
+    def _write(self, snapshot):
+        with self._write_lock, metrics.span("config.write"):
+            try:
+                data = dict(snapshot())
+                for key, value in self.extra.items():
+                    data.setdefault(key, value)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                self.last_stat = self.stat_key(self.path)
+                self._last_ok = True
+            except Exception as e:
+                self._last_ok = False
+                if self.on_error:
+                    self.on_error(str(e))
+
+# 启动日志：每次启动追加一行，加载时折算进 launch_count/last_launch
+# config.json 中的 journal_seq 记录已折算进计数的最大序号，之后的记录在加载时重放
+class LaunchJournal:
+    def __init__(self, path=LAUNCH_JOURNAL_PATH, compact_threshold=JOURNAL_COMPACT_THRESHOLD, keep_per_tool=JOURNAL_KEEP_PER_TOOL):
+        self.path = path
+        self.compact_threshold = compact_threshold
+        self.keep_per_tool = keep_per_tool
+        self.seq = 0
+        self.events = {}  # (name, path) -> [(seq, 时间), ...]
+        self.lock = threading.RLock()
+        self._lines = 0
+        self._compacted_lines = 0  # 上次整理后保留的行数，只有之后新增的行计入整理阈值
+        self._file = None
+
+    def load(self, tools, folded_seq=0):
+        by_key = {tool_key(t): t for t in tools}
+        self.seq = folded_seq
+        self.events = {}
+        self._lines = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                        seq, key, ts = event['seq'], (event['name'], event['path']), event['ts']
+                    except (ValueError, KeyError, TypeError):
+                        continue  # 崩溃时写了一半的行
+                    self._lines += 1
+                    self.events.setdefault(key, []).append((seq, ts))
+                    self.seq = max(self.seq, seq)
+                    tool = by_key.get(key)
+                    if seq > folded_seq and tool is not None:
+                        tool.launch_count += 1
+                        if ts > (tool.last_launch or ''):
+                            tool.last_launch = ts
+        # 文件中可能有上次整理保留的历史，按每个工具最多 keep_per_tool 条估计
+        self._compacted_lines = sum(min(len(items), self.keep_per_tool) for items in self.events.values())
+        return self.needs_compaction()
+
+    def record(self, tool, ts):
+        # 计数与追加在同一把锁内完成，保证与 config.json 快照的一致性
+        with self.lock, metrics.span("journal.append"):
+            self.seq += 1
+            tool.launch_count += 1
+            tool.last_launch = ts
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps({"seq": self.seq, "name": tool.name, "path": tool.path, "ts": ts}, ensure_ascii=False) + '\n')
+            self._file.flush()
+            self.events.setdefault(tool_key(tool), []).append((self.seq, ts))
+            self._lines += 1
+            return self.needs_compaction()
+
+    def needs_compaction(self):
+        return self._lines - self._compacted_lines > self.compact_threshold
+
+    def history(self, tool):
+        return [ts for _, ts in self.events.get(tool_key(tool), [])]
+
+    def compact(self, persist_catalog):
+        # 先把计数写进 config.json，成功后重写日志：
+        # 保留尚未折算的记录，以及每个工具最近 keep_per_tool 条历史
+        with self.lock:
+            folded_seq = self.seq
+        if not persist_catalog():
+            return False
+        with self.lock:
+            events = {}
+            for key, items in self.events.items():
+                kept = [item for i, item in enumerate(items) if item[0] > folded_seq or i >= len(items) - self.keep_per_tool]
+                if kept:
+                    events[key] = kept
+            rows = sorted((seq, key, ts) for key, items in events.items() for seq, ts in items)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for seq, key, ts in rows:
+                    f.write(json.dumps({"seq": seq, "name": key[0], "path": key[1], "ts": ts}, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(tmp_path, self.path)
+            self.events = events
+            self._lines = self._compacted_lines = len(rows)
+        return True
+
+    def close(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# SQLite 存储：适用于大型工具库，category/tool_type 建索引，名称与描述建 FTS5 全文索引
+# 存在 tools.db 时主窗口改用此存储，工具的增删改与启动只更新对应的行
+class SqliteToolStore:
+    COLUMNS = ('id', 'name', 'path', 'tool_type', 'description', 'icon_path', 'args', 'category', 'launch_count', 'last_launch')
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tools (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL DEFAULT '',
+        path TEXT NOT NULL DEFAULT '',
+        tool_type TEXT NOT NULL DEFAULT '',
+        description TEXT NOT NULL DEFAULT '',
+        icon_path TEXT,
+        args TEXT NOT NULL DEFAULT '',
+        category TEXT NOT NULL DEFAULT '',
+        launch_count INTEGER NOT NULL DEFAULT 0,
+        last_launch TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX IF NOT EXISTS idx_tools_category ON tools(category);
+    CREATE INDEX IF NOT EXISTS idx_tools_tool_type ON tools(tool_type);
+    CREATE INDEX IF NOT EXISTS idx_tools_launch_count ON tools(launch_count DESC);
+    CREATE TABLE IF NOT EXISTS launches (tool_id INTEGER NOT NULL, ts TEXT NOT NULL);
+    CREATE INDEX IF NOT EXISTS idx_launches_tool_id ON launches(tool_id);
+    CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    """
+    FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tools_fts USING fts5(name, description, content='tools', content_rowid='id', tokenize='trigram');
+    CREATE TRIGGER IF NOT EXISTS tools_fts_insert AFTER INSERT ON tools BEGIN
+        INSERT INTO tools_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tools_fts_delete AFTER DELETE ON tools BEGIN
+        INSERT INTO tools_fts(tools_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tools_fts_update AFTER UPDATE OF name, description ON tools BEGIN
+        INSERT INTO tools_fts(tools_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO tools_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END;
+    """
+    def __init__(self, path=TOOLS_DB_PATH, identity=False):
+        import sqlite3
+        self.path = path
+        # identity=True 时同一行始终返回同一个 Tool 对象（图形界面的进程监管、健康检查按对象跟踪），
+        # 只保存查询过的工具
+        self._objects = {} if identity else None
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+        # trigram 分词需要 SQLite 3.34+，不可用时退回 LIKE 查询
+        try:
+            self._conn.executescript(self.FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def query(self, category=None, tool_type=None, text=None, name=None, limit=None, offset=0):
+        # 按启动次数降序返回匹配的工具，只构造结果行对应的 Tool
+        where, params = self._where(category, tool_type, text, name)
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM tools{where} ORDER BY launch_count DESC, id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            if self._objects is None:
+                return [Tool.from_dict(dict(zip(self.COLUMNS, row))) for row in rows]
+            # 已构造过的工具沿用原对象，内存中的状态以它为准（修改都会同步写入库中）
+            tools = []
+            for row in rows:
+                tool = self._objects.get(row[0])
+                if tool is None:
+                    tool = self._objects[row[0]] = Tool.from_dict(dict(zip(self.COLUMNS, row)))
+                tools.append(tool)
+            return tools
+
+    def count(self, category=None, tool_type=None, text=None, name=None):
+        where, params = self._where(category, tool_type, text, name)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM tools{where}", params).fetchone()[0]
+
+    def pages(self, page_size=SQLITE_PAGE_SIZE, **filters):
+        return SqliteToolPages(self, page_size, **filters)
+
+    def search_pages(self, text, cancelled=None):
+        # 与 ToolSearchIndex.search_pages 接口相同，供搜索线程调用；返回已读取第一页的分页结果
+        return self.pages(text=text).load()
+
+    def loaded_tools(self):
+        # identity=True 时已构造的工具（界面上显示过的）
+        with self._lock:
+            return list(self._objects.values()) if self._objects is not None else []
+
+    def categories(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT category FROM tools WHERE category != '' ORDER BY category")]
+
+    def category_counts(self):
+        # 分类 -> 直接属于该分类的工具数，走 category 索引，不读取工具
+        with self._lock:
+            return dict(self._conn.execute("SELECT category, COUNT(*) FROM tools GROUP BY category"))
+
+    def settings(self):
+        # 按导入时的顺序返回
+        with self._lock:
+            return {key: json.loads(value) for key, value in self._conn.execute("SELECT key, value FROM settings ORDER BY rowid")}
+
+    def save_tool(self, tool):
+        values = [getattr(tool, column) for column in self.COLUMNS[1:]]
+        with self._lock, self._conn:
+            if tool.id is None:
+                cur = self._conn.execute(f"INSERT INTO tools ({', '.join(self.COLUMNS[1:])}) VALUES ({', '.join('?' * len(values))})", values)
+                tool.id = cur.lastrowid
+                if self._objects is not None:
+                    self._objects[tool.id] = tool
+            else:
+                assignments = ', '.join(f"{column} = ?" for column in self.COLUMNS[1:])
+                self._conn.execute(f"UPDATE tools SET {assignments} WHERE id = ?", values + [tool.id])
+
+    def delete_tool(self, tool):
+        if tool.id is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tools WHERE id = ?", (tool.id,))
+            self._conn.execute("DELETE FROM launches WHERE tool_id = ?", (tool.id,))
+            if self._objects is not None:
+                self._objects.pop(tool.id, None)
+
+    def record_launch(self, tool, ts):
+        with self._lock, self._conn, metrics.span("db.record_launch"):
+            tool.launch_count += 1
+            tool.last_launch = ts
+            if tool.id is None:
+                return
+            self._conn.execute("UPDATE tools SET launch_count = launch_count + 1, last_launch = ? WHERE id = ?", (ts, tool.id))
+            self._conn.execute("INSERT INTO launches (tool_id, ts) VALUES (?, ?)", (tool.id, ts))
+
+    def import_json(self, config_path=CONFIG_PATH, journal_path=LAUNCH_JOURNAL_PATH):
+        # 一次性导入 config.json（含启动日志中尚未折算的次数），覆盖库中已有的工具
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        tools = [Tool.from_dict(item) for item in data.get('tools', [])]
+        LaunchJournal(journal_path).load(tools, data.get('journal_seq', 0))
+        settings = {k: v for k, v in data.items() if k not in ('tools', 'journal_seq')}
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tools")
+            self._conn.execute("DELETE FROM launches")
+            self._conn.execute("DELETE FROM settings")
+            self._conn.executemany(f"INSERT INTO tools ({', '.join(self.COLUMNS[1:])}) VALUES ({', '.join('?' * (len(self.COLUMNS) - 1))})",
+                                   ([getattr(t, column) for column in self.COLUMNS[1:]] for t in tools))
+            self._conn.executemany("INSERT INTO settings (key, value) VALUES (?, ?)", ((k, json.dumps(v, ensure_ascii=False)) for k, v in settings.items()))
+        return len(tools)
+
+    def export_json(self, config_path=CONFIG_PATH, journal_path=LAUNCH_JOURNAL_PATH):
+        # 导出为 config.json 格式（字段顺序与 config.json 一致，不含 id），写临时文件后原子替换
+        # 导入时已折算启动日志，导出时记下其最大序号，避免重新加载 config.json 时再次计入
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM tools ORDER BY id").fetchall()
+        tools = [Tool.from_dict(dict(zip(self.COLUMNS, row))).to_dict() for row in rows]
+        data = {"tools": tools}
+        data.update(self.settings())
+        journal = LaunchJournal(journal_path)
+        journal.load([])
+        if journal.seq:
+            data["journal_seq"] = journal.seq
+        tmp_path = config_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+        return len(tools)
+
+    def _where(self, category, tool_type, text, name=None):
+        clauses, params = [], []
+        if name:
+            clauses.append("name = ? COLLATE NOCASE")
+            params.append(name)
+        if category:
+            # 子分类用区间查询，可以走 category 索引，且不会误匹配同前缀的兄弟分类
+            clauses.append("(category = ? OR (category >= ? AND category < ?))")
+            params += [category, category + '/', category + '0']
+        if tool_type:
+            clauses.append("tool_type = ?")
+            params.append(tool_type)
+        text = (text or '').strip()
+        if text:
+            like = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            if self.has_fts and len(text) >= 3:
+                clauses.append("(id IN (SELECT rowid FROM tools_fts WHERE tools_fts MATCH ?) OR category LIKE ? ESCAPE '\\')")
+                params += ['"' + text.replace('"', '""') + '"', like]
+            else:
+                clauses.append("(name LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\' OR category LIKE ? ESCAPE '\\')")
+                params += [like, like, like]
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+# tools.db 查询结果的分页视图：构造时不查询，load() 读取第一页，界面滚动到底部时再用 fetch() 读取后续页
+# 不支持迭代，避免不经意间把整个工具库读进内存
+class SqliteToolPages:
+    def __init__(self, store, page_size=SQLITE_PAGE_SIZE, **filters):
+        self.store = store
+        self.page_size = page_size
+        self.filters = filters
+        self.first = []
+        self._total = None
+
+    def load(self):
+        self.first = self.fetch(0)
+        self._total = None
+        return self
+
+    def fetch(self, offset):
+        return self.store.query(limit=self.page_size, offset=offset, **self.filters)
+
+    def __len__(self):
+        # 匹配的总数，首次访问时查询并缓存
+        if self._total is None:
+            self._total = self.store.count(**self.filters)
+        return self._total
+
+    def invalidate(self):
+        self._total = None
+
+# GB2312 一级汉字按拼音排序，各声母的起始编码
+_GB2312_INITIAL_CODES = [-20319, -20283, -19775, -19218, -18710, -18526, -18239, -17922, -17417, -16474, -16212, -15640, -15165, -14922, -14914, -14630, -14149, -14090, -13318, -12838, -12556, -11847, -11055]
+_GB2312_INITIAL_LETTERS = "abcdefghjklmnopqrstwxyz"
+
+@lru_cache(maxsize=None)
+def hanzi_initial(ch):
+    pinyin = _load_pinyin()
+    if pinyin:
+        lazy_pinyin, Style = pinyin
+        letters = lazy_pinyin(ch, style=Style.FIRST_LETTER, errors='ignore')
+        return letters[0].lower() if letters else ''
+    try:
+        encoded = ch.encode('gb2312')
+    except UnicodeEncodeError:
+        return ''
+    if len(encoded) != 2:
+        return ''
+    code = encoded[0] * 256 + encoded[1] - 65536
+    if code < -20319 or code > -10247:
+        return ''
+    return _GB2312_INITIAL_LETTERS[bisect.bisect_right(_GB2312_INITIAL_CODES, code) - 1]
+
+def pinyin_initials(text):
+    # 如 "冰蝎_v4" -> "bxv4"，英文数字保留，汉字取拼音首字母
+    out = []
+    for ch in text:
+        if ch.isascii():
+            if ch.isalnum():
+                out.append(ch.lower())
+        elif '\u4e00' <= ch <= '\u9fff':
+            out.append(hanzi_initial(ch))
+    return ''.join(out)
+
+def subsequence_span(query, text):
+    # query 作为子序列出现在 text 中时返回覆盖跨度，否则返回 0
+    pos = text.find(query[0])
+    if pos < 0:
+        return 0
+    start = cur = pos
+    for ch in query[1:]:
+        cur = text.find(ch, cur + 1)
+        if cur < 0:
+            return 0
+    return cur - start + 1
+
+# 工具搜索索引：字符/二元组倒排表 + 拼音首字母 + 模糊子序列，按匹配度与启动次数综合排序
+class ToolSearchIndex:
+    def __init__(self):
+        self._state = self._new_state()
+        self._bonuses = {}  # 启动次数 -> 启动次数加分
+        # 搜索在后台线程执行，增删改在界面线程执行；全量重建在锁外进行，完成后一次性替换
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._pending = None  # 重建期间的增删，替换前在新索引上重放
+
+    @staticmethod
+    def _new_state():
+        # docs: doc_id -> (tool, name, pinyin, category, description)
+        # doc_ids: id(tool) -> doc_id
+        # postings: 所有字段的单字与二元组 -> doc_id 集合，用于子串匹配
+        # name_chars: 名称及拼音首字母中的单字 -> doc_id 集合，用于模糊匹配
+        # names: 完整名称 -> doc_id 元组（重名很少，不用集合以节省内存）
+        # name_prefix / pinyin_prefix: 名称及拼音的前一两个字 -> doc_id 集合；与 names 一起用于给结果分组估计匹配度上界
+        # by_count: 建索引时的启动次数 -> doc_id 集合，counts: doc_id -> 该启动次数
+        return {"docs": {}, "doc_ids": {}, "postings": {}, "name_chars": {}, "names": {},
+                "name_prefix": {}, "pinyin_prefix": {}, "by_count": {}, "counts": {}, "next_id": 0}
+
+    def __len__(self):
+        return len(self._state["docs"])
+
+    def build(self, tools):
+        with self._build_lock:
+            with self._lock:
+                self._pending = []
+            state = self._new_state()
+            for tool in tools:
+                self._add_to(state, tool, self._fields(tool))
+            with self._lock:
+                for op, tool in self._pending:
+                    self._remove_from(state, tool)
+                    if op == "add":
+                        self._add_to(state, tool, self._fields(tool))
+                self._pending = None
+                self._state = state
+
+    def add(self, tool):
+        fields = self._fields(tool)
+        with self._lock:
+            self._add_to(self._state, tool, fields)
+            if self._pending is not None:
+                self._pending.append(("add", tool))
+
+    def remove(self, tool):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("remove", tool))
+            self._remove_from(self._state, tool)
+
+    def update(self, tool):
+        with self._lock:
+            self.remove(tool)
+            self.add(tool)
+
+    def touch(self, tool):
+        # 启动次数变化后调用，只把工具移到新的启动次数分组
+        with self._lock:
+            state = self._state
+            doc_id = state["doc_ids"].get(id(tool))
+            if doc_id is None or state["counts"][doc_id] == tool.launch_count:
+                return
+            self._discard(state["by_count"], (state["counts"][doc_id],), doc_id)
+            state["counts"][doc_id] = tool.launch_count
+            state["by_count"].setdefault(tool.launch_count, set()).add(doc_id)
+            if self._pending is not None:
+                self._pending.append(("add", tool))
+
+    @classmethod
+    def _add_to(cls, state, tool, fields):
+        doc_id = state["next_id"]
+        state["next_id"] += 1
+        state["docs"][doc_id] = (tool,) + fields
+        state["doc_ids"][id(tool)] = doc_id
+        postings, name_chars = state["postings"], state["name_chars"]
+        for gram in cls._grams(fields):
+            postings.setdefault(gram, set()).add(doc_id)
+        for ch in set(fields[0] + fields[1]):
+            name_chars.setdefault(ch, set()).add(doc_id)
+        state["names"][fields[0]] = state["names"].get(fields[0], ()) + (doc_id,)
+        for prefix in cls._prefixes(fields[0]):
+            state["name_prefix"].setdefault(prefix, set()).add(doc_id)
+        for prefix in cls._prefixes(fields[1]):
+            state["pinyin_prefix"].setdefault(prefix, set()).add(doc_id)
+        state["counts"][doc_id] = tool.launch_count
+        state["by_count"].setdefault(tool.launch_count, set()).add(doc_id)
+
+    @classmethod
+    def _remove_from(cls, state, tool):
+        doc_id = state["doc_ids"].pop(id(tool), None)
+        if doc_id is None:
+            return False
+        entry = state["docs"].pop(doc_id)
+        cls._discard(state["postings"], cls._grams(entry[1:]), doc_id)
+        cls._discard(state["name_chars"], set(entry[1] + entry[2]), doc_id)
+        same_name = tuple(other for other in state["names"].pop(entry[1], ()) if other != doc_id)
+        if same_name:
+            state["names"][entry[1]] = same_name
+        cls._discard(state["name_prefix"], cls._prefixes(entry[1]), doc_id)
+        cls._discard(state["pinyin_prefix"], cls._prefixes(entry[2]), doc_id)
+        cls._discard(state["by_count"], (state["counts"].pop(doc_id),), doc_id)
+        return True
+
+    @staticmethod
+    def _prefixes(text):
+        return {text[:1], text[:2]} if text else ()
+
+    def search(self, text, cancelled=None, limit=None):
+        # cancelled 为可选回调，返回 True 时中止查询并返回 None
+        # 给出 limit 时只返回最相关的前 limit 个，不对全部结果打分排序
+        with self._lock:
+            result = self._search(text, cancelled, limit)
+        return None if result is None else result[0]
+
+    def search_page(self, text, limit, cancelled=None):
+        # 返回 (前 limit 个结果, 匹配数)
+        with self._lock:
+            return self._search(text, cancelled, limit)
+
+    def search_pages(self, text, cancelled=None):
+        # 供搜索线程调用，返回已读取第一页的分页结果（接口同 SqliteToolStore.search_pages）
+        return SearchPages(self, text).load(cancelled)
+
+    def _search(self, text, cancelled, limit=None):
+        state = self._state
+        docs = state["docs"]
+        query = text.strip().lower()
+        if not query:
+            tools = [entry[0] for entry in docs.values()]
+            return (tools if limit is None else tools[:limit]), len(tools)
+        grams = query if len(query) == 1 else [query[i:i + 2] for i in range(len(query) - 1)]
+        candidates = self._intersect(state["postings"], grams)
+        by_count, counts = state["by_count"], state["counts"]
+        bonuses = self._bonuses
+        order = sorted(by_count, reverse=True)
+        for count in order:
+            if count not in bonuses:
+                bonuses[count] = self._launch_bonus(count)
+        substring_quality, fuzzy_quality = self._substring_quality, self._fuzzy_quality
+        heap = []  # 最小堆，保存目前分数最高的 limit 个 (分数, doc_id, tool)
+
+        def score(doc_ids, fuzzy_only, bonus=None):
+            # 返回匹配的个数，被取消时返回 None
+            matched = 0
+            for i, doc_id in enumerate(doc_ids):
+                if cancelled is not None and not i & 1023 and i and cancelled():
+                    return None
+                entry = docs[doc_id]
+                quality = None if fuzzy_only else substring_quality(query, entry)
+                if quality is None:
+                    quality = fuzzy_quality(query, entry)
+                    if quality is None:
+                        continue
+                matched += 1
+                item = (quality + (bonuses[counts[doc_id]] if bonus is None else bonus), doc_id, entry[0])
+                if limit is None or len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+            return matched
+
+        # 按匹配度上界把工具分组：0 名称相同 100，1 名称以查询开头 80，2 拼音以查询开头 70，
+        # 3 名称或拼音含查询的每个字 60，4 其余子串匹配（分类、描述）40，5 模糊匹配 20。
+        # 按上界从高到低处理各组，上界不超过当前第 limit 名的分数时停止；人数多的组再按启动次数细分，
+        # 只有可能进入这一页的工具才逐个打分
+        groups = [0, 1, 2, 3, 4, 5] if len(query) > 1 else [0, 1, 2, 3, 4]
+        total = len(candidates)
+        if limit is None or total <= SEARCH_DIRECT_LIMIT:
+            # 候选不多（或需要全部结果）时直接逐个打分，之后只剩模糊匹配
+            total = score(candidates, False)
+            if total is None:
+                return None
+            groups = groups[5:]
+        head = query[:2]
+        exact_name = set(state["names"].get(query, ()))
+        name_prefix = state["name_prefix"].get(head, set())
+        pinyin_prefix = state["pinyin_prefix"].get(head, set())
+        if len(query) > 2:
+            # 两个字以内时前缀分组本身就是候选的子集
+            name_prefix = name_prefix & candidates
+            pinyin_prefix = pinyin_prefix & candidates
+        name_chars = sorted((state["name_chars"].get(ch, set()) for ch in set(query)), key=len)
+        # 各组人数的上界
+        sizes = (len(exact_name), len(name_prefix), len(pinyin_prefix), len(candidates), len(candidates), len(name_chars[0]))
+        group_sets = {}
+
+        def members(group, bucket=None):
+            # 第 group 组的工具；给出 bucket 时只取其中属于 bucket 的
+            if group in group_sets:
+                return group_sets[group] if bucket is None else group_sets[group] & bucket
+            base = candidates if bucket is None else bucket
+            if group == 0:
+                result = exact_name & base
+            elif group == 1:
+                result = name_prefix & base
+                if exact_name:
+                    result -= exact_name
+            elif group == 2:
+                result = (pinyin_prefix & base) - name_prefix
+                if exact_name:
+                    result -= exact_name
+            elif group == 5:
+                result = self._narrow(name_chars[0] if bucket is None else bucket & name_chars[0], name_chars[1:]) - candidates
+            else:
+                inside = base & candidates
+                named = self._narrow(inside, name_chars)
+                if group == 4:
+                    result = inside - named
+                else:
+                    result = named - exact_name - name_prefix - pinyin_prefix
+            if bucket is None:
+                group_sets[group] = result
+            return result
+
+        ceilings = (100, 80, 70, 60, 40, 20)
+        # 队列元素 (-上界, 组, 位置)：位置为 -1 表示整组尚未展开，否则为启动次数 order 中的下标
+        queue = [(-(ceilings[group] + bonuses[order[0]]), group, -1) for group in groups if sizes[group] and order]
+        heapq.heapify(queue)
+        while queue:
+            ceiling, group, position = heapq.heappop(queue)
+            if limit is not None and len(heap) >= limit and -ceiling <= heap[0][0]:
+                break
+            if cancelled is not None and cancelled():
+                return None
+            if position < 0:
+                position = 0
+                # 前缀分组可以直接按启动次数细分；后几组人数适中时先整组算出，人数少的直接逐个打分
+                if sizes[group] <= SEARCH_DIRECT_LIMIT or 3 <= group and sizes[group] <= SEARCH_GROUP_LIMIT:
+                    doc_ids = members(group)
+                    if len(doc_ids) <= SEARCH_DIRECT_LIMIT:
+                        if score(doc_ids, group == 5) is None:
+                            return None
+                        continue
+            count = order[position]
+            if score(members(group, by_count[count]), group == 5, bonuses[count]) is None:
+                return None
+            if position + 1 < len(order):
+                heapq.heappush(queue, (-(ceilings[group] + bonuses[order[position + 1]]), group, position + 1))
+        if limit is None:
+            total = len(heap)
+        # 其余情况下匹配数不含模糊匹配；候选较多时按二元组候选估计，两个字以内是准确的
+        return [item[2] for item in sorted(heap, reverse=True)], total
+
+    @staticmethod
+    def _narrow(base, sets):
+        # base 与 sets（按大小升序）中每个集合的交集
+        result = base
+        for docs in sets:
+            if not result:
+                break
+            result = result & docs
+        return result
+
+    @staticmethod
+    def _intersect(index, grams):
+        # 只有一个字或二元组时直接返回倒排表本身，调用方不得修改返回的集合
+        postings = []
+        for gram in set(grams):
+            docs = index.get(gram)
+            if not docs:
+                return set()
+            postings.append(docs)
+        if len(postings) == 1:
+            return postings[0]
+        postings.sort(key=len)
+        result = postings[0] & postings[1]
+        for docs in postings[2:]:
+            if not result:
+                break
+            result &= docs
+        return result
+
+    @staticmethod
+    def _discard(index, grams, doc_id):
+        for gram in grams:
+            docs = index.get(gram)
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del index[gram]
+
+    @staticmethod
+    def _fields(tool):
+        return (tool.name.lower(), pinyin_initials(tool.name), (tool.category or '').lower(), (tool.description or '').lower())
+
+    @staticmethod
+    def _grams(fields):
+        grams = set()
+        for text in fields:
+            grams.update(text)
+            grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    @staticmethod
+    def _substring_quality(query, entry):
+        _, name, pinyin, category, description = entry
+        if name == query:
+            return 100
+        if name.startswith(query):
+            return 80
+        if pinyin.startswith(query):
+            return 70
+        if query in name:
+            return 60
+        if query in pinyin:
+            return 50
+        if query in category:
+            return 40
+        if query in description:
+            return 30
+        return None
+
+    @staticmethod
+    def _fuzzy_quality(query, entry):
+        span = subsequence_span(query, entry[1]) or subsequence_span(query, entry[2])
+        if not span:
+            return None
+        return 10 + 10 * len(query) / span
+
+    @staticmethod
+    def _launch_bonus(count):
+        return 8 * math.log1p(count)
+
+# 内存索引搜索结果的分页视图（接口同 SqliteToolPages）：load() 只选出第一页，滚动到底部时再用 fetch() 取后续
+# 迭代时返回完整的排序结果
+class SearchPages:
+    def __init__(self, index, text, page_size=SEARCH_PAGE_SIZE):
+        self.index = index
+        self.text = text
+        self.page_size = page_size
+        self.first = []
+        self._total = 0
+
+    def load(self, cancelled=None):
+        # 被取消时返回 None
+        result = self.index.search_page(self.text, self.page_size, cancelled)
+        if result is None:
+            return None
+        self.first, self._total = result
+        return self
+
+    def fetch(self, offset):
+        tools, total = self.index.search_page(self.text, offset + self.page_size)
+        self._total = max(self._total, total)
+        return tools[offset:]
+
+    def __len__(self):
+        return self._total
+
+    def __iter__(self):
+        return iter(self.index.search(self.text) or [])
+
+    def invalidate(self):
+        pass
+
+# 分类树节点：direct 为直接属于该分类的工具，count 为整棵子树的工具数
+class CategoryNode:
+    __slots__ = ('name', 'path', 'parent', 'children', 'direct', 'count')
+    def __init__(self, name, path, parent):
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.children = {}
+        self.direct = {}  # id(tool) -> tool
+        self.count = 0
+
+# 分类树（多级分类用/分隔）：增删工具时只更新路径上的节点，并返回这些节点供界面局部刷新
+class CategoryTrie:
+    def __init__(self):
+        self.root = CategoryNode('', '', None)
+        self._tool_nodes = {}  # id(tool) -> 所在节点，分类被修改后也能找到原节点
+
+    @staticmethod
+    def split(category):
+        return [part for part in (category or '').split('/') if part]
+
+    def build(self, tools):
+        self.root = CategoryNode('', '', None)
+        self._tool_nodes = {}
+        for tool in tools:
+            self.add(tool)
+
+    def build_counts(self, counts):
+        # 只有各分类的工具数时构建（SQLite 存储不加载工具），节点不保存工具
+        self.root = CategoryNode('', '', None)
+        self._tool_nodes = {}
+        for category, count in counts.items():
+            node = self.root
+            node.count += count
+            for part in self.split(category):
+                child = node.children.get(part)
+                if child is None:
+                    child = CategoryNode(part, f"{node.path}/{part}" if node.path else part, node)
+                    node.children[part] = child
+                node = child
+                node.count += count
+
+    def add(self, tool):
+        node = self.root
+        path = [node]
+        for part in self.split(tool.category):
+            child = node.children.get(part)
+            if child is None:
+                child = CategoryNode(part, f"{node.path}/{part}" if node.path else part, node)
+                node.children[part] = child
+            node = child
+            path.append(node)
+        node.direct[id(tool)] = tool
+        self._tool_nodes[id(tool)] = node
+        for n in path:
+            n.count += 1
+        return path
+
+    def remove(self, tool):
+        # 返回从根到原节点的路径，计数归零的空节点会被摘除（parent 置为 None）
+        node = self._tool_nodes.pop(id(tool), None)
+        if node is None:
+            return []
+        del node.direct[id(tool)]
+        path = []
+        cur = node
+        while cur is not None:
+            path.append(cur)
+            cur.count -= 1
+            cur = cur.parent
+        for n in path:
+            if n is not self.root and n.count == 0:
+                del n.parent.children[n.name]
+                n.parent = None
+        path.reverse()
+        return path
+
+    def find(self, path):
+        node = self.root
+        for part in self.split(path):
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def tools_under(self, path):
+        # 该分类及其所有子分类下的工具，只访问这棵子树
+        node = self.find(path)
+        if node is None:
+            return []
+        result = []
+        stack = [node]
+        while stack:
+            cur = stack.pop()
+            result.extend(cur.direct.values())
+            stack.extend(cur.children.values())
+        return result
+
+    def categories(self):
+        result = []
+        stack = [self.root]
+        while stack:
+            cur = stack.pop()
+            if cur.direct and cur.path:
+                result.append(cur.path)
+            stack.extend(cur.children.values())
+        return sorted(result)
+
+def _parse_launch_time(ts):
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def _log_add(a, b):
+    # log(e^a + e^b)，分数在对数空间累加，避免长期使用后溢出
+    if a == -math.inf:
+        return b
+    if b == -math.inf:
+        return a
+    return max(a, b) + math.log1p(math.exp(-abs(a - b)))
+
+# 常用度（frecency）排序：每次启动贡献 2^(-距今时长/半衰期)，越近越常用的工具越靠前
+# 所有工具的分数随时间按同一比例衰减，因此只存 log(Σ 2^((t_i - 基准)/半衰期))，
+# 排序与当前时刻无关，启动时只需调整一个工具在有序表中的位置，不必全量重排
+class FrecencyIndex:
+    _MISSING = (math.inf, math.inf)
+
+    def __init__(self, half_life_days=FRECENCY_HALF_LIFE_DAYS):
+        self.rate = math.log(2) / (half_life_days * 86400)
+        self._lock = threading.Lock()
+        self._order = []     # 升序的 (-对数分数, 序号, tool)，序号唯一，比较不会落到 tool 上
+        self._keys = {}      # id(tool) -> 在 _order 中的条目
+        self._ranked = None  # 完整排序结果的缓存，有变动时作废
+        self._seq = 0
+
+    def _weight(self, t):
+        return self.rate * (t - FRECENCY_EPOCH)
+
+    def initial_score(self, tool, history=()):
+        # 有启动日志的按每次的时间累计；只有总次数的部分，按最早一次（或最后启动时间）估算
+        score = -math.inf
+        times = ()
+        if history:
+            times = [t for t in map(_parse_launch_time, history) if t is not None]
+            for t in times:
+                score = _log_add(score, self._weight(t))
+        rest = tool.launch_count - len(times)
+        if rest > 0:
+            anchor = min(times) if times else _parse_launch_time(tool.last_launch) if tool.last_launch else None
+            score = _log_add(score, math.log(rest) + self._weight(anchor if anchor is not None else FRECENCY_EPOCH))
+        return score
+
+    def build(self, tools, history=None):
+        # history(tool) 返回该工具的启动时间列表
+        initial_score = self.initial_score
+        order = [(-initial_score(tool, history(tool) if history else ()), seq, tool) for seq, tool in enumerate(tools)]
+        order.sort()
+        with self._lock:
+            self._order = order
+            self._keys = {id(entry[2]): entry for entry in order}
+            self._ranked = None
+            self._seq = len(order)
+
+    def _place(self, tool, score):
+        old = self._keys.get(id(tool))
+        if old is not None:
+            del self._order[bisect.bisect_left(self._order, old)]
+            entry = (-score, old[1], tool)
+        else:
+            entry = (-score, self._seq, tool)
+            self._seq += 1
+        bisect.insort(self._order, entry)
+        self._keys[id(tool)] = entry
+        self._ranked = None
+
+    def add(self, tool, history=()):
+        with self._lock:
+            self._place(tool, self.initial_score(tool, history))
+
+    def reset(self, tool, history=()):
+        # 启动次数被外部改写后重新估算
+        self.add(tool, history)
+
+    def remove(self, tool):
+        with self._lock:
+            entry = self._keys.pop(id(tool), None)
+            if entry is not None:
+                del self._order[bisect.bisect_left(self._order, entry)]
+                self._ranked = None
+
+    def record(self, tool, ts):
+        t = _parse_launch_time(ts)
+        with self._lock:
+            entry = self._keys.get(id(tool))
+            score = -entry[0] if entry is not None else -math.inf
+            self._place(tool, _log_add(score, self._weight(t if t is not None else time.time())))
+
+    def score(self, tool, now=None):
+        # 当前时刻的分数，约等于“折算到今天的启动次数”
+        entry = self._keys.get(id(tool))
+        if entry is None or entry[0] == math.inf:
+            return 0.0
+        return math.exp(-entry[0] - self._weight(now if now is not None else time.time()))
+
+    def top_k(self, k=None):
+        # 有序表已排好，前 K 个直接切片；完整列表缓存到下次变动
+        with self._lock:
+            if k is not None:
+                return [entry[2] for entry in self._order[:k]]
+            if self._ranked is None:
+                self._ranked = [entry[2] for entry in self._order]
+            return self._ranked
+
+    def order(self, tools):
+        # 任意子集（分类、筛选结果）按常用度排序
+        keys, missing = self._keys, self._MISSING
+        with self._lock:
+            return sorted(tools, key=lambda t: keys.get(id(t), missing))
+
+_REQUIREMENT_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*)$')
+
+def requirements_satisfied(req_file):
+    # 在当前解释器内通过 importlib.metadata 检查依赖，无法判断的写法（-r、URL 等）返回 False 交给 pip
+    import importlib.metadata
+    try:
+        from packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:
+        Requirement = None
+    with open(req_file, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.readlines()
+    for raw in lines:
+        line = raw.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith(('-', '.', '/')) or '://' in line:
+            return False
+        if Requirement is not None:
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return False
+            if req.marker is not None and not req.marker.evaluate():
+                continue
+            if req.url:
+                return False
+            name, specifier = req.name, req.specifier
+        else:
+            match = _REQUIREMENT_RE.match(line)
+            if not match or ';' in line:
+                return False
+            name, specifier = match.group(1), match.group(3).strip()
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        if Requirement is not None:
+            if specifier and not specifier.contains(version, prereleases=True):
+                return False
+        elif specifier and specifier != f"=={version}":
+            # 没有 packaging 时只能判断精确版本
+            return False
+    return True
+
+# 依赖指纹缓存：requirements.txt 内容与解释器路径、版本一起哈希，指纹未变时不再调用 pip
+class DependencyCache:
+    def __init__(self, path=DEPENDENCY_CACHE_PATH, interpreter=sys.executable):
+        self.path = path
+        self.interpreter = interpreter
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def fingerprint(self, req_file):
+        with open(req_file, 'rb') as f:
+            digest = hashlib.sha256(f.read())
+        digest.update(b'\0' + self.interpreter.encode('utf-8') + b'\0' + sys.version.encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_satisfied(self, req_file):
+        fingerprint = self.fingerprint(req_file)
+        with self._lock:
+            if self._entries.get(req_file) == fingerprint:
+                return True
+        if requirements_satisfied(req_file):
+            self._store(req_file, fingerprint)
+            return True
+        return False
+
+    def mark_satisfied(self, req_file):
+        self._store(req_file, self.fingerprint(req_file))
+
+    def _store(self, req_file, fingerprint):
+        with self._lock:
+            self._entries[req_file] = fingerprint
+            try:
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # 缓存写失败只影响下次启动速度
+
+# Python 工具的独立虚拟环境池：按工具目录和解释器各建一个 venv，在后台预先创建
+# 依赖先构建成 wheel 放进共享缓存目录，各 venv 从缓存安装，切换工具不会互相覆盖
+class VenvPool:
+    READY_MARKER = '.quickstart-ready'
+    def __init__(self, root=VENV_ROOT, wheel_dir=WHEEL_CACHE_DIR, interpreters=None, offline=False, max_workers=VENV_WORKERS, health=None, on_status=None):
+        from concurrent.futures import ThreadPoolExecutor
+        self.root = root
+        self.wheel_dir = wheel_dir
+        self.offline = offline
+        self.interpreters = interpreters or {}  # 工具名 -> 解释器路径，未配置时使用当前解释器
+        self.health = health  # 路径健康检查，提供时存在性判断读其缓存
+        self._lock = threading.Lock()
+        self._pending = {}  # venv 目录 -> Future
+        self._ready = {}    # venv 目录 -> (requirements.txt 摘要, 就绪标记内容)，启动时不再读文件
+        self.on_status = on_status or (lambda text: None)  # 在后台线程调用
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='venv-pool')
+
+    def interpreter_for(self, tool):
+        return self.interpreters.get(tool.name) or sys.executable
+
+    def env_dir(self, tool):
+        tool_dir = os.path.dirname(os.path.abspath(tool.path))
+        digest = hashlib.sha1(f"{tool_dir}|{self.interpreter_for(tool)}".encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.root, f"{os.path.basename(tool_dir) or 'tool'}-{digest}")
+
+    @staticmethod
+    def env_python(env_dir):
+        if sys.platform.startswith('win'):
+            return os.path.join(env_dir, 'Scripts', 'python.exe')
+        return os.path.join(env_dir, 'bin', 'python')
+
+    def requirements_digest(self, tool):
+        req_file = os.path.join(os.path.dirname(tool.path), 'requirements.txt')
+        try:
+            with open(req_file, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return ''
+
+    def _exists(self, path, trust_missing=False):
+        if self.health is not None:
+            return self.health.exists(path, 'file', trust_missing=trust_missing)
+        return os.path.isfile(path)
+
+    def wants_env(self, tool):
+        # 只为带 requirements.txt 且脚本存在的 Python 工具建独立环境，其余工具仍用启动器的解释器
+        if tool.tool_type != "python" or not tool.path or not self._exists(tool.path):
+            return False
+        return self._exists(os.path.join(os.path.dirname(tool.path), 'requirements.txt'), trust_missing=True)
+
+    def python_for(self, tool):
+        # venv 已就绪且依赖与 requirements.txt 一致时返回其解释器，否则返回 None
+        # 摘要与标记读取一次后缓存，requirements.txt 的修改在 invalidate() 或重新准备后生效
+        if not self.wants_env(tool):
+            return None
+        env_dir = self.env_dir(tool)
+        state = self._ready.get(env_dir)
+        if state is None:
+            try:
+                with open(os.path.join(env_dir, self.READY_MARKER), 'r', encoding='utf-8') as f:
+                    ready = f.read().strip()
+            except OSError:
+                ready = ''
+            state = self._ready[env_dir] = (self.requirements_digest(tool), ready)
+        wanted, ready = state
+        # 旧版本会为没有 requirements.txt 的工具写入空标记，这类环境不使用
+        if not ready or ready != wanted:
+            return None
+        return self.env_python(env_dir)
+
+    def invalidate(self):
+        # 丢弃缓存的摘要与标记，下次启动时重新读取（定时全量路径检查后调用）
+        self._ready = {}
+
+    def prepare(self, tool):
+        # 在后台创建或更新 venv，同一目录只排队一次
+        if not self.wants_env(tool):
+            return None
+        env_dir = self.env_dir(tool)
+        self._ready.pop(env_dir, None)
+        with self._lock:
+            future = self._pending.get(env_dir)
+            if future is not None and not future.done():
+                return future
+            try:
+                future = self._executor.submit(self._build, tool.name, tool.path, env_dir, self.interpreter_for(tool))
+            except RuntimeError:
+                return None  # 已关闭
+            self._pending[env_dir] = future
+            return future
+
+    def prepare_all(self, tools):
+        for tool in tools:
+            if self.wants_env(tool) and self.python_for(tool) is None:
+                self.prepare(tool)
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _build(self, name, path, env_dir, interpreter):
+        flags = 0x08000000 if sys.platform.startswith('win') else 0  # CREATE_NO_WINDOW
+        def run(cmd):
+            return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                  encoding='utf-8', errors='replace', creationflags=flags)
+        try:
+            req_file = os.path.join(os.path.dirname(path), 'requirements.txt')
+            try:
+                with open(req_file, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                return False  # requirements.txt 已被删除，不再需要独立环境
+            python = self.env_python(env_dir)
+            if not os.path.exists(python):
+                self.on_status(f"[{name}] 正在创建独立环境...")
+                # 继承启动器环境中已安装的包，独立环境只覆盖 requirements.txt 中的依赖
+                result = run([interpreter, '-m', 'venv', '--system-site-packages', env_dir])
+                if result.returncode != 0:
+                    self.on_status(f"❌ [{name}] 创建独立环境失败: {result.stdout.strip()[-200:]}")
+                    return False
+            os.makedirs(self.wheel_dir, exist_ok=True)
+            self.on_status(f"[{name}] 正在为独立环境安装依赖...")
+            # 先构建到共享 wheel 缓存（离线时失败也无妨），再优先从缓存安装
+            index = ['--no-index'] if self.offline else []
+            if not self.offline:
+                run([python, '-m', 'pip', 'wheel', '-q', '--wheel-dir', self.wheel_dir, '--find-links', self.wheel_dir, '-r', req_file])
+            result = run([python, '-m', 'pip', 'install', '-q'] + index + ['--find-links', self.wheel_dir, '-r', req_file])
+            if result.returncode != 0:
+                self.on_status(f"❌ [{name}] 独立环境依赖安装失败: {result.stdout.strip()[-200:]}")
+                return False
+            with open(os.path.join(env_dir, self.READY_MARKER), 'w', encoding='utf-8') as f:
+                f.write(digest)
+            self._ready[env_dir] = (digest, digest)
+            self.on_status(f"✅ [{name}] 独立环境已就绪")
+            return True
+        except Exception as e:
+            self.on_status(f"❌ [{name}] 独立环境准备失败: {e}")
+            return False
+
+# Java 运行时注册表：启动时扫描一次已安装的 JDK/JRE，读取真实版本并缓存到 .java_runtimes.json
+# 按主版本号建立索引，Java 工具启动时直接查表；常用 jar 会预热 JVM 类数据共享（CDS）归档
+class JavaRuntimeRegistry:
+    JAVA_EXE = 'java.exe' if sys.platform.startswith('win') else 'java'
+    SEARCH_GLOBS = [
+        r'C:\Program Files\Java\*', r'C:\Program Files (x86)\Java\*',
+        r'C:\Program Files\Eclipse Adoptium\*', r'C:\Program Files\Zulu\*',
+        r'C:\Program Files\Microsoft\jdk-*', r'C:\Program Files\Amazon Corretto\*',
+        '/usr/lib/jvm/*', '/usr/java/*', '/opt/java/*', '/opt/jdk*',
+        '/Library/Java/JavaVirtualMachines/*/Contents/Home',
+    ]
+    def __init__(self, path=JAVA_RUNTIMES_PATH, cds_dir=CDS_CACHE_DIR):
+        self.path = path
+        self.cds_dir = cds_dir
+        self.settings = {}
+        self._lock = threading.Lock()
+        self._runtimes = {}   # java 可执行文件 -> {"version", "major", "mtime"}
+        self._by_major = {}   # 主版本号 -> java 可执行文件
+        self._warming = set()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            # 缓存只需核对可执行文件的修改时间即可复用
+            for java, info in cached.items():
+                if self._mtime(java) == info.get('mtime'):
+                    self._runtimes[java] = info
+        except (OSError, ValueError):
+            pass
+        self._index()
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def parse_major(version):
+        parts = version.split('.')
+        try:
+            major = int(parts[0].split('-')[0].split('+')[0])
+            return int(parts[1]) if major == 1 and len(parts) > 1 else major
+        except ValueError:
+            return None
+
+    def configure(self, settings):
+        with self._lock:
+            self.settings = settings
+        self._index()
+
+    def explicit_paths(self):
+        # 用户显式指定的运行时优先于扫描结果：JAVA8_HOME/JAVA11_HOME 与 config.json 中的 java8_path/java11_path
+        paths = {}
+        for major in (8, 11):
+            home = os.environ.get(f'JAVA{major}_HOME')
+            if home and os.path.isfile(os.path.join(home, 'bin', self.JAVA_EXE)):
+                paths[major] = os.path.join(home, 'bin', self.JAVA_EXE)
+            elif self.settings.get(f'java{major}_path') and os.path.isfile(self.settings[f'java{major}_path']):
+                paths[major] = self.settings[f'java{major}_path']
+        return paths
+
+    def candidates(self):
+        import glob
+        homes = []
+        for pattern in self.SEARCH_GLOBS:
+            homes.extend(glob.glob(pattern))
+        homes.extend(self.settings.get('java_homes', []))
+        if os.environ.get('JAVA_HOME'):
+            homes.append(os.environ['JAVA_HOME'])
+        found = [os.path.join(home, 'bin', self.JAVA_EXE) for home in homes]
+        found.extend(self.explicit_paths().values())
+        on_path = shutil.which('java')
+        if on_path:
+            found.append(os.path.realpath(on_path))
+        seen = set()
+        return [p for p in found if os.path.isfile(p) and not (os.path.normcase(p) in seen or seen.add(os.path.normcase(p)))]
+
+    def read_version(self, java):
+        # 优先读取 JDK 目录下的 release 文件，避免启动 JVM
+        release = os.path.join(os.path.dirname(os.path.dirname(java)), 'release')
+        try:
+            with open(release, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if line.startswith('JAVA_VERSION='):
+                        return line.split('=', 1)[1].strip().strip('"')
+        except OSError:
+            pass
+        flags = 0x08000000 if sys.platform.startswith('win') else 0  # CREATE_NO_WINDOW
+        try:
+            result = subprocess.run([java, '-version'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                    encoding='utf-8', errors='replace', timeout=10, creationflags=flags)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        match = re.search(r'version "([^"]+)"', result.stdout)
+        return match.group(1) if match else None
+
+    def scan(self):
+        # 启动时在后台执行一次，找不到所需版本时也会按需重新扫描
+        with metrics.span("java.scan"):
+            return self._scan()
+
+    def _scan(self):
+        runtimes = {}
+        for java in self.candidates():
+            mtime = self._mtime(java)
+            with self._lock:
+                cached = self._runtimes.get(java)
+            if cached is not None and cached.get('mtime') == mtime:
+                runtimes[java] = cached
+                continue
+            version = self.read_version(java)
+            major = self.parse_major(version) if version else None
+            if major is not None:
+                runtimes[java] = {"version": version, "major": major, "mtime": mtime}
+        with self._lock:
+            self._runtimes = runtimes
+        self._index()
+        try:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(runtimes, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+        return runtimes
+
+    def _index(self):
+        with self._lock:
+            by_major = {}
+            # 同一主版本取最新的更新版本
+            for java, info in sorted(self._runtimes.items(), key=lambda item: [int(n) for n in re.findall(r'\d+', item[1]['version'])]):
+                by_major[info['major']] = java
+            for major, java in self.explicit_paths().items():
+                by_major[major] = java
+            self._by_major = by_major
+
+    def resolve(self, major, rescan=True):
+        with metrics.span("java.resolve"):
+            java = self._by_major.get(major)
+            if java is None and rescan:
+                self.scan()
+                java = self._by_major.get(major)
+            return java
+
+    def runtimes(self):
+        with self._lock:
+            return dict(self._runtimes)
+
+    def cds_args(self, java, jar, launch_count):
+        # 为常用 jar 使用 AppCDS 归档：JDK 19+ 自动生成；13+ 首次退出时写出归档；11/12 先记录类列表再后台生成
+        # Java 8 的 AppCDS 属于商业特性，不做处理
+        if launch_count < CDS_MIN_LAUNCHES:
+            return []
+        info = self.runtimes().get(java)
+        major = info['major'] if info else None
+        if major is None or major < 11:
+            return []
+        digest = hashlib.sha1(f"{java}|{jar}|{self._mtime(jar)}|{info['version']}".encode('utf-8')).hexdigest()
+        os.makedirs(self.cds_dir, exist_ok=True)
+        archive = os.path.join(self.cds_dir, digest + '.jsa')
+        if major >= 19:
+            return ['-XX:+AutoCreateSharedArchive', f'-XX:SharedArchiveFile={archive}']
+        if os.path.exists(archive):
+            return [f'-XX:SharedArchiveFile={archive}', '-Xshare:auto']
+        if major >= 13:
+            return [f'-XX:ArchiveClassesAtExit={archive}']
+        classlist = os.path.join(self.cds_dir, digest + '.classlist')
+        if os.path.exists(classlist):
+            self.warm(java, jar, classlist, archive)
+            return []
+        return [f'-XX:DumpLoadedClassList={classlist}']
+
+    def warm(self, java, jar, classlist, archive):
+        # JDK 11/12：根据上次运行记录的类列表在后台生成归档，下次启动生效
+        with self._lock:
+            if archive in self._warming:
+                return
+            self._warming.add(archive)
+        def dump():
+            flags = 0x08000000 if sys.platform.startswith('win') else 0  # CREATE_NO_WINDOW
+            try:
+                subprocess.run([java, '-Xshare:dump', f'-XX:SharedClassListFile={classlist}', f'-XX:SharedArchiveFile={archive}', '-cp', jar],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=300, creationflags=flags)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            finally:
+                with self._lock:
+                    self._warming.discard(archive)
+        threading.Thread(target=dump, daemon=True).start()
+
+def check_path(kind, path):
+    # kind 为 'dir' 时要求是目录，否则只要求存在
+    return os.path.isdir(path) if kind == 'dir' else os.path.exists(path)
+
+# 启动引擎：按工具类型组装命令并启动，图形界面与命令行模式共用
+# 反馈通过回调传出：status(文本)、error(标题, 内容)、open_url(目标, 是否本地路径)、install(工具, 安装目标)
+class ToolLauncher:
+    def __init__(self, java_registry, dependency_cache, spawn, record=None, status=None, error=None,
+                 open_url=None, install=None, venv_pool=None, prepare_envs=True, health=None):
+        noop = lambda *args: None
+        self.java_registry = java_registry
+        self.dependency_cache = dependency_cache
+        self.spawn = spawn
+        self.record = record or noop
+        self.status = status or noop
+        self.error = error or noop
+        self.open_url = open_url or noop
+        self.install = install or noop
+        self.venv_pool = venv_pool
+        self.prepare_envs = prepare_envs  # 命令行模式进程很快退出，不在后台创建独立环境
+        self.health = health
+
+    def exists(self, path, kind='file', trust_missing=False):
+        # 有路径健康检查时读其缓存，否则直接检查
+        if self.health is not None:
+            return self.health.exists(path, kind, trust_missing=trust_missing)
+        return check_path(kind, path)
+
+    def launch(self, tool, dependency_check=True):
+        # 返回是否已启动（或已打开）；需要先安装依赖时返回 install 回调的结果
+        try:
+            # 启动前计数+1，更新时间，追加到启动日志
+            with metrics.span("launch.record"):
+                self.record(tool, datetime.now().isoformat(timespec='seconds'))
+            if tool.tool_type == "folder":
+                if self.exists(tool.path, 'dir'):
+                    self.open_url(tool.path, True)
+                    self.status(f"已打开文件夹: {tool.path}")
+                    return True
+                self.status(f"❌ 文件夹不存在: {tool.path}")
+                self.error("错误", f"文件夹不存在: {tool.path}")
+                return False
+            if tool.tool_type == "batch":
+                bat_path = os.path.abspath(tool.path)
+                cmd = ["cmd.exe", "/k", bat_path]
+                if tool.args:
+                    cmd.extend(tool.args.split())
+                tool_dir = os.path.dirname(bat_path) or None
+                CREATE_NEW_CONSOLE = 0x00000010
+                self.spawn(tool, cmd, cwd=tool_dir, creationflags=CREATE_NEW_CONSOLE)
+                self.status(f"已启动批处理: {tool.name}")
+                return True
+            if tool.tool_type in ["java8_gui", "java8"]:
+                java_path = self.java_registry.resolve(8)
+                if not java_path:
+                    self.status("❌ 未找到Java8环境")
+                    self.error("错误", "未找到Java8环境，请配置JAVA8_HOME或config.json中的java8_path")
+                    return False
+                if tool.tool_type == "java8_gui":
+                    cmd = [java_path] + self.java_registry.cds_args(java_path, tool.path, tool.launch_count) + ["-jar", tool.path]
+                else:
+                    cmd = [java_path]
+                if tool.args:
+                    cmd.extend(tool.args.split())
+                self.spawn(tool, cmd, cwd=os.path.dirname(tool.path))
+                return True
+            if tool.tool_type in ["java11_gui", "java11"]:
+                java_path = self.java_registry.resolve(11)
+                if not java_path:
+                    self.status("❌ 未找到Java11环境")
+                    self.error("错误", "未找到Java11环境，请配置JAVA11_HOME或config.json中的java11_path")
+                    return False
+                if tool.tool_type == "java11_gui":
+                    cmd = [java_path] + self.java_registry.cds_args(java_path, tool.path, tool.launch_count) + ["-jar", tool.path]
+                else:
+                    cmd = [java_path]
+                if tool.args:
+                    cmd.extend(tool.args.split())
+                self.spawn(tool, cmd, cwd=os.path.dirname(tool.path))
+                return True
+            if tool.tool_type == "python":
+                tool_dir = os.path.dirname(tool.path)
+                req_file = os.path.join(tool_dir, 'requirements.txt')
+                python = self.venv_pool.python_for(tool) if self.venv_pool is not None else None
+                if python is None and self.venv_pool is not None and self.venv_pool.wants_env(tool):
+                    # 需要独立环境但尚未就绪：依赖只装进独立环境，不往启动器自身的环境里安装
+                    future = self.venv_pool.prepare(tool) if self.prepare_envs else None
+                    if future is not None:
+                        # 后台创建完成后再启动，不占用启动线程
+                        self.status(f"[{tool.name}] 正在准备独立环境，完成后自动启动...")
+                        future.add_done_callback(lambda f: self._launch_python_when_ready(tool, tool_dir, f))
+                        return True
+                    # 命令行模式不创建环境：用当前解释器直接启动
+                    python = sys.executable
+                elif python is None:
+                    if dependency_check and self.exists(req_file, trust_missing=True) and not self.dependency_cache.is_satisfied(req_file):
+                        # 先安装依赖
+                        self.status(f"[{tool.name}] 正在从 requirements.txt 安装依赖...")
+                        return bool(self.install(tool, 'requirements'))
+                    python = sys.executable
+                # 依赖已满足，直接启动
+                self.spawn_python(tool, python, tool_dir)
+                return True
+            if tool.tool_type == "vbs":
+                vbs_path = os.path.abspath(tool.path)
+                cmd = ["wscript.exe", vbs_path]
+                if tool.args:
+                    cmd.extend(tool.args.split())
+                tool_dir = os.path.dirname(vbs_path) or None
+                self.spawn(tool, cmd, cwd=tool_dir)
+                self.status(f"已启动: {tool.name}")
+                return True
+            if tool.tool_type == "url":
+                self.open_url(tool.path, False)
+                self.status(f"已打开网址: {tool.path}")
+                return True
+            # 其它类型默认直接启动
+            exe_path = tool.path
+            if not self.exists(exe_path):
+                self.status(f"❌ 文件不存在: {exe_path}")
+                self.error("错误", f"文件不存在: {exe_path}")
+                return False
+            cmd = [exe_path]
+            if tool.args:
+                cmd.extend(tool.args.split())
+            self.spawn(tool, cmd, cwd=os.path.dirname(exe_path))
+            self.status(f"已启动: {tool.name}")
+            return True
+        except Exception as e:
+            self.status(f"❌ 启动失败: {e}")
+            self.error("启动失败", f"启动 {tool.name} 失败: {e}")
+            return False
+
+    def spawn_python(self, tool, python, tool_dir):
+        cmd = [python, tool.path]
+        if tool.args:
+            cmd.extend(tool.args.split())
+        self.spawn(tool, cmd, cwd=tool_dir)
+        self.status(f"已启动: {tool.name}")
+
+    def _launch_python_when_ready(self, tool, tool_dir, future):
+        # 在独立环境的后台线程中调用；创建失败时用当前解释器启动，同样不安装依赖
+        try:
+            python = self.venv_pool.python_for(tool) if not future.cancelled() and future.result() else None
+            self.spawn_python(tool, python or sys.executable, tool_dir)
+        except Exception as e:
+            self.status(f"❌ 启动失败: {e}")
+            self.error("启动失败", f"启动 {tool.name} 失败: {e}")
+
+# 工具目录查询：命令行模式与单实例服务共用，索引与分类树未提供时按需构建
+class CatalogQuery:
+    def __init__(self, tools, search_index=None, category_trie=None, frecency=None, history=None):
+        self.tools = tools
+        self._index = search_index
+        self._trie = category_trie
+        self._frecency = frecency
+        self._history = history
+
+    def find(self, name):
+        # 先按名称精确匹配（忽略大小写），否则取搜索结果
+        exact = [t for t in self.tools if t.name.casefold() == name.casefold()]
+        if exact:
+            return exact
+        return self.search(name)
+
+    def search(self, query, limit=None):
+        if self._index is None:
+            self._index = ToolSearchIndex()
+            self._index.build(self.tools)
+        return self._index.search(query, limit=limit or None) or []
+
+    def under_category(self, category):
+        if self._frecency is None:
+            self._frecency = FrecencyIndex()
+            self._frecency.build(self.tools, self._history)
+        if not category:
+            return self._frecency.top_k()
+        if self._trie is None:
+            self._trie = CategoryTrie()
+            self._trie.build(self.tools)
+        return self._frecency.order(self._trie.tools_under(category.strip('/')))
+
+# 基于 tools.db 的目录查询：接口与 CatalogQuery 相同，筛选与分页在 SQL 中完成，只构造结果中的工具
+# 顺序按启动次数；搜索用 FTS5/LIKE，不含拼音首字母与模糊匹配
+class SqliteCatalogQuery:
+    def __init__(self, store):
+        self.store = store
+
+    def find(self, name):
+        exact = self.store.query(name=name)
+        if exact:
+            return exact
+        return self.search(name)
+
+    def search(self, query, limit=None):
+        return self.store.query(text=query, limit=limit)
+
+    def under_category(self, category):
+        return self.store.query(category=category.strip('/'))
+
+# 命令行模式：不创建 QApplication 与任何控件，直接读取工具目录并复用同一个启动引擎
+class HeadlessCatalog:
+    def __init__(self):
+        self.tool_store = None
+        self.config_store = None
+        self.launch_journal = None
+        if os.path.exists(TOOLS_DB_PATH):
+            # 不整体加载工具目录，查询直接走 SQL
+            self.tool_store = SqliteToolStore()
+            self.settings = self.tool_store.settings()
+            self.query = SqliteCatalogQuery(self.tool_store)
+        else:
+            self.config_store = ConfigStore()
+            self.launch_journal = LaunchJournal()
+            data = self.config_store.load() if os.path.exists(CONFIG_PATH) else {}
+            self.tools = [Tool.from_dict(item) for item in data.get('tools', [])]
+            self.settings = self.config_store.extra
+            # 启动日志的压缩留给图形界面，命令行只追加
+            self.launch_journal.load(self.tools, data.get('journal_seq', 0))
+            self.query = CatalogQuery(self.tools, history=self.launch_journal.history)
+
+    def record_launch(self, tool, ts):
+        if self.tool_store is not None:
+            self.tool_store.record_launch(tool, ts)
+        else:
+            self.launch_journal.record(tool, ts)
+
+    def launch(self, tool):
+        # 返回 (是否成功, 消息列表)
+        messages = []
+        def install(tool, target):
+            # 命令行模式同步安装依赖后再启动
+            req_file = os.path.join(os.path.dirname(tool.path), 'requirements.txt')
+            if subprocess.call([sys.executable, '-m', 'pip', 'install', '-r', req_file], stdout=sys.stderr) != 0:
+                messages.append(f"❌ 依赖安装失败: {req_file}")
+                return False
+            dependency_cache.mark_satisfied(req_file)
+            return launcher.launch(tool, dependency_check=False)
+        java_registry = JavaRuntimeRegistry()
+        java_registry.configure(self.settings)
+        dependency_cache = DependencyCache()
+        venv_pool = VenvPool(interpreters=self.settings.get('python_interpreters')) if self.settings.get('isolated_venvs', False) else None
+        launcher = ToolLauncher(java_registry, dependency_cache, _cli_spawn, record=self.record_launch,
+                                # 失败时 status 与 error 会各报一次，只保留 error 的详细信息
+                                status=lambda text: text.startswith('❌') or messages.append(text),
+                                error=lambda title, message: messages.append(f"❌ {message}"),
+                                open_url=_cli_open, install=install, venv_pool=venv_pool, prepare_envs=False)
+        return launcher.launch(tool), messages
+
+    def close(self):
+        if self.tool_store is not None:
+            self.tool_store.close()
+        if self.launch_journal is not None:
+            self.launch_journal.close()
+        if self.config_store is not None:
+            self.config_store.close()
+
+def _cli_spawn(tool, cmd, **kwargs):
+    # 命令行进程退出后工具继续运行
+    if os.name == 'posix':
+        kwargs.setdefault('start_new_session', True)
+    return subprocess.Popen(cmd, **kwargs)
+
+def _cli_open(target, local):
+    if not local:
+        import webbrowser
+        webbrowser.open(target)
+    elif sys.platform.startswith('win'):
+        os.startfile(target)
+    else:
+        subprocess.Popen(['open' if sys.platform.startswith('darwin') else 'xdg-open', target])
+
+def _format_tools(tools, as_json):
+    if as_json:
+        return json.dumps([t.to_dict() for t in tools], ensure_ascii=False) + "\n"
+    return "".join(f"{tool.name}\t{tool.tool_type}\t{tool.category}\t{tool.path}\n" for tool in tools)
+
+CLI_COMMANDS = ('launch', 'search', 'list', 'show', 'focus')
+
+def build_cli_parser():
+    import argparse
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--json', action='store_true', help='以 JSON 输出，便于脚本处理')
+    common.add_argument('--no-daemon', action='store_true', help='不转发给已运行的实例，直接在本进程执行')
+    parser = argparse.ArgumentParser(prog='main.py', description='quickstart 命令行模式')
+    commands = parser.add_subparsers(dest='command', required=True)
+    launch_parser = commands.add_parser('launch', parents=[common], help='按名称启动工具')
+    launch_parser.add_argument('name')
+    search_parser = commands.add_parser('search', parents=[common], help='搜索工具（支持拼音首字母与模糊匹配）')
+    search_parser.add_argument('query')
+    search_parser.add_argument('--limit', type=int, default=20)
+    list_parser = commands.add_parser('list', parents=[common], help='列出工具')
+    list_parser.add_argument('--category', default='', help='只列出该分类及其子分类下的工具')
+    commands.add_parser('show', parents=[common], help='显示已运行的启动器窗口')
+    focus_parser = commands.add_parser('focus', parents=[common], help='显示窗口并聚焦搜索框')
+    focus_parser.add_argument('query', nargs='?', default='')
+    return parser
+
+def execute_cli(args, query, launch):
+    # 对任意工具目录执行 launch/search/list，返回 (返回码, 标准输出, 标准错误)
+    # 返回码：0 成功，1 未找到或启动失败，2 名称有歧义
+    if args.command == 'search':
+        return 0, _format_tools(query.search(args.query, args.limit), args.json), ""
+    if args.command == 'list':
+        return 0, _format_tools(query.under_category(args.category), args.json), ""
+    matches = query.find(args.name)
+    if len(matches) != 1:
+        message = f"未找到工具: {args.name}" if not matches else f"名称有歧义，匹配到 {len(matches)} 个工具"
+        code = 1 if not matches else 2
+        if args.json:
+            return code, json.dumps({"ok": False, "error": message, "candidates": [t.name for t in matches[:20]]}, ensure_ascii=False) + "\n", ""
+        return code, "", message + "\n" + "".join(f"  {tool.name}\n" for tool in matches[:20])
+    tool = matches[0]
+    ok, messages = launch(tool)
+    if args.json:
+        return 0 if ok else 1, json.dumps({"ok": ok, "tool": tool.name, "messages": messages}, ensure_ascii=False) + "\n", ""
+    text = "".join(message + "\n" for message in messages)
+    return (0, text, "") if ok else (1, "", text)
+
+def run_cli(argv):
+    args = build_cli_parser().parse_args(argv)
+    if not args.no_daemon:
+        # 已有实例运行时转发给它，直接使用其内存中的工具目录
+        response = send_to_instance(argv)
+        if response is not None:
+            sys.stdout.write(response.get('stdout', ''))
+            sys.stderr.write(response.get('stderr', ''))
+            return response.get('code', 0)
+    if args.command in ('show', 'focus'):
+        return None  # 没有运行中的实例，由调用方启动图形界面
+    catalog = HeadlessCatalog()
+    try:
+        code, out, err = execute_cli(args, catalog.query, catalog.launch)
+        sys.stdout.write(out)
+        sys.stderr.write(err)
+        return code
+    finally:
+        catalog.close()
+
+# 单实例：图形界面监听本地套接字（Windows 为命名管道），再次运行 main.py 时把命令转发给它
+# 协议为一行 JSON 请求 {"argv": [...]}，一行 JSON 响应 {"code", "stdout", "stderr"}
+def instance_server_name():
+    # 名称包含用户名，多用户主机上各用户的实例互不干扰
+    # POSIX 下返回套接字文件的完整路径（优先放在仅属于当前用户的 XDG_RUNTIME_DIR），客户端不经 Qt 直接连接
+    import getpass
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ''
+    digest = hashlib.sha1(f"{user}|{os.path.abspath(os.path.dirname(CONFIG_PATH))}".encode('utf-8')).hexdigest()[:10]
+    name = f"quickstart-{digest}"
+    if os.name != 'posix':
+        return name
+    import tempfile
+    return os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(), name)
+
+def send_to_instance(argv, timeout_ms=IPC_TIMEOUT_MS):
+    # 没有运行中的实例或通信失败时返回 None
+    request = (json.dumps({"argv": list(argv)}, ensure_ascii=False) + "\n").encode('utf-8')
+    if os.name != 'posix':
+        return _send_to_pipe(request, timeout_ms)
+    import socket
+    data = b''
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout_ms / 1000)
+            conn.connect(instance_server_name())
+            conn.sendall(request)
+            conn.settimeout(timeout_ms * 10 / 1000)
+            while not data.endswith(b'\n'):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+    except OSError:
+        if not data:
+            return None
+    try:
+        return json.loads(data.decode('utf-8'))
+    except ValueError:
+        return None
+
+def _send_to_pipe(request, timeout_ms):
+    # Windows 命名管道仍借助 QtNetwork（只导入 QtCore/QtNetwork，不导入界面模块）
+    from PyQt5.QtNetwork import QLocalSocket
+    socket = QLocalSocket()
+    socket.connectToServer(instance_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return None
+    socket.write(request)
+    socket.waitForBytesWritten(timeout_ms)
+    data = b''
+    while not data.endswith(b'\n'):
+        if not socket.waitForReadyRead(timeout_ms * 10):
+            break
+        data += bytes(socket.readAll())
+    socket.disconnectFromServer()
+    try:
+        return json.loads(data.decode('utf-8'))
+    except ValueError:
+        return None
+
+def run_cli_entry(argv):
+    # main.py 在导入图形界面之前调用：处理数据库迁移与命令行模式，完成后直接退出进程
+    # 不是命令行调用（或没有运行中实例的 show/focus）时返回，由调用方启动图形界面
+    if '--import-db' in argv:
+        count = SqliteToolStore(TOOLS_DB_PATH).import_json(CONFIG_PATH)
+        print(f"已从 {CONFIG_PATH} 导入 {count} 个工具到 {TOOLS_DB_PATH}")
+        sys.exit(0)
+    if '--export-db' in argv:
+        count = SqliteToolStore(TOOLS_DB_PATH).export_json(CONFIG_PATH)
+        print(f"已从 {TOOLS_DB_PATH} 导出 {count} 个工具到 {CONFIG_PATH}")
+        sys.exit(0)
+    if argv and argv[0] in CLI_COMMANDS:
+        code = run_cli(argv)
+        if code is not None:
+            sys.exit(code)
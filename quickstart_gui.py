@@ -0,0 +1,2759 @@
+# quickstart 图形界面：主窗口、工具卡片、进程监管、依赖安装与单实例服务，由 main.py 启动
+import time
+_STARTUP_T0 = time.perf_counter()  # 供 --profile-startup 统计模块导入耗时（经 main.py 启动时以其记录的时刻为准）
+import sys
+import os
+import json
+import subprocess
+import threading
+import hashlib
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from quickstart_core import (
+    CONFIG_PATH, TOOLS_DB_PATH, WHEEL_CACHE_DIR, SQLITE_PAGE_SIZE, CLI_COMMANDS, _REQUIREMENT_RE,
+    Tool, tool_key, metrics, ConfigStore, LaunchJournal, SqliteToolStore, ToolSearchIndex, CategoryTrie, FrecencyIndex,
+    DependencyCache, VenvPool, JavaRuntimeRegistry, ToolLauncher, CatalogQuery, SqliteCatalogQuery, check_path,
+    build_cli_parser, execute_cli, instance_server_name, send_to_instance
+)
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStatusBar, QProgressBar, QMessageBox, QLineEdit, QSizePolicy, QSpacerItem, QFileDialog, QComboBox, QTextEdit, QDialogButtonBox, QDialog, QTreeWidget, QTreeWidgetItem,
+    QListView, QStyledItemDelegate, QStyle, QMenu, QAction, QAbstractItemView, QPlainTextEdit, QDockWidget,
+    QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PyQt5.QtCore import Qt, QThread, QTimer, QUrl, pyqtSignal, QObject, QAbstractListModel, QModelIndex, QRect, QRectF, QPointF, QSize, QEvent
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QPainter, QColor, QPen, QFont, QFontMetrics, QLinearGradient, QCursor
+from PyQt5.QtGui import QDesktopServices
+
+INSTALL_WORKERS = 3
+SUPERVISOR_INTERVAL_MS = 2000
+KILL_GRACE_MS = 3000
+TOOL_LOG_DIR = os.path.join(os.path.dirname(CONFIG_PATH), 'logs')
+TOOL_LOG_MAX_BYTES = 10 * 1024 * 1024
+TOOL_LOG_BACKUPS = 3
+LOG_TAIL_BYTES = 64 * 1024
+IPC_MAX_REQUEST_BYTES = 64 * 1024
+CONFIG_RELOAD_DELAY_MS = 300
+INSTALL_LOG_LINES = 5000
+SEARCH_DEBOUNCE_MS = 120
+LAUNCH_WORKERS = 4
+LAUNCH_DEDUP_SECONDS = 1.0
+ICON_CACHE_DIR = os.path.join(os.path.dirname(CONFIG_PATH), '.icon_cache')
+ICON_CACHE_SIZE = 512
+ICON_SIZE = 40
+ICON_RETRY_SECONDS = 60  # 找不到或无法解码的图标，过了这么久再重新读取
+FIRST_PAGE_SIZE = 50
+HEALTH_SCAN_INTERVAL_MS = 10 * 60 * 1000
+HEALTH_TTL_SECONDS = 2 * HEALTH_SCAN_INTERVAL_MS // 1000  # 大于重查间隔，定时全量检查总在缓存过期前刷新
+HEALTH_WORKERS = 16
+METRICS_EXPORT_INTERVAL_MS = 15000
+ZYGOTE_PRELOAD_TOOLS = 8
+ZYGOTE_START_TIMEOUT = 30
+ZYGOTE_REQUEST_TIMEOUT = 2.0
+# 导入后不能安全 fork 的模块（图形界面库等），导入了它们的工具始终普通启动
+ZYGOTE_UNSAFE_MODULES = frozenset({'tkinter', 'Tkinter', 'PyQt4', 'PyQt5', 'PyQt6', 'PySide', 'PySide2', 'PySide6', 'wx', 'gi', 'kivy', 'pygame', 'turtle'})
+
+# 可选依赖：psutil 用于在非 Linux 平台采样子进程的 CPU/内存，Linux 直接读取 /proc
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 工具列表模型：只保存工具引用，由视图按需绘制可见行
+# 提供 fetch_more 时按页加载（SQLite 存储），视图滚动到底部时再读取下一页
+class ToolListModel(QAbstractListModel):
+    ToolRole = Qt.UserRole + 1
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tools = []
+        self._rows = {}
+        self._fetch_more = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tools)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._tools):
+            return None
+        tool = self._tools[index.row()]
+        if role == Qt.DisplayRole:
+            return tool.name
+        if role == Qt.ToolTipRole:
+            return tool.description or tool.path
+        if role == self.ToolRole:
+            return tool
+        return None
+
+    def set_tools(self, tools, fetch_more=None):
+        # fetch_more(已加载行数) 返回下一页工具，返回空列表表示没有更多
+        self.beginResetModel()
+        self._tools = list(tools)
+        self._rows = {id(t): i for i, t in enumerate(self._tools)}
+        self._fetch_more = fetch_more
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_more is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetch_more is None:
+            return
+        tools = self._fetch_more(len(self._tools))
+        if not tools:
+            self._fetch_more = None
+            return
+        first = len(self._tools)
+        self.beginInsertRows(QModelIndex(), first, first + len(tools) - 1)
+        self._tools.extend(tools)
+        self._rows.update((id(t), first + i) for i, t in enumerate(tools))
+        self.endInsertRows()
+
+    def refresh_tool(self, tool):
+        # 单个工具数据变化（如启动次数）时只刷新对应行
+        row = self._rows.get(id(tool))
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def remove_tool(self, tool):
+        row = self._rows.get(id(tool))
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tools[row]
+        self._rows = {id(t): i for i, t in enumerate(self._tools)}
+        self.endRemoveRows()
+
+# 图标异步加载：后台线程解码缩放，内存 LRU 缓存 + 磁盘缩略图缓存
+class IconLoader(QObject):
+    iconLoaded = pyqtSignal(str)
+    _imageReady = pyqtSignal(str, object, object)
+    def __init__(self, cache_dir=ICON_CACHE_DIR, capacity=ICON_CACHE_SIZE, max_workers=4, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.capacity = capacity
+        self._keys = {}                 # path -> (path, mtime_ns)
+        self._missing = {}              # 文件不存在或无法解码的 path -> 失败时间（time.monotonic）
+        self._pixmaps = OrderedDict()   # (path, mtime_ns) -> QPixmap
+        self._pending = set()
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='icon-loader')
+        self._imageReady.connect(self._on_image_ready)
+
+    def pixmap(self, path):
+        # 尚未加载完成时返回 None，调用方先显示占位图标
+        if not path:
+            return None
+        failed = self._missing.get(path)
+        if failed is not None and time.monotonic() - failed < ICON_RETRY_SECONDS:
+            return None
+        if path in self._keys:
+            key = self._keys[path]
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(key)
+                return pixmap
+        if path not in self._pending:
+            self._pending.add(path)
+            self._executor.submit(self._load, path)
+        return None
+
+    def forget(self, path):
+        self._missing.pop(path, None)
+        key = self._keys.pop(path, None)
+        if key is not None:
+            self._pixmaps.pop(key, None)
+
+    def retry(self, path):
+        # 图标文件重新出现时调用，丢弃"读取失败"的记录，下次绘制时重新读取
+        self._missing.pop(path, None)
+
+    def stop(self):
+        self._stopped = True
+        self._executor.shutdown(wait=False)
+
+    def thumbnail_path(self, key):
+        digest = hashlib.sha1(f"{key[0]}|{key[1]}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.png')
+
+    def _load(self, path):
+        # 在线程池中执行，只使用 QImage（QPixmap 只能在界面线程创建）
+        if self._stopped:
+            return
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            self._imageReady.emit(path, None, None)
+            return
+        thumb_path = self.thumbnail_path(key)
+        image = QImage(thumb_path) if os.path.exists(thumb_path) else QImage()
+        if image.isNull():
+            image = QImage(path)
+            if not image.isNull():
+                image = image.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    tmp_path = thumb_path + '.tmp'
+                    if image.save(tmp_path, 'PNG'):
+                        os.replace(tmp_path, thumb_path)
+                except OSError:
+                    pass
+        if self._stopped:
+            return
+        self._imageReady.emit(path, key, None if image.isNull() else image)
+
+    def _on_image_ready(self, path, key, image):
+        self._pending.discard(path)
+        if key is None or image is None:
+            self._missing[path] = time.monotonic()
+            old = self._keys.pop(path, None)
+            if old is not None:
+                self._pixmaps.pop(old, None)
+        else:
+            self._missing.pop(path, None)
+            self._keys[path] = key
+            self._pixmaps[key] = QPixmap.fromImage(image)
+            self._pixmaps.move_to_end(key)
+            while len(self._pixmaps) > self.capacity:
+                self._pixmaps.popitem(last=False)
+        self.iconLoaded.emit(path)
+
+# 工具卡片绘制代理：按需绘制卡片，不再为每个工具创建控件
+class ToolCardDelegate(QStyledItemDelegate):
+    launchRequested = pyqtSignal(object)
+    stopRequested = pyqtSignal(object)
+    CARD_HEIGHT = 90
+    def __init__(self, icon_loader, parent=None, supervisor=None, health=None):
+        super().__init__(parent)
+        self.icon_loader = icon_loader
+        self.supervisor = supervisor
+        self.health = health
+        self._pressed_row = -1
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(6, 3, -6, -3)
+
+    def button_rect(self, option):
+        card = self.card_rect(option)
+        return QRect(card.right() - 15 - 90, card.center().y() - 18, 90, 36)
+
+    def stop_rect(self, option):
+        btn = self.button_rect(option)
+        return QRect(btn.left() - 10 - 36, btn.top(), 36, 36)
+
+    def running_status(self, tool):
+        return self.supervisor.status(tool) if self.supervisor is not None else None
+
+    def paint(self, painter, option, index):
+        tool = index.data(ToolListModel.ToolRole)
+        if tool is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = self.card_rect(option)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        selected = bool(option.state & QStyle.State_Selected)
+        health = self.health.status(tool) if self.health is not None else None
+        broken = health is not None and not health[0]
+        # 卡片背景（路径失效的工具红色描边）
+        painter.setPen(QPen(QColor("#667eea" if selected else "#fa5252" if broken else "#43e97b" if hovered else "#e9ecef"), 1))
+        painter.setBrush(QColor("#eef1ff" if selected else "#f8f9fa" if hovered else "white"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+        # 图标
+        icon_rect = QRect(card.left() + 15, card.center().y() - 24, 48, 48)
+        # 已知缺失的图标不再交给后台加载
+        pixmap = self.icon_loader.pixmap(tool.icon_path) if health is None or health[1] else None
+        if pixmap is not None:
+            x = icon_rect.left() + (icon_rect.width() - pixmap.width()) // 2
+            y = icon_rect.top() + (icon_rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            font = QFont(option.font)
+            font.setPixelSize(24)
+            painter.setFont(font)
+            painter.setPen(QColor("#212529"))
+            painter.drawText(icon_rect, Qt.AlignCenter, "🚀")
+        btn = self.button_rect(option)
+        running = self.running_status(tool)
+        text_left = icon_rect.right() + 15
+        text_width = max(0, (self.stop_rect(option) if running else btn).left() - 15 - text_left)
+        # 名称
+        font = QFont(option.font)
+        font.setPixelSize(16)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#212529"))
+        name_rect = QRect(text_left, card.top() + 8, text_width, 24)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, QFontMetrics(font).elidedText(tool.name, Qt.ElideRight, text_width))
+        # 类型与启动次数
+        font = QFont(option.font)
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.setPen(QColor("#6c757d"))
+        desc_rect = QRect(text_left, card.top() + 34, text_width, 18)
+        desc = f"类型: {tool.tool_type} | 启动: {tool.launch_count} 次"
+        painter.drawText(desc_rect, Qt.AlignLeft | Qt.AlignVCenter, desc)
+        if health is not None and not running and not all(health):
+            warning = "⚠ 路径不存在" if broken else "⚠ 图标缺失"
+            painter.setPen(QColor("#e03131" if broken else "#e8590c"))
+            warning_rect = desc_rect.adjusted(QFontMetrics(font).horizontalAdvance(desc) + 12, 0, 0, 0)
+            painter.drawText(warning_rect, Qt.AlignLeft | Qt.AlignVCenter, warning)
+        if running:
+            # 运行状态：进程数、CPU、内存
+            count, cpu, rss = running
+            status = f"● 运行中{f' ×{count}' if count > 1 else ''} · CPU {cpu:.0f}% · {rss / 1048576:.0f} MB"
+            painter.setPen(QColor("#e8590c" if cpu >= 90 else "#2f9e44"))
+            status_rect = desc_rect.adjusted(QFontMetrics(font).horizontalAdvance(desc) + 12, 0, 0, 0)
+            painter.drawText(status_rect, Qt.AlignLeft | Qt.AlignVCenter, QFontMetrics(font).elidedText(status, Qt.ElideRight, status_rect.width()))
+        # 分类标签
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        font.setBold(True)
+        painter.setFont(font)
+        fm = QFontMetrics(font)
+        x = text_left
+        for tag in tool.tags:
+            tag_width = fm.horizontalAdvance(tag) + 16
+            if x + tag_width > text_left + text_width:
+                break
+            tag_rect = QRect(x, card.top() + 56, tag_width, 20)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#e3f2fd"))
+            painter.drawRoundedRect(QRectF(tag_rect), 8, 8)
+            painter.setPen(QColor("#1976d2"))
+            painter.drawText(tag_rect, Qt.AlignCenter, tag)
+            x += tag_width + 6
+        # 启动按钮
+        btn_hovered = False
+        if hovered and option.widget is not None:
+            btn_hovered = btn.contains(option.widget.viewport().mapFromGlobal(QCursor.pos()))
+        gradient = QLinearGradient(QPointF(btn.topLeft()), QPointF(btn.bottomRight()))
+        if self._pressed_row == index.row():
+            gradient.setColorAt(0, QColor("#5a67d8"))
+            gradient.setColorAt(1, QColor("#5a67d8"))
+        elif btn_hovered:
+            gradient.setColorAt(0, QColor("#764ba2"))
+            gradient.setColorAt(1, QColor("#667eea"))
+        else:
+            gradient.setColorAt(0, QColor("#667eea"))
+            gradient.setColorAt(1, QColor("#764ba2"))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawRoundedRect(QRectF(btn), 18, 18)
+        font = QFont(option.font)
+        font.setPixelSize(13)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(btn, Qt.AlignCenter, "🚀 启动")
+        # 结束进程按钮（仅运行中显示）
+        if running:
+            stop = self.stop_rect(option)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#fa5252" if self._pressed_row == -index.row() - 2 else "#ff6b6b"))
+            painter.drawEllipse(QRectF(stop))
+            painter.setPen(QColor("white"))
+            painter.drawText(stop, Qt.AlignCenter, "■")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # 在代理内处理启动按钮的点击
+        # 结束按钮按下时 _pressed_row 记为 -row-2，与启动按钮区分
+        tool = index.data(ToolListModel.ToolRole)
+        on_stop = tool is not None and self.running_status(tool) is not None and self.stop_rect(option).contains(event.pos())
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            if self.button_rect(option).contains(event.pos()):
+                self._pressed_row = index.row()
+                return True
+            if on_stop:
+                self._pressed_row = -index.row() - 2
+                return True
+        elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            pressed_row, self._pressed_row = self._pressed_row, -1
+            if pressed_row == index.row() and self.button_rect(option).contains(event.pos()):
+                if tool is not None:
+                    self.launchRequested.emit(tool)
+                return True
+            if pressed_row == -index.row() - 2 and on_stop:
+                self.stopRequested.emit(tool)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+# pip 输出解析：把 Collecting / Downloading / Successfully installed 等行转换成逐包进度
+# 每个包计两步：取得（下载、缓存命中或已满足）与安装完成
+class PipProgressParser:
+    FETCH_PREFIXES = ('Downloading ', 'Using cached ', 'Processing ', 'File was already downloaded ', 'Saved ', 'Obtaining ')
+    def __init__(self, expected=0):
+        self.expected = expected
+        self.seen = []
+        self.fetched = set()
+        self.installed = set()
+        self._current = None
+
+    @staticmethod
+    def _name(spec):
+        match = _REQUIREMENT_RE.match(spec.strip())
+        return match.group(1).lower().replace('_', '-') if match else spec.strip().lower()
+
+    def total(self):
+        return 2 * max(self.expected, len(self.seen), 1)
+
+    def done(self):
+        return min(len(self.fetched) + len(self.installed), self.total())
+
+    def feed(self, line):
+        # 返回 (已完成步数, 总步数, 包名)；与进度无关的行返回 None
+        line = line.strip()
+        package = None
+        if line.startswith('Collecting '):
+            package = self._name(line[len('Collecting '):].split(' ', 1)[0])
+            if package not in self.seen:
+                self.seen.append(package)
+            self._current = package
+        elif line.startswith('Requirement already satisfied: '):
+            package = self._name(line[len('Requirement already satisfied: '):].split(' ', 1)[0])
+            if package not in self.seen:
+                self.seen.append(package)
+            self.fetched.add(package)
+            self.installed.add(package)
+        elif line.startswith(self.FETCH_PREFIXES) and self._current is not None:
+            package = self._current
+            self.fetched.add(package)
+        elif line.startswith('Installing collected packages: '):
+            names = [self._name(n) for n in line[len('Installing collected packages: '):].split(',') if n.strip()]
+            for name in names:
+                if name not in self.seen:
+                    self.seen.append(name)
+                self.fetched.add(name)
+            package = names[-1] if names else None
+        elif line.startswith('Successfully installed '):
+            for item in line[len('Successfully installed '):].split():
+                self.installed.add(self._name(item.rpartition('-')[0] or item))
+            self.installed.update(self.seen)
+            package = ''
+        else:
+            return None
+        return self.done(), self.total(), package
+
+# 依赖安装：多个工具的依赖在线程池中并行处理
+# 先把依赖解析下载到本地 wheelhouse（可并行），再以 --no-index 从 wheelhouse 安装；
+# 同一解释器的安装互斥，避免并发写同一个 site-packages。离线（或下载失败）时直接使用 wheelhouse
+class DependencyInstaller(QObject):
+    installationStarted = pyqtSignal(str)
+    installationProgress = pyqtSignal(str, str)
+    installationFinished = pyqtSignal(str, bool, str)
+    packageProgress = pyqtSignal(str, int, int, str)
+    logLine = pyqtSignal(str, str)
+    def __init__(self, dependency_cache=None, wheelhouse=WHEEL_CACHE_DIR, offline=False, max_workers=INSTALL_WORKERS, parent=None):
+        super().__init__(parent)
+        self.dependency_cache = dependency_cache
+        self.wheelhouse = wheelhouse
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._env_locks = {}   # 解释器 -> Lock
+        self._pending = {}     # (解释器, 安装目标) -> 等待结果的工具名列表
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='installer')
+
+    def install(self, tool, target, interpreter=None):
+        # 可在任意线程调用；相同的安装任务只执行一次，结束时通知所有等待的工具
+        interpreter = interpreter or sys.executable
+        if target == 'requirements':
+            req_file = os.path.join(os.path.dirname(tool.path), 'requirements.txt')
+            key = (interpreter, os.path.normcase(os.path.abspath(req_file)))
+        else:
+            req_file = None
+            key = (interpreter, target)
+        with self._lock:
+            waiters = self._pending.get(key)
+            if waiters is not None:
+                if tool.name not in waiters:
+                    waiters.append(tool.name)
+                return False
+            self._pending[key] = [tool.name]
+            env_lock = self._env_locks.setdefault(interpreter, threading.Lock())
+        try:
+            self._executor.submit(self._install, key, tool.name, target, req_file, interpreter, env_lock)
+        except RuntimeError:
+            with self._lock:
+                self._pending.pop(key, None)
+            return False
+        return True
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _expected_count(self, req_file):
+        if req_file is None:
+            return 1
+        try:
+            with open(req_file, 'r', encoding='utf-8', errors='replace') as f:
+                return sum(1 for line in f if line.split('#', 1)[0].strip() and not line.lstrip().startswith('-'))
+        except OSError:
+            return 0
+
+    def _run_pip(self, name, args, interpreter, parser):
+        flags = 0x08000000 if sys.platform.startswith('win') else 0  # CREATE_NO_WINDOW
+        cmd = [interpreter, '-m', 'pip'] + args
+        self.logLine.emit(name, '$ ' + ' '.join(cmd))
+        with metrics.span(f"pip.{args[0]}"):
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                       encoding='utf-8', errors='replace', creationflags=flags)
+            tail = []
+            for line in iter(process.stdout.readline, ''):
+                line = line.rstrip()
+                if not line:
+                    continue
+                self.logLine.emit(name, line)
+                tail = (tail + [line])[-5:]
+                progress = parser.feed(line)
+                if progress is not None:
+                    self.packageProgress.emit(name, progress[0], progress[1], progress[2])
+            process.stdout.close()
+            return process.wait(), tail
+
+    def _install(self, key, name, target, req_file, interpreter, env_lock):
+        self.installationStarted.emit(name)
+        source = ['-r', req_file] if req_file is not None else [target]
+        success, error_msg = False, ""
+        try:
+            if req_file is not None:
+                self.installationProgress.emit(name, "正在从 requirements.txt 安装依赖...")
+            else:
+                self.installationProgress.emit(name, f"正在安装模块: {target}...")
+            os.makedirs(self.wheelhouse, exist_ok=True)
+            parser = PipProgressParser(self._expected_count(req_file))
+            offline = self.offline
+            if not offline:
+                # 解析并下载到 wheelhouse，不需要持有安装锁
+                self.installationProgress.emit(name, "正在解析并下载依赖...")
+                code, tail = self._run_pip(name, ['download', '--progress-bar', 'off', '-d', self.wheelhouse, '--find-links', self.wheelhouse] + source, interpreter, parser)
+                if code != 0:
+                    self.logLine.emit(name, "下载失败，改为仅使用本地 wheelhouse 安装")
+                    offline = True
+            with env_lock:
+                self.installationProgress.emit(name, "正在从本地 wheelhouse 安装...")
+                code, tail = self._run_pip(name, ['install', '--progress-bar', 'off', '--no-index', '--find-links', self.wheelhouse] + source, interpreter, parser)
+            if code == 0:
+                if req_file is not None and self.dependency_cache is not None and interpreter == self.dependency_cache.interpreter:
+                    self.dependency_cache.mark_satisfied(req_file)
+                self.packageProgress.emit(name, parser.total(), parser.total(), '')
+                self.installationProgress.emit(name, "依赖安装成功!")
+                success = True
+            else:
+                error_msg = f"Pip 安装失败，返回码: {code}"
+                if offline:
+                    error_msg += f"（离线模式，请确认 wheelhouse 中包含所需的包: {self.wheelhouse}）"
+                if tail:
+                    error_msg += "\n" + "\n".join(tail)
+        except Exception as e:
+            error_msg = f"安装过程中发生错误: {e}"
+        if not success:
+            self.installationProgress.emit(name, error_msg.split("\n", 1)[0])
+        with self._lock:
+            waiters = self._pending.pop(key, [name])
+        for waiter in waiters:
+            self.installationFinished.emit(waiter, success, error_msg)
+
+class ProcessHandle:
+    __slots__ = ('tool', 'popen', 'pid', 'started', 'cpu_time', 'sampled_at', 'cpu', 'rss', 'log_path')
+    def __init__(self, tool, popen, log_path=None):
+        self.tool = tool
+        self.popen = popen
+        self.log_path = log_path  # 输出捕获的日志文件，运行期间由监管定时检查大小
+        self.pid = popen.pid
+        self.started = time.monotonic()
+        self.cpu_time = None
+        self.sampled_at = None
+        self.cpu = None   # 最近一次采样区间的 CPU 占用（百分比，多核可超过 100）
+        self.rss = None   # 常驻内存（字节）
+
+# 进程监管：保存每个已启动工具的进程句柄，定时器中非阻塞地回收已退出进程并采样 CPU/内存，
+# 同时滚动仍在运行的工具的输出日志；所有状态只在界面线程访问，其它线程通过 track() 经信号转交
+class ProcessSupervisor(QObject):
+    processesChanged = pyqtSignal()
+    processExited = pyqtSignal(object, int)
+    _tracked = pyqtSignal(object, object, object)
+    CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+    def __init__(self, interval_ms=SUPERVISOR_INTERVAL_MS, log_max_bytes=TOOL_LOG_MAX_BYTES, log_backups=TOOL_LOG_BACKUPS, parent=None):
+        super().__init__(parent)
+        self.log_max_bytes = log_max_bytes
+        self.log_backups = log_backups
+        self._handles = {}   # id(tool) -> [ProcessHandle]
+        self._on_exit = {}   # id(tool) -> 工具的所有进程退出后执行的回调
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.poll)
+        self._tracked.connect(self._on_tracked)
+
+    def track(self, tool, popen, log_path=None):
+        # 可在任意线程调用；log_path 为进程输出写入的日志文件
+        self._tracked.emit(tool, popen, log_path)
+
+    def _on_tracked(self, tool, popen, log_path):
+        handle = ProcessHandle(tool, popen, log_path)
+        self._sample(handle)
+        self._handles.setdefault(id(tool), []).append(handle)
+        if not self._timer.isActive():
+            self._timer.start()
+        self.processesChanged.emit()
+
+    def handles(self, tool):
+        return self._handles.get(id(tool), [])
+
+    def is_running(self, tool):
+        return id(tool) in self._handles
+
+    def status(self, tool):
+        # 返回 (进程数, CPU 百分比, 内存字节数)，未运行时返回 None
+        handles = self._handles.get(id(tool))
+        if not handles:
+            return None
+        cpu = sum(h.cpu for h in handles if h.cpu is not None)
+        rss = sum(h.rss for h in handles if h.rss is not None)
+        return len(handles), cpu, rss
+
+    def running_count(self):
+        return sum(len(handles) for handles in self._handles.values())
+
+    def poll(self):
+        logs = set()
+        for key, handles in list(self._handles.items()):
+            alive = []
+            for handle in handles:
+                code = handle.popen.poll()
+                if code is None:
+                    self._sample(handle)
+                    alive.append(handle)
+                    if handle.log_path is not None:
+                        logs.add(handle.log_path)
+                else:
+                    self.processExited.emit(handle.tool, code)
+            if alive:
+                self._handles[key] = alive
+            else:
+                del self._handles[key]
+                callback = self._on_exit.pop(key, None)
+                if callback is not None:
+                    callback()
+        # 长时间运行的工具（如扫描器）不会再经过启动前的滚动，在这里按大小滚动
+        for path in logs:
+            truncate_log(path, self.log_max_bytes, self.log_backups)
+        if not self._handles:
+            self._timer.stop()
+        self.processesChanged.emit()
+
+    def kill(self, tool, then=None):
+        # 先 terminate，宽限期后仍未退出的进程强制 kill；then 在全部退出后调用（用于重启）
+        handles = self._handles.get(id(tool))
+        if not handles:
+            if then is not None:
+                then()
+            return
+        if then is not None:
+            self._on_exit[id(tool)] = then
+        for handle in handles:
+            try:
+                handle.popen.terminate()
+            except OSError:
+                pass
+        def force():
+            for handle in self._handles.get(id(tool), []):
+                if handle.popen.poll() is None:
+                    try:
+                        handle.popen.kill()
+                    except OSError:
+                        pass
+        QTimer.singleShot(KILL_GRACE_MS, force)
+        QTimer.singleShot(200, self.poll)
+
+    def stop(self):
+        # 关闭启动器时不结束子进程，工具继续运行
+        self._timer.stop()
+
+    def _read_times(self, pid):
+        # 返回 (CPU 累计秒数, 常驻内存字节数)
+        if sys.platform.startswith('linux'):
+            try:
+                with open(f'/proc/{pid}/stat', 'rb') as f:
+                    fields = f.read().rsplit(b')', 1)[1].split()
+                with open(f'/proc/{pid}/statm', 'rb') as f:
+                    resident = int(f.read().split()[1])
+            except (OSError, IndexError, ValueError):
+                return None, None
+            return (int(fields[11]) + int(fields[12])) / self.CLOCK_TICKS, resident * self.PAGE_SIZE
+        if psutil is not None:
+            try:
+                process = psutil.Process(pid)
+                times = process.cpu_times()
+                return times.user + times.system, process.memory_info().rss
+            except Exception:
+                return None, None
+        return None, None
+
+    def _sample(self, handle):
+        cpu_time, rss = self._read_times(handle.pid)
+        now = time.monotonic()
+        if cpu_time is not None and handle.cpu_time is not None and now > handle.sampled_at:
+            handle.cpu = max(0.0, (cpu_time - handle.cpu_time) / (now - handle.sampled_at) * 100)
+        handle.cpu_time, handle.sampled_at, handle.rss = cpu_time, now, rss
+
+def _shift_log_backups(path, backups):
+    # x.log.1 -> x.log.2 ...，为新的 x.log.1 腾出位置，超出数量的最旧备份被覆盖
+    for i in range(backups - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+
+# 按大小滚动日志文件：超过上限时 x.log -> x.log.1 -> x.log.2 ...，只保留固定数量的备份
+# 在打开日志交给子进程之前调用；仍被运行中的进程占用而无法改名时（Windows）本次不滚动
+def rotate_log(path, max_bytes=TOOL_LOG_MAX_BYTES, backups=TOOL_LOG_BACKUPS):
+    try:
+        if os.path.getsize(path) < max_bytes:
+            return
+        _shift_log_backups(path, backups)
+        if backups > 0:
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+    except OSError:
+        pass
+
+# 滚动仍被运行中进程写入的日志：复制为 x.log.1 后原地截断
+# 子进程以追加方式（O_APPEND）打开日志，截断后直接从文件开头继续写；复制与截断之间写入的少量输出会丢失
+def truncate_log(path, max_bytes=TOOL_LOG_MAX_BYTES, backups=TOOL_LOG_BACKUPS):
+    import shutil
+    try:
+        if os.path.getsize(path) < max_bytes:
+            return
+        if backups > 0:
+            _shift_log_backups(path, backups)
+            shutil.copyfile(path, f"{path}.1")
+        os.truncate(path, 0)
+    except OSError:
+        pass
+
+def tail_log(path, max_bytes=LOG_TAIL_BYTES):
+    # 通过 mmap 只读取文件末尾 max_bytes 字节，日志再大内存占用也不变
+    import mmap
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = max(0, size - max_bytes)
+                data = mm[start:size]
+    except (OSError, ValueError):
+        return ''
+    if start > 0:
+        data = data[data.find(b'\n') + 1:]  # 丢弃被截断的第一行
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('gbk', errors='replace')
+
+# 输出捕获：子进程的 stdout/stderr 直接写入各工具的日志文件，不经启动器转发，
+# 启动器退出后工具照常运行、输出照常记录；界面通过 tail_log 读取文件末尾
+class OutputCapture:
+    def __init__(self, log_dir=TOOL_LOG_DIR, max_bytes=TOOL_LOG_MAX_BYTES, backups=TOOL_LOG_BACKUPS):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def log_path(self, tool):
+        return os.path.join(self.log_dir, re.sub(r'[\\/:*?"<>|\s]+', '_', tool.name) + '.log')
+
+    def open_log(self, tool):
+        # 返回以追加方式打开的日志文件（二进制），调用方交给子进程后关闭自己的副本；可在任意线程调用
+        path = self.log_path(tool)
+        with self._lock:
+            os.makedirs(self.log_dir, exist_ok=True)
+            rotate_log(path, self.max_bytes, self.backups)
+            return open(path, 'ab')
+
+# zygote 服务进程的源码，以 python -c 运行，不导入 quickstart_gui（避免把 Qt 带进要 fork 的进程）
+# 参数：套接字路径、预加载模块的 JSON 列表。预加载完成后向 stdout 输出一行就绪信息，
+# 之后每个连接是一次启动请求：JSON 一行 + 通过 SCM_RIGHTS 传来的 stdin/stdout/stderr，
+# fork 出子进程运行工具脚本，回复 {"pid": ...}，子进程退出后再回复 {"exit": 返回码}
+_ZYGOTE_SERVER = r'''
+import os, sys, json, socket, array, signal, selectors, importlib, threading
+
+def recv_request(conn):
+    fds = array.array('i')
+    data, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(3 * fds.itemsize))
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(payload[:len(payload) - len(payload) % fds.itemsize])
+    while data and not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data), list(fds)
+
+def run_child(request, fds, closing):
+    code = 1
+    try:
+        for item in closing:
+            item.close()
+        os.setsid()
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        for fd in set(fds):
+            if fd > 2:
+                os.close(fd)
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD, signal.SIGPIPE):
+            signal.signal(sig, signal.SIG_DFL)
+        os.chdir(request['cwd'])
+        script = request['argv'][0]
+        sys.argv = list(request['argv'])
+        sys.path[0] = os.path.dirname(os.path.abspath(script))
+        if 'random' in sys.modules:
+            sys.modules['random'].seed()
+        import runpy, atexit
+        try:
+            runpy.run_path(script, run_name='__main__')
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+def exit_code(status):
+    return -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+def main(sock_path, modules):
+    loaded, failed = [], []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except BaseException:
+            failed.append(name)
+    # 预加载的模块启动了线程时 fork 不安全，拒绝所有请求，由启动器改用普通方式
+    fork_safe = threading.active_count() == 1
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        os.unlink(sock_path)
+    except OSError:
+        pass
+    server.bind(sock_path)
+    os.chmod(sock_path, 0o600)
+    server.listen(16)
+    sys.stdout.write(json.dumps({"fork_safe": fork_safe, "loaded": loaded, "failed": failed}) + "\n")
+    sys.stdout.flush()
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+    parent = os.getppid()
+    children = {}  # pid -> 等待返回码的连接
+    while os.getppid() == parent:
+        for _ in selector.select(0.2):
+            conn, _ = server.accept()
+            fds = []
+            try:
+                conn.settimeout(5)
+                request, fds = recv_request(conn)
+                if not fork_safe or len(fds) != 3:
+                    conn.sendall(b'{"error": "unavailable"}\n')
+                    conn.close()
+                    continue
+                pid = os.fork()
+                if pid == 0:
+                    run_child(request, fds, [selector, server, conn] + list(children.values()))
+                conn.sendall(json.dumps({"pid": pid}).encode() + b'\n')
+                children[pid] = conn
+            except (OSError, ValueError):
+                conn.close()
+            finally:
+                for fd in fds:
+                    os.close(fd)
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            conn = children.pop(pid, None)
+            if conn is not None:
+                try:
+                    conn.sendall(json.dumps({"exit": exit_code(status)}).encode() + b'\n')
+                except OSError:
+                    pass
+                conn.close()
+    # 启动器已退出：不再接受请求，已启动的工具继续运行
+    try:
+        os.unlink(sock_path)
+    except OSError:
+        pass
+
+main(sys.argv[1], json.loads(sys.argv[2]))
+'''
+
+def python_imports(path):
+    # 脚本导入的完整模块名（如 scapy.all，只看 import 语句，不执行脚本）；无法解析时返回 None
+    import ast
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            names.add(node.module)
+    names.discard('__future__')
+    return names
+
+# zygote 派生的工具进程：提供进程监管与输出捕获用到的 Popen 接口子集
+# 进程是 zygote 的子进程，返回码由 zygote 通过连接转告
+class ZygoteProcess:
+    def __init__(self, pid, conn):
+        self.pid = pid
+        self.returncode = None
+        self._conn = conn
+        self._buffer = b''
+
+    def poll(self):
+        if self.returncode is None:
+            self._read(0.0)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self.returncode is None:
+            self._read(timeout)
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired(str(self.pid), timeout)
+        return self.returncode
+
+    def _read(self, timeout):
+        import socket
+        try:
+            self._conn.settimeout(timeout)
+            while b'\n' not in self._buffer:
+                chunk = self._conn.recv(4096)
+                if not chunk:
+                    break
+                self._buffer += chunk
+        except (BlockingIOError, socket.timeout):
+            return
+        except OSError:
+            pass
+        if b'\n' in self._buffer:
+            self.returncode = json.loads(self._buffer.split(b'\n', 1)[0]).get('exit', -1)
+        else:
+            # zygote 已退出，拿不到返回码，只能判断进程是否还在
+            try:
+                os.kill(self.pid, 0)
+                return
+            except ProcessLookupError:
+                self.returncode = -1
+            except PermissionError:
+                return
+        self._conn.close()
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        import signal
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        import signal
+        self.send_signal(signal.SIGKILL)
+
+# Python 工具预 fork 启动（仅 Linux，需在 config.json 中设置 "python_zygote": true）
+# 每个解释器一个常驻 zygote，预先导入常用 Python 工具的依赖，启动时 fork 出子进程直接运行脚本，
+# 省去解释器启动和重型依赖（requests、scapy 等）的导入；不适合 fork 的工具仍走普通启动
+class PythonZygotePool:
+    def __init__(self, exclude=(), preload_tools=ZYGOTE_PRELOAD_TOOLS):
+        self.exclude = set(exclude)  # 强制普通启动的工具名
+        self.preload_tools = preload_tools
+        self._lock = threading.Lock()
+        self._servers = {}  # 解释器 -> {"process", "socket", "modules", "ready"}
+        self._imports = {}  # 脚本路径 -> ((mtime, size), 导入的模块)
+
+    @staticmethod
+    def supported():
+        import socket
+        return sys.platform.startswith('linux') and hasattr(os, 'fork') and hasattr(socket, 'AF_UNIX')
+
+    def imports(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._imports.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = self._imports[path] = (stamp, python_imports(path))
+        return cached[1]
+
+    def eligible(self, tool):
+        # 排除列表中的工具、无法解析的脚本，以及导入了图形界面等不能在 fork 后使用的模块的脚本
+        if tool.name in self.exclude:
+            return False
+        names = self.imports(tool.path)
+        return names is not None and not {name.split('.')[0] for name in names} & ZYGOTE_UNSAFE_MODULES
+
+    def preload_modules(self, tool):
+        # 按完整模块名预加载（scapy.all 而不只是 scapy）；顶层包在工具目录下的本地模块不预加载，
+        # 它们会随脚本一起从工具目录导入
+        tool_dir = os.path.dirname(os.path.abspath(tool.path))
+        local = {}
+        modules = set()
+        for name in self.imports(tool.path) or ():
+            top = name.split('.')[0]
+            if top not in local:
+                local[top] = os.path.exists(os.path.join(tool_dir, top + '.py')) or os.path.isdir(os.path.join(tool_dir, top))
+            if not local[top]:
+                modules.add(name)
+        return modules
+
+    def configure(self, ranked_tools, interpreter_for):
+        # ranked_tools 按常用度排序；为最常用的几个可 fork 工具按解释器分组启动 zygote，模块集合变化时重启
+        wanted = {}
+        count = 0
+        for tool in ranked_tools:
+            if count >= self.preload_tools:
+                break
+            if tool.tool_type != "python" or not self.eligible(tool):
+                continue
+            wanted.setdefault(interpreter_for(tool), set()).update(self.preload_modules(tool))
+            count += 1
+        with self._lock:
+            stale = [interp for interp, server in self._servers.items()
+                     if interp not in wanted or server["modules"] != wanted[interp]]
+            stale_servers = [self._servers.pop(interp) for interp in stale]
+            # 先占位，并发的 configure 不会重复启动同一个解释器的 zygote
+            starting = []
+            for interpreter, modules in wanted.items():
+                if interpreter not in self._servers:
+                    server = self._servers[interpreter] = {"process": None, "socket": self._socket_path(interpreter), "modules": modules, "ready": False}
+                    starting.append((interpreter, server))
+        for server in stale_servers:
+            self._shutdown(server)
+        for interpreter, server in starting:
+            self._start(interpreter, server)
+
+    def _socket_path(self, interpreter):
+        import tempfile
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+        digest = hashlib.sha1(f"{os.path.abspath(__file__)}|{interpreter}".encode('utf-8')).hexdigest()[:12]
+        return os.path.join(runtime_dir, f"quickstart-zygote-{os.getuid()}-{digest}.sock")
+
+    def _start(self, interpreter, server):
+        try:
+            process = subprocess.Popen([interpreter, '-c', _ZYGOTE_SERVER, server["socket"], json.dumps(sorted(server["modules"]))],
+                                       stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__)), start_new_session=True)
+        except OSError:
+            return
+        server["process"] = process
+        # 预加载可能较慢，就绪前的启动请求走普通方式
+        import selectors
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ)
+            line = process.stdout.readline() if selector.select(ZYGOTE_START_TIMEOUT) else b''
+        process.stdout.close()
+        try:
+            info = json.loads(line)
+        except ValueError:
+            info = {}
+        with self._lock:
+            current = self._servers.get(interpreter) is server
+        if info.get("fork_safe") and current:
+            server["ready"] = True
+        else:
+            # 预加载失败、启动了线程，或启动期间已被替换/停止：这个 zygote 不再使用
+            self._shutdown(server)
+
+    def _shutdown(self, server):
+        server["ready"] = False
+        process = server["process"]
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        try:
+            os.unlink(server["socket"])
+        except OSError:
+            pass
+
+    def spawn(self, tool, cmd, cwd=None, log=None):
+        # log 为打开的日志文件时输出写入其中，否则继承启动器的标准输出
+        # 成功返回 ZygoteProcess；没有就绪的 zygote、工具不适合 fork 或通信失败时返回 None，由调用方普通启动
+        if len(cmd) < 2 or cmd[1] != tool.path or not self.eligible(tool):
+            return None
+        with self._lock:
+            server = self._servers.get(cmd[0])
+        if server is None or not server["ready"] or server["process"].poll() is not None:
+            return None
+        import socket, array
+        null = None
+        try:
+            null = os.open(os.devnull, os.O_RDWR)
+            if log is not None:
+                fds = [null, log.fileno(), log.fileno()]
+            else:
+                # 与 Popen 一样继承启动器的标准输入输出（已关闭的用 /dev/null 代替）
+                fds = []
+                for fd in (0, 1, 2):
+                    try:
+                        os.fstat(fd)
+                        fds.append(fd)
+                    except OSError:
+                        fds.append(null)
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(ZYGOTE_REQUEST_TIMEOUT)
+            try:
+                conn.connect(server["socket"])
+                request = json.dumps({"argv": cmd[1:], "cwd": cwd or os.path.dirname(os.path.abspath(tool.path))}).encode('utf-8') + b'\n'
+                conn.sendmsg([request], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))])
+                reply = b''
+                while not reply.endswith(b'\n'):
+                    chunk = conn.recv(4096)
+                    if not chunk:
+                        break
+                    reply += chunk
+                pid = json.loads(reply.split(b'\n', 1)[0] or b'{}').get('pid')
+            except (OSError, ValueError):
+                pid = None
+            if pid is None:
+                conn.close()
+                return None
+            return ZygoteProcess(pid, conn)
+        except OSError:
+            return None
+        finally:
+            if null is not None:
+                os.close(null)
+
+    def stop(self):
+        with self._lock:
+            servers, self._servers = list(self._servers.values()), {}
+        for server in servers:
+            self._shutdown(server)
+
+# 路径健康检查：后台线程池并发检查工具路径与图标是否存在，结果带过期时间缓存
+# 工具盘挂在网络上时单次检查可能卡住数百毫秒，界面与启动流程只读缓存
+class PathHealthScanner(QObject):
+    healthChanged = pyqtSignal(object)
+    scanFinished = pyqtSignal(int)
+    def __init__(self, ttl=HEALTH_TTL_SECONDS, interval_ms=HEALTH_SCAN_INTERVAL_MS, max_workers=HEALTH_WORKERS, parent=None):
+        super().__init__(parent)
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="health")
+        self._lock = threading.Lock()
+        self._cache = {}   # (类型, 路径) -> (是否存在, 检查时间)
+        self._status = {}  # id(tool) -> (路径正常, 图标正常)
+        self._pending = 0  # 当前这轮全量检查尚未完成的工具数
+        self._stopped = False
+        self._tools = lambda: []
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(lambda: self.scan(self._tools(), force=True))
+
+    def start(self, tools_getter):
+        # 立即全量检查一次，之后按间隔定时重查
+        self._tools = tools_getter
+        self.scan(tools_getter(), force=True)
+        self._timer.start()
+
+    def exists(self, path, kind='file', force=False, trust_missing=False):
+        # 缓存未过期且存在时直接返回；不存在或已过期时重新检查（文件可能刚被修复）
+        # trust_missing 用于 requirements.txt 这类通常不存在的辅助文件，未过期的“不存在”也直接返回
+        key = (kind, path)
+        with self._lock:
+            cached = self._cache.get(key)
+        if not force and cached is not None and (cached[0] or trust_missing) and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+        ok = check_path(kind, path)
+        with self._lock:
+            self._cache[key] = (ok, time.monotonic())
+        return ok
+
+    def cached(self, path, kind='file'):
+        # 只读缓存：True/False，未检查过返回 None
+        with self._lock:
+            cached = self._cache.get((kind, path))
+        return None if cached is None else cached[0]
+
+    def status(self, tool):
+        return self._status.get(id(tool))
+
+    def is_broken(self, tool):
+        status = self._status.get(id(tool))
+        return status is not None and not status[0]
+
+    def forget(self, tool):
+        self._status.pop(id(tool), None)
+
+    def scan(self, tools, force=False):
+        # 在任意线程调用；同一轮内重复的路径只检查一次
+        # force 为全量检查（启动时与定时重查），完成后发出 scanFinished；增改工具时的局部检查不发出
+        tools = list(tools)
+        if force:
+            with self._lock:
+                if self._pending:
+                    return  # 上一轮还没结束
+                self._pending = len(tools)
+        checked = {}
+        checked_lock = threading.Lock()
+        for tool in tools:
+            self._executor.submit(self._check_tool, tool, force, checked, checked_lock)
+
+    def _check_once(self, kind, path, force, checked, checked_lock):
+        with checked_lock:
+            event = checked.get((kind, path))
+            first = event is None
+            if first:
+                event = checked[(kind, path)] = threading.Event()
+        if not first:
+            event.wait()
+            return self.cached(path, kind)
+        try:
+            return self.exists(path, kind, force)
+        finally:
+            event.set()
+
+    def _check_tool(self, tool, force, checked, checked_lock):
+        try:
+            if self._stopped:
+                return
+            if tool.tool_type == "url" or not tool.path:
+                path_ok = True
+            else:
+                path_ok = self._check_once('dir' if tool.tool_type == "folder" else 'file', tool.path, force, checked, checked_lock)
+            icon_ok = not tool.icon_path or self._check_once('file', tool.icon_path, force, checked, checked_lock)
+            if tool.tool_type == "python" and path_ok:
+                # 预先检查 requirements.txt，启动时只读缓存
+                self._check_once('file', os.path.join(os.path.dirname(tool.path), 'requirements.txt'), force, checked, checked_lock)
+            status = (path_ok, icon_ok)
+            old = self._status.get(id(tool))
+            self._status[id(tool)] = status
+            if old != status:
+                self.healthChanged.emit(tool)
+        except Exception:
+            pass
+        finally:
+            if force:
+                with self._lock:
+                    self._pending -= 1
+                    done = self._pending == 0
+                if done:
+                    self.scanFinished.emit(sum(1 for path_ok, _ in list(self._status.values()) if not path_ok))
+
+    def stop(self):
+        self._stopped = True
+        self._timer.stop()
+        self._executor.shutdown(wait=False)
+
+# 工具启动调度：有界线程池执行启动任务，同一工具的重复点击会被忽略
+# 启动任务在线程池中运行，所有界面反馈都通过信号回到界面线程
+class LaunchScheduler(QObject):
+    statusChanged = pyqtSignal(str)
+    errorRaised = pyqtSignal(str, str)
+    urlRequested = pyqtSignal(QUrl)
+    toolLaunched = pyqtSignal(str, bool, str)
+    def __init__(self, max_workers=LAUNCH_WORKERS, dedup_seconds=LAUNCH_DEDUP_SECONDS, parent=None):
+        super().__init__(parent)
+        self.dedup_seconds = dedup_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='launcher')
+        self._lock = threading.Lock()
+        self._inflight = set()   # 排队或启动中的 id(tool)
+        self._last_submit = {}   # id(tool) -> 最近一次提交时间
+
+    def submit(self, tool, task, dedup=True):
+        key = id(tool)
+        now = time.monotonic()
+        with self._lock:
+            if dedup and (key in self._inflight or now - self._last_submit.get(key, -self.dedup_seconds) < self.dedup_seconds):
+                return False
+            self._inflight.add(key)
+            self._last_submit[key] = now
+        self._executor.submit(self._run, tool, task)
+        return True
+
+    def submit_batch(self, tools, make_task):
+        # 批量启动：各工具并行进入线程池，返回实际提交的工具
+        return [tool for tool in tools if self.submit(tool, make_task(tool))]
+
+    def stop(self):
+        self._executor.shutdown(wait=False)
+
+    def _run(self, tool, task):
+        try:
+            task()
+        except Exception as e:
+            self.toolLaunched.emit(tool.name, False, str(e))
+        finally:
+            with self._lock:
+                self._inflight.discard(id(tool))
+
+# 搜索线程：在后台执行索引查询
+class SearchWorker(QObject):
+    searchFinished = pyqtSignal(int, str, object, float)
+    def __init__(self, index, is_stale):
+        super().__init__()
+        self.index = index
+        self.is_stale = is_stale
+
+    def run_search(self, generation, text):
+        # 排队期间已被新查询取代的请求直接丢弃
+        if self.is_stale(generation):
+            return
+        start = time.perf_counter()
+        result = self.index.search_pages(text, cancelled=lambda: self.is_stale(generation))
+        if result is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        metrics.observe("search.query", elapsed_ms)
+        self.searchFinished.emit(generation, text, result, elapsed_ms)
+
+# 搜索调度：输入防抖后交给搜索线程，新查询会使旧查询作废
+class SearchScheduler(QObject):
+    searchRequested = pyqtSignal(int, str)
+    resultsReady = pyqtSignal(int, str, object, float)
+    def __init__(self, index, delay_ms=SEARCH_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self._pending_text = ''
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._dispatch)
+        self._thread = QThread()
+        self._worker = SearchWorker(index, self.is_stale)
+        self._worker.moveToThread(self._thread)
+        self.searchRequested.connect(self._worker.run_search)
+        self._worker.searchFinished.connect(self._on_search_finished)
+        self._thread.start()
+
+    def schedule(self, text):
+        self.generation += 1
+        self._pending_text = text
+        self._timer.start()
+
+    def cancel(self):
+        self.generation += 1
+        self._timer.stop()
+
+    def is_stale(self, generation):
+        return generation != self.generation
+
+    def stop(self):
+        self.cancel()
+        self._thread.quit()
+        self._thread.wait()
+
+    def _dispatch(self):
+        self.searchRequested.emit(self.generation, self._pending_text)
+
+    def _on_search_finished(self, generation, text, tools, elapsed_ms):
+        # 迟到的旧结果直接丢弃
+        if not self.is_stale(generation):
+            self.resultsReady.emit(generation, text, tools, elapsed_ms)
+
+# 主窗口
+# 启动耗时分析（--profile-startup）：按阶段记录耗时，全部加载完成后输出到 stderr
+class StartupProfiler(QObject):
+    def __init__(self, enabled=False, started=None, parent=None):
+        super().__init__(parent)
+        self.enabled = enabled
+        self.started = started or _STARTUP_T0
+        self.phases = []
+        self._last = self.started
+        self._watched = {}  # 控件 -> 首次绘制时记录的阶段名
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    def mark_first_paint(self, widget, phase):
+        # 在控件收到第一个绘制事件时记录
+        if self.enabled:
+            self._watched[widget] = phase
+            widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and obj in self._watched:
+            obj.removeEventFilter(self)
+            self.mark(self._watched.pop(obj))
+        return False
+
+    def report(self):
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self.started) * 1000
+        lines = ["启动耗时分析:"]
+        lines.extend(f"  {phase:<20}{elapsed:>9.1f} ms" for phase, elapsed in self.phases)
+        lines.append(f"  {'total':<20}{total:>9.1f} ms")
+        print("\n".join(lines), file=sys.stderr)
+
+class QuickStartMainWindow(QMainWindow):
+    toolUpdated = pyqtSignal(object)
+    installRequested = pyqtSignal(object, str)
+    configSaveFailed = pyqtSignal(str)
+    venvStatusChanged = pyqtSignal(str)
+    def __init__(self, profiler=None):
+        super().__init__()
+        self.profiler = profiler or StartupProfiler()
+        self.setWindowTitle('quickstart - 极简安全工具')
+        self.setGeometry(500, 500, 1100, 800)
+        self.config_store = ConfigStore(on_error=self.configSaveFailed.emit)
+        self.launch_journal = LaunchJournal()
+        # 存在 tools.db 时不整体加载工具目录，列表、分类与搜索都按页查询
+        self.tool_store = SqliteToolStore(identity=True) if os.path.exists(TOOLS_DB_PATH) else None
+        self.configSaveFailed.connect(lambda error: self.set_status(f"❌ 保存配置失败: {error}"))
+        self.venvStatusChanged.connect(self.set_status)
+        self.search_index = ToolSearchIndex()
+        self.category_trie = CategoryTrie()
+        self.frecency = FrecencyIndex()
+        self.category_items = {}  # 分类路径 -> QTreeWidgetItem
+        self.search_scheduler = SearchScheduler(self.search_index if self.tool_store is None else self.tool_store, parent=self)
+        self.search_scheduler.resultsReady.connect(self.on_search_results)
+        self.tools = []
+        self.filtered_tools = self.tools
+        self.instance_server = None
+        self.current_category = None
+        self._launch_clicks = {}  # id(tool) -> 点击启动的时刻，用于统计点击到进程创建的耗时
+        self.metrics_export_path = None
+        self.init_ui()
+        self.init_workers()
+        self.profiler.mark("ui build")
+        self.profiler.mark_first_paint(self, "first paint")
+        # 窗口先完成首次绘制，再分步加载工具目录（窗口未显示时由定时器兜底）
+        self._catalog_pending = True
+        QTimer.singleShot(150, self.load_catalog)
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._catalog_pending:
+            QTimer.singleShot(0, self.load_catalog)
+    def load_catalog(self):
+        # 第一步：解析配置，先按常用度取第一屏卡片显示
+        if not self._catalog_pending:
+            return
+        self._catalog_pending = False
+        if self.tool_store is not None:
+            # SQLite 存储：只读取第一页，其余在滚动时按需读取
+            self.tools = self.filtered_tools = self.tool_store.pages()
+            self.profiler.mark("config parse")
+            self.profiler.mark_first_paint(self.tool_view.viewport(), "first page paint")
+            self.show_tools()
+            self.tool_view.viewport().repaint()
+            QTimer.singleShot(0, self.finish_catalog)
+            return
+        self.tools = self.load_tools()
+        self.filtered_tools = self.tools
+        self.frecency.build(self.tools, self.launch_history())
+        self.profiler.mark("config parse")
+        self.profiler.mark_first_paint(self.tool_view.viewport(), "first page paint")
+        self.tool_model.set_tools(self.frecency.top_k(FIRST_PAGE_SIZE))
+        self.search_stats.setText(f"正在加载 {len(self.tools)} 个工具...")
+        self.tool_view.viewport().repaint()  # 立即绘制第一屏，不等剩余步骤
+        QTimer.singleShot(0, self.finish_catalog)
+    def finish_catalog(self):
+        # 第二步：完整列表、分类树；搜索索引在后台线程构建（SQLite 存储直接查库，不建索引）
+        if self.tool_store is None:
+            self.show_tools()
+            self.profiler.mark("full list")
+        self.build_category_tree()
+        self.profiler.mark("tree build")
+        if self.tool_store is None:
+            tools = list(self.tools)
+            threading.Thread(target=self.search_index.build, args=(tools,), daemon=True).start()
+        self.init_runtimes()
+        self.init_zygotes()
+        self.profiler.mark("runtimes")
+        self.init_config_watcher()
+        self.health_scanner.start(self.loaded_tools)
+        self.profiler.report()
+    def init_ui(self):
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_label = QLabel("就绪")
+        self.status_label.setMaximumWidth(16777215)  # 允许最大宽度
+        self.status_label.setMinimumWidth(0)
+        self.status_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.status_label.setStyleSheet("QLabel { qproperty-alignment: AlignVCenter | AlignLeft; }")
+        self.status_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.status_label.setWordWrap(False)
+        self.status_label.setToolTip("状态栏信息过长时可悬停查看全部")
+        self.status_label.setTextFormat(Qt.PlainText)
+        self.status_bar.addWidget(self.status_label, 1)  # 拉伸因子为1，自动填满
+        self.install_progress_bar = QProgressBar()
+        self.install_progress_bar.setVisible(False)
+        self.install_progress_bar.setFixedWidth(200)
+        self.install_progress_bar.setFormat("%v/%m")
+        self.status_bar.addPermanentWidget(self.install_progress_bar)
+        self.install_log_btn = QPushButton("📜 安装日志")
+        self.install_log_btn.setFlat(True)
+        self.status_bar.addPermanentWidget(self.install_log_btn)
+        # 安装日志面板，完整记录 pip 输出
+        self.install_log = QPlainTextEdit()
+        self.install_log.setReadOnly(True)
+        self.install_log.setMaximumBlockCount(INSTALL_LOG_LINES)
+        self.install_log.setStyleSheet("font-family: Consolas, monospace; font-size: 12px;")
+        self.install_log_dock = QDockWidget("安装日志", self)
+        self.install_log_dock.setObjectName("install_log_dock")
+        self.install_log_dock.setWidget(self.install_log)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.install_log_dock)
+        self.install_log_dock.hide()
+        self.install_log_btn.clicked.connect(lambda: self.install_log_dock.setVisible(not self.install_log_dock.isVisible()))
+        self.metrics_btn = QPushButton("📊 性能诊断")
+        self.metrics_btn.setFlat(True)
+        self.metrics_btn.clicked.connect(lambda: MetricsDialog(self.metrics_export_path, self).show())
+        self.status_bar.addPermanentWidget(self.metrics_btn)
+        self.metrics_export_timer = QTimer(self)
+        self.metrics_export_timer.setInterval(METRICS_EXPORT_INTERVAL_MS)
+        self.metrics_export_timer.timeout.connect(self.export_metrics)
+        self.install_progress = {}  # 工具名 -> (已完成步数, 总步数)
+        # 顶部搜索框
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("搜索工具名称、描述或分类...")
+        self.search_input.setFixedHeight(36)
+        self.search_input.setStyleSheet("font-size: 16px; border-radius: 18px; padding-left: 18px; background: #fff; border: 1.5px solid #e9ecef; margin-right: 8px;")
+        self.search_input.textChanged.connect(self.on_search_text_changed)
+        # 搜索统计标签
+        self.search_stats = QLabel()
+        self.search_stats.setStyleSheet("font-size: 15px; color: #888; padding-left: 12px;")
+        # 放大镜图标
+        self.search_icon = QLabel("🔍")
+        self.search_icon.setStyleSheet("font-size: 18px; padding-right: 8px;")
+        # 添加工具按钮
+        self.add_tool_btn = QPushButton("➕ 添加工具")
+        self.add_tool_btn.setFixedHeight(36)
+        self.add_tool_btn.setStyleSheet("font-size: 16px; border-radius: 18px; background: #43e97b; color: #fff; padding: 0 18px; margin-left: 12px;")
+        self.add_tool_btn.setMinimumWidth(120)
+        self.add_tool_btn.clicked.connect(self.add_tool)
+        top_widget = QWidget()
+        top_layout = QHBoxLayout(top_widget)
+        top_layout.setContentsMargins(16, 12, 16, 0)
+        top_layout.setSpacing(0)
+        top_layout.addWidget(self.search_icon)
+        top_layout.addWidget(self.search_input)
+        top_layout.addWidget(self.search_stats)
+        top_layout.addWidget(self.add_tool_btn)
+        top_layout.addItem(QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        # 分类大纲
+        self.category_tree = QTreeWidget()
+        self.category_tree.setHeaderHidden(True)
+        self.category_tree.setFixedWidth(220)
+        self.category_tree.itemClicked.connect(self.on_category_clicked)
+        # self.build_category_tree()  # 移除这里的调用
+        # 工具区（模型/视图，只绘制可见卡片）
+        self.tool_model = ToolListModel(self)
+        self.icon_loader = IconLoader(parent=self)
+        self.supervisor = ProcessSupervisor(parent=self)
+        self.health_scanner = PathHealthScanner(parent=self)
+        self.tool_delegate = ToolCardDelegate(self.icon_loader, self, self.supervisor, self.health_scanner)
+        self.tool_delegate.launchRequested.connect(self.launch_tool)
+        self.tool_delegate.stopRequested.connect(self.kill_tool)
+        self.tool_view = QListView()
+        self.tool_view.setModel(self.tool_model)
+        self.tool_view.setItemDelegate(self.tool_delegate)
+        self.tool_view.setUniformItemSizes(True)
+        self.tool_view.setMouseTracking(True)
+        self.tool_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tool_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tool_view.setFrameShape(QListView.NoFrame)
+        self.tool_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tool_view.customContextMenuRequested.connect(self.show_tool_context_menu)
+        self.toolUpdated.connect(self.tool_model.refresh_tool)
+        self.icon_loader.iconLoaded.connect(lambda path: self.tool_view.viewport().update())
+        self.supervisor.processesChanged.connect(self.tool_view.viewport().update)
+        self.supervisor.processExited.connect(self.handle_process_exited)
+        self.health_scanner.healthChanged.connect(self.on_health_changed)
+        self.health_scanner.healthChanged.connect(self.tool_model.refresh_tool)
+        self.health_scanner.scanFinished.connect(self.handle_health_scanned)
+        # 主布局
+        main_widget = QWidget()
+        main_layout = QHBoxLayout(main_widget)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        # 左侧：分类树
+        left_layout = QVBoxLayout()
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setSpacing(0)
+        left_layout.addWidget(self.category_tree)
+        left_widget = QWidget()
+        left_widget.setLayout(left_layout)
+        main_layout.addWidget(left_widget)
+        # 右侧：搜索+工具区
+        right_layout = QVBoxLayout()
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout.setSpacing(0)
+        right_layout.addWidget(top_widget)
+        right_layout.addWidget(self.tool_view)
+        right_widget = QWidget()
+        right_widget.setLayout(right_layout)
+        main_layout.addWidget(right_widget, 1)
+        self.setCentralWidget(main_widget)
+        self.setMinimumSize(1100, 800)
+        self.setMaximumSize(16777215, 16777215)
+    def add_tool(self):
+        dialog = ToolEditDialog(self, None, self.get_all_categories())
+        if dialog.exec() == QDialog.Accepted:
+            data = dialog.get_data()
+            new_tool = Tool({
+                "name": data["name"],
+                "tool_type": data["tool_type"],
+                "path": data["path"],
+                "icon_path": data["icon_path"],
+                "category": data["category"],
+                "args": data["args"],
+                "description": data["description"],
+                "launch_count": 0,
+                "last_launch": ""
+            })
+            if self.tool_store is not None:
+                self.save_tools(new_tool)
+                self.health_scanner.scan([new_tool])
+                self.tools = self.tool_store.pages()
+                self.build_category_tree()
+                self.apply_current_filter()
+            else:
+                self.tools.append(new_tool)
+                self.search_index.add(new_tool)
+                self.frecency.add(new_tool)
+                self.health_scanner.scan([new_tool])
+                self.save_tools(new_tool)
+                self.update_category_items(self.category_trie.add(new_tool))
+                self.show_tools()
+            if self.venv_pool is not None:
+                self.venv_pool.prepare(new_tool)
+    def init_workers(self):
+        self.dependency_cache = DependencyCache()
+        self.installer = DependencyInstaller(self.dependency_cache, parent=self)
+        self.installRequested.connect(self.installer.install)
+        self.installer.installationStarted.connect(self.handle_installation_started)
+        self.installer.installationProgress.connect(self.handle_installation_progress)
+        self.installer.installationFinished.connect(self.handle_installation_finished)
+        self.installer.packageProgress.connect(self.handle_package_progress)
+        self.installer.logLine.connect(lambda name, line: self.install_log.appendPlainText(f"[{name}] {line}"))
+        self.launch_scheduler = LaunchScheduler(parent=self)
+        self.launch_scheduler.statusChanged.connect(self.set_status)
+        self.launch_scheduler.errorRaised.connect(lambda title, message: QMessageBox.critical(self, title, message))
+        self.launch_scheduler.urlRequested.connect(QDesktopServices.openUrl)
+        self.launch_scheduler.toolLaunched.connect(self.handle_tool_launched)
+        self.java_registry = JavaRuntimeRegistry()
+        self.output_capture = OutputCapture()
+        self.settings = {}
+        self.launcher = ToolLauncher(
+            self.java_registry, self.dependency_cache, self.spawn,
+            record=self.record_launch,
+            status=self.launch_scheduler.statusChanged.emit,
+            error=self.launch_scheduler.errorRaised.emit,
+            open_url=lambda target, local: self.launch_scheduler.urlRequested.emit(QUrl.fromLocalFile(target) if local else QUrl(target)),
+            install=self.handle_installation_required, health=self.health_scanner)
+        self.venv_pool = None
+        self.zygotes = None
+    def init_runtimes(self):
+        # config.json 中 "offline"/"wheelhouse" 控制依赖来源（离线时只从 wheelhouse 安装）
+        # "isolated_venvs": true 开启独立环境（默认关闭），"python_interpreters" 按工具名指定解释器
+        settings = self.settings = self.tool_store.settings() if self.tool_store is not None else self.config_store.extra
+        self.java_registry.configure(settings)
+        threading.Thread(target=self.java_registry.scan, daemon=True).start()
+        self.installer.offline = bool(settings.get('offline', False))
+        self.installer.wheelhouse = settings.get('wheelhouse') or WHEEL_CACHE_DIR
+        self.apply_metrics_settings()
+        if not settings.get('isolated_venvs', False):
+            return
+        self.venv_pool = VenvPool(wheel_dir=self.installer.wheelhouse, interpreters=settings.get('python_interpreters'),
+                                  offline=self.installer.offline, health=self.health_scanner, on_status=self.venvStatusChanged.emit)
+        self.launcher.venv_pool = self.venv_pool
+        # 逐个检查摘要与标记会读文件，放到后台进行；SQLite 存储只读取 Python 工具
+        if self.tool_store is not None:
+            python_tools = lambda: self.tool_store.query(tool_type="python")
+        else:
+            python_tools = lambda tools=list(self.tools): tools
+        threading.Thread(target=lambda: self.venv_pool.prepare_all(python_tools()), daemon=True).start()
+
+    def init_zygotes(self):
+        # "python_zygote": true 开启预 fork 启动，"zygote_exclude" 列出始终普通启动的工具名
+        if not self.settings.get('python_zygote') or not PythonZygotePool.supported():
+            if self.zygotes is not None:
+                threading.Thread(target=self.zygotes.stop, daemon=True).start()
+                self.zygotes = None
+            return
+        if self.zygotes is None:
+            self.zygotes = PythonZygotePool()
+        self.zygotes.exclude = set(self.settings.get('zygote_exclude') or ())
+        def interpreter_for(tool):
+            return (self.venv_pool.python_for(tool) if self.venv_pool is not None else None) or sys.executable
+        # 按常用度（SQLite 存储按启动次数）取前几个 Python 工具，预加载在后台进行
+        if self.tool_store is not None:
+            ranked = self.tool_store.query(tool_type="python", limit=SQLITE_PAGE_SIZE)
+        else:
+            ranked = self.frecency.top_k()
+        threading.Thread(target=self.zygotes.configure, args=(ranked, interpreter_for), daemon=True).start()
+
+    def apply_metrics_settings(self):
+        # "metrics": true 开启耗时采集（也可用 --metrics 或在性能诊断面板中开启）
+        # "metrics_export" 为导出文件路径，.json 结尾导出 JSON，否则为 Prometheus 文本，每 15 秒刷新
+        if self.settings.get('metrics'):
+            metrics.enabled = True
+        self.metrics_export_path = self.settings.get('metrics_export') or None
+        if self.metrics_export_path:
+            self.metrics_export_timer.start()
+        else:
+            self.metrics_export_timer.stop()
+
+    def export_metrics(self):
+        if not self.metrics_export_path or not metrics.enabled:
+            return
+        try:
+            metrics.export(self.metrics_export_path)
+        except OSError as e:
+            self.metrics_export_timer.stop()
+            self.set_status(f"❌ 导出性能数据失败: {e}")
+
+    def load_tools(self):
+        # 从 config.json 读取工具列表
+        if not os.path.exists(CONFIG_PATH):
+            QMessageBox.critical(self, "错误", f"未找到配置文件: {CONFIG_PATH}")
+            return []
+        data = self.config_store.load()
+        tools = [Tool.from_dict(item) for item in data.get('tools', [])]
+        if self.launch_journal.load(tools, data.get('journal_seq', 0)):
+            threading.Thread(target=self.compact_launch_journal, daemon=True).start()
+        return tools
+    def launch_history(self):
+        # 返回 history(tool) -> 启动时间列表，用于初始化常用度
+        return self.launch_journal.history
+    def show_tools(self, ranked=False, elapsed_ms=None):
+        # 按常用度排序（搜索结果已按匹配度排序），交给模型，由视图按需绘制
+        if ranked or self.tool_store is not None:
+            # 搜索结果与 SQLite 存储都是分页结果：模型先拿第一页（搜索结果已在搜索线程读好），滚动时再读
+            pages = self.filtered_tools
+            if not ranked:
+                pages.load()
+            with metrics.span("render.show_tools"):
+                self.tool_model.set_tools(pages.first, fetch_more=lambda offset: self.fetch_page(pages, offset))
+            if self.tool_store is not None:
+                self.health_scanner.scan(pages.first)
+            self.update_search_stats(elapsed_ms)
+            return
+        if self.filtered_tools is self.tools:
+            sorted_tools = self.frecency.top_k()
+        else:
+            sorted_tools = self.frecency.order(self.filtered_tools)
+        with metrics.span("render.show_tools"):
+            self.tool_model.set_tools(sorted_tools)
+        self.update_search_stats(elapsed_ms)
+
+    def fetch_page(self, pages, offset):
+        # 内存模式启动时已检查过全部工具，只有 SQLite 存储需要检查新读到的页
+        tools = pages.fetch(offset)
+        if self.tool_store is not None:
+            self.health_scanner.scan(tools)
+        return tools
+
+    def loaded_tools(self):
+        # 需要遍历的工具（健康检查等）：SQLite 存储只含已读取过的工具
+        return self.tool_store.loaded_tools() if self.tool_store is not None else list(self.tools)
+
+    def find_tool(self, name):
+        if self.tool_store is not None:
+            found = self.tool_store.query(name=name, limit=1)
+            return found[0] if found else None
+        return next((t for t in self.tools if t.name == name), None)
+
+    def update_search_stats(self, elapsed_ms=None):
+        total = len(self.tools)
+        found = len(self.filtered_tools)
+        text = f"找到 {found} 个工具(共 {total} 个)"
+        if elapsed_ms is not None:
+            text += f" 用时 {elapsed_ms:.1f} ms"
+        self.search_stats.setText(text)
+
+    def show_tool_context_menu(self, pos):
+        index = self.tool_view.indexAt(pos)
+        tool = index.data(ToolListModel.ToolRole) if index.isValid() else None
+        menu = QMenu(self)
+        if tool is None:
+            # 空白区域
+            add_action = menu.addAction("➕ 添加工具")
+            add_action.triggered.connect(self.add_tool)
+            menu.exec(self.tool_view.viewport().mapToGlobal(pos))
+            return
+        # 多选时批量启动
+        selected = [i.data(ToolListModel.ToolRole) for i in self.tool_view.selectionModel().selectedIndexes()]
+        if len(selected) > 1 and tool in selected:
+            action_batch = QAction(f"🚀 批量启动选中的 {len(selected)} 个工具", menu)
+            action_batch.triggered.connect(lambda: self.launch_tools(selected))
+            menu.addAction(action_batch)
+            menu.addSeparator()
+        # 启动
+        action_launch = QAction("🚀 启动工具", menu)
+        action_launch.triggered.connect(lambda: self.launch_tool(tool))
+        menu.addAction(action_launch)
+        # 运行中的工具可结束或重启
+        if self.supervisor.is_running(tool):
+            action_restart = QAction("🔄 重启工具", menu)
+            action_restart.triggered.connect(lambda: self.restart_tool(tool))
+            menu.addAction(action_restart)
+            action_kill = QAction("⏹ 结束进程", menu)
+            action_kill.triggered.connect(lambda: self.kill_tool(tool))
+            menu.addAction(action_kill)
+        # 编辑
+        action_edit = QAction("✏️ 编辑工具", menu)
+        action_edit.triggered.connect(lambda: self.edit_tool(tool))
+        menu.addAction(action_edit)
+        # 打开所在文件夹
+        action_folder = QAction("📁 打开所在文件夹", menu)
+        action_folder.triggered.connect(lambda: self.open_folder(tool))
+        menu.addAction(action_folder)
+        # 打开命令行
+        action_cmd = QAction("💻 打开命令行", menu)
+        action_cmd.triggered.connect(lambda: self.open_cmd(tool))
+        menu.addAction(action_cmd)
+        # 输出日志
+        if os.path.exists(self.output_capture.log_path(tool)):
+            action_log = QAction("📜 查看输出日志", menu)
+            action_log.triggered.connect(lambda: self.show_tool_log(tool))
+            menu.addAction(action_log)
+        menu.addSeparator()
+        # 复制路径
+        action_copy_path = QAction("📋 复制路径", menu)
+        action_copy_path.triggered.connect(lambda: self.copy_path(tool))
+        menu.addAction(action_copy_path)
+        # 复制工具信息
+        action_copy_info = QAction("📄 复制工具信息", menu)
+        action_copy_info.triggered.connect(lambda: self.copy_info(tool))
+        menu.addAction(action_copy_info)
+        menu.addSeparator()
+        # 删除
+        action_delete = QAction("🗑️ 删除工具", menu)
+        action_delete.triggered.connect(lambda: self.delete_tool(tool))
+        menu.addAction(action_delete)
+        menu.exec(self.tool_view.viewport().mapToGlobal(pos))
+
+    def launch_tool(self, tool, dependency_check=True):
+        # 依赖安装完成后的重新启动不受重复点击限制
+        clicked = time.perf_counter()
+        if not self.launch_scheduler.submit(tool, lambda: self.run_launch(tool, dependency_check, clicked), dedup=dependency_check):
+            self.set_status(f"⏳ {tool.name} 正在启动，已忽略重复点击")
+
+    def launch_tools(self, tools):
+        # 批量启动，各工具在启动线程池中并行执行
+        clicked = time.perf_counter()
+        started = self.launch_scheduler.submit_batch(tools, lambda tool: lambda: self.run_launch(tool, True, clicked))
+        self.set_status(f"🚀 正在批量启动 {len(started)} 个工具")
+
+    def run_launch(self, tool, dependency_check, clicked=None):
+        # 在启动线程池中执行，界面反馈一律通过 launch_scheduler 的信号
+        if clicked is not None and metrics.enabled:
+            metrics.observe("launch.queue_wait", (time.perf_counter() - clicked) * 1000)
+            self._launch_clicks[id(tool)] = clicked
+        try:
+            self.launcher.launch(tool, dependency_check)
+        finally:
+            self._launch_clicks.pop(id(tool), None)
+
+    def spawn(self, tool, cmd, **kwargs):
+        # 所有工具进程都经由这里启动，句柄交给进程监管
+        # 开启输出捕获的工具（新开控制台的除外）输出直接写入 logs/ 下的日志文件
+        log = None
+        if self.should_capture(tool) and 'creationflags' not in kwargs:
+            log = self.output_capture.open_log(tool)
+            kwargs.update(stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+        try:
+            process = None
+            if self.zygotes is not None and tool.tool_type == "python":
+                # 预 fork 启动，不可用时回到普通启动
+                with metrics.span("launch.zygote"):
+                    process = self.zygotes.spawn(tool, cmd, kwargs.get('cwd'), log)
+            if process is None:
+                with metrics.span("launch.popen"):
+                    process = subprocess.Popen(cmd, **kwargs)
+        finally:
+            if log is not None:
+                log.close()  # 子进程已持有自己的副本
+        clicked = self._launch_clicks.get(id(tool))
+        if clicked is not None:
+            # 从点击启动按钮到进程创建完成
+            metrics.observe("launch.click_to_spawn", (time.perf_counter() - clicked) * 1000)
+        self.supervisor.track(tool, process, self.output_capture.log_path(tool) if log is not None else None)
+        return process
+
+    def should_capture(self, tool):
+        # config.json 中 "capture_output": true 对所有工具生效，也可以是工具名列表
+        setting = self.settings.get('capture_output', False)
+        return tool.name in setting if isinstance(setting, list) else bool(setting)
+
+    def show_tool_log(self, tool):
+        LogTailDialog(self.output_capture.log_path(tool), f"{tool.name} 输出日志", self).show()
+
+    def kill_tool(self, tool):
+        self.supervisor.kill(tool)
+        self.set_status(f"⏹ 正在结束: {tool.name}")
+
+    def restart_tool(self, tool):
+        self.set_status(f"🔄 正在重启: {tool.name}")
+        self.supervisor.kill(tool, then=lambda: self.launch_tool(tool, dependency_check=False))
+
+    def on_health_changed(self, tool):
+        # 图标从缺失变为存在时重新读取，不等读取失败的记录过期
+        status = self.health_scanner.status(tool)
+        if status is not None and status[1]:
+            self.icon_loader.retry(tool.icon_path)
+
+    def handle_health_scanned(self, broken):
+        if self.venv_pool is not None:
+            self.venv_pool.invalidate()
+        if broken:
+            self.set_status(f"⚠️ {broken} 个工具的路径不存在，已在卡片上标出")
+
+    def handle_process_exited(self, tool, code):
+        self.set_status(f"{tool.name} 已退出（返回码 {code}）")
+
+    def handle_installation_required(self, tool, target):
+        # 交给安装线程池执行，可在任意线程调用
+        self.installRequested.emit(tool, target)
+
+    def handle_installation_started(self, tool_name):
+        self.install_progress[tool_name] = (0, 0)
+        self.update_install_progress()
+        self.install_log.appendPlainText(f"===== {tool_name} 开始安装依赖 =====")
+        self.set_status(f"为 {tool_name} 开始安装依赖...")
+
+    def handle_installation_progress(self, tool_name, message):
+        self.set_status(f"[{tool_name}] {message}")
+
+    def handle_package_progress(self, tool_name, done, total, package):
+        if tool_name not in self.install_progress:
+            return
+        self.install_progress[tool_name] = (done, total)
+        self.update_install_progress()
+        if package:
+            self.set_status(f"[{tool_name}] {package} ({done}/{total})")
+
+    def update_install_progress(self):
+        # 多个工具同时安装时汇总显示
+        if not self.install_progress:
+            self.install_progress_bar.setVisible(False)
+            return
+        done = sum(d for d, t in self.install_progress.values())
+        total = sum(t for d, t in self.install_progress.values())
+        self.install_progress_bar.setVisible(True)
+        if total == 0:
+            self.install_progress_bar.setRange(0, 0)
+        else:
+            self.install_progress_bar.setRange(0, total)
+            self.install_progress_bar.setValue(done)
+
+    def handle_installation_finished(self, tool_name, success, error_msg):
+        self.install_progress.pop(tool_name, None)
+        self.update_install_progress()
+        self.install_log.appendPlainText(f"===== {tool_name} {'安装成功' if success else '安装失败'} =====")
+        tool = self.find_tool(tool_name)
+        if success:
+            self.set_status(f"✅ {tool_name} 依赖安装成功，正在重新启动...")
+            if tool:
+                self.launch_tool(tool, dependency_check=False)
+        else:
+            self.set_status(f"❌ {tool_name} 依赖安装失败: {error_msg}")
+            QMessageBox.critical(self, "安装失败", f"为 {tool_name} 安装依赖失败: \n{error_msg}")
+
+    def handle_tool_launched(self, tool_name, success, result):
+        if success:
+            self.set_status(f"✅ 已启动: {tool_name}")
+        else:
+            self.set_status(f"❌ 启动失败: {tool_name} - {result}")
+            QMessageBox.critical(self, "启动失败", f"启动 {tool_name} 失败: {result}")
+
+    def on_search_text_changed(self, text):
+        if not text.strip():
+            self.search_scheduler.cancel()
+            self.filtered_tools = self.tools
+            self.show_tools()
+            return
+        self.search_scheduler.schedule(text)
+
+    def on_search_results(self, generation, text, tools, elapsed_ms):
+        self.filtered_tools = tools
+        self.show_tools(ranked=True, elapsed_ms=elapsed_ms)
+
+    def edit_tool(self, tool):
+        dialog = ToolEditDialog(self, tool, self.get_all_categories())
+        if dialog.exec() == QDialog.Accepted:
+            data = dialog.get_data()
+            old_category = tool.category
+            tool.name = data["name"]
+            tool.tool_type = data["tool_type"]
+            tool.path = data["path"]
+            self.icon_loader.forget(tool.icon_path)
+            tool.icon_path = data["icon_path"]
+            self.icon_loader.forget(tool.icon_path)
+            tool.category = data["category"]
+            tool.args = data["args"]
+            tool.description = data["description"]
+            self.health_scanner.scan([tool])
+            self.save_tools(tool)
+            if self.tool_store is not None:
+                if tool.category != old_category:
+                    self.build_category_tree()
+                self.apply_current_filter()
+            else:
+                self.search_index.update(tool)
+                if tool.category != old_category:
+                    self.update_category_items(self.category_trie.remove(tool))
+                    self.update_category_items(self.category_trie.add(tool))
+                self.show_tools()
+            if self.venv_pool is not None and self.venv_pool.python_for(tool) is None:
+                self.venv_pool.prepare(tool)
+
+    def folder_exists(self, tool, folder):
+        # 工具路径存在时其所在目录必然存在，直接读健康检查的缓存
+        status = self.health_scanner.status(tool)
+        return (status is not None and status[0]) or self.health_scanner.exists(folder, 'dir')
+
+    def open_folder(self, tool):
+        import subprocess, os
+        folder = os.path.dirname(tool.path)
+        if self.folder_exists(tool, folder):
+            if sys.platform.startswith('win'):
+                os.startfile(folder)
+            elif sys.platform.startswith('darwin'):
+                subprocess.Popen(['open', folder])
+            else:
+                subprocess.Popen(['xdg-open', folder])
+
+    def open_cmd(self, tool):
+        import subprocess, os, sys
+        folder = os.path.dirname(tool.path)
+        if self.folder_exists(tool, folder):
+            if sys.platform.startswith('win'):
+                CREATE_NEW_CONSOLE = 0x00000010
+                terminal_options = [
+                    {"cmd": ["wt.exe", "-d", folder], "args": {}, "name": "Windows Terminal"},
+                    {"cmd": ["pwsh.exe", "-NoExit"], "args": {"cwd": folder}, "name": "PowerShell Core"},
+                    {"cmd": ["powershell.exe", "-NoExit"], "args": {"cwd": folder}, "name": "Windows PowerShell"},
+                    {"cmd": ["cmd.exe"], "args": {"cwd": folder}, "name": "Command Prompt"}
+                ]
+                for option in terminal_options:
+                    try:
+                        subprocess.Popen(option["cmd"], creationflags=CREATE_NEW_CONSOLE, **option["args"])
+                        self.set_status(f"✅ 已用 {option['name']} 打开命令行: {folder}")
+                        return
+                    except FileNotFoundError:
+                        continue
+                    except Exception:
+                        continue
+                QMessageBox.critical(self, "错误", "无法打开任何终端。请检查您的系统配置。")
+            elif sys.platform.startswith('darwin'):
+                subprocess.Popen(['open', '-a', 'Terminal', folder])
+            else:
+                try:
+                    subprocess.Popen(['gnome-terminal', '--working-directory', folder])
+                except FileNotFoundError:
+                    subprocess.Popen(['x-terminal-emulator', '--working-directory', folder])
+
+    def copy_path(self, tool):
+        QApplication.clipboard().setText(tool.path)
+        self.set_status(f"📋 已复制路径: {tool.path}")
+
+    def copy_info(self, tool):
+        info = f"工具名称: {tool.name}\n类型: {tool.tool_type}\n分类: {tool.category}\n描述: {tool.description}\n路径: {tool.path}\n启动次数: {tool.launch_count}\n最后启动: {tool.last_launch}"
+        QApplication.clipboard().setText(info)
+        self.set_status(f"📋 已复制工具 '{tool.name}' 的信息")
+
+    def delete_tool(self, tool):
+        from PyQt5.QtWidgets import QMessageBox
+        reply = QMessageBox.question(self, "删除工具", f"确定要删除工具 '{tool.name}' 吗？", QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.health_scanner.forget(tool)
+            self.save_tools(tool, deleted=True)
+            if self.tool_store is not None:
+                # 已加载的行里去掉这一行，后续页的偏移随库中行数一起减一
+                self.tools = self.tool_store.pages()
+                self.filtered_tools.invalidate()
+                self.build_category_tree()
+            else:
+                self.tools = [t for t in self.tools if t != tool]
+                self.search_index.remove(tool)
+                self.frecency.remove(tool)
+                self.update_category_items(self.category_trie.remove(tool))
+                self.filtered_tools = [t for t in self.filtered_tools if t != tool]
+            self.tool_model.remove_tool(tool)
+            self.update_search_stats()
+
+    def save_tools(self, tool=None, deleted=False):
+        # SQLite 存储只写入变化的那一行
+        if self.tool_store is not None:
+            if tool is not None:
+                if deleted:
+                    self.tool_store.delete_tool(tool)
+                else:
+                    self.tool_store.save_tool(tool)
+            return
+        # 标记为待保存，由写线程合并后写入 config.json，可在任意线程调用
+        self.config_store.mark_dirty(self.catalog_snapshot)
+
+    def record_launch(self, tool, ts):
+        if self.tool_store is not None:
+            self.tool_store.record_launch(tool, ts)
+        else:
+            if self.launch_journal.record(tool, ts):
+                self.compact_launch_journal()
+            self.frecency.record(tool, ts)
+            self.search_index.touch(tool)
+        self.toolUpdated.emit(tool)
+
+    def catalog_snapshot(self):
+        with self.launch_journal.lock:
+            return {"tools": [t.to_dict() for t in list(self.tools)], "journal_seq": self.launch_journal.seq}
+
+    def compact_launch_journal(self):
+        def persist_catalog():
+            self.save_tools()
+            return self.config_store.flush()
+        try:
+            self.launch_journal.compact(persist_catalog)
+        except OSError as e:
+            self.configSaveFailed.emit(str(e))
+
+    def get_all_categories(self):
+        if self.tool_store is not None:
+            return self.tool_store.categories()
+        return self.category_trie.categories()
+
+    def build_category_tree(self):
+        # 全量构建只在加载时执行一次，之后由 update_category_items 局部更新
+        self.category_tree.clear()
+        self.category_items = {}
+        if self.tool_store is not None:
+            # SQLite 存储只按分类统计数量，不读取工具
+            self.category_trie.build_counts(self.tool_store.category_counts())
+        else:
+            self.category_trie.build(self.tools)
+        def add_items(node):
+            self.update_category_items([node])
+            for name in sorted(node.children):
+                add_items(node.children[name])
+        add_items(self.category_trie.root)
+        self.category_tree.expandAll()
+
+    def update_category_items(self, nodes):
+        # 按分类树节点新增、删除或刷新对应的树控件项（nodes 需按从根到叶的顺序）
+        root = self.category_trie.root
+        # 已被摘除的节点从叶子往上删除
+        for node in reversed(nodes):
+            if node is not root and node.parent is None:
+                item = self.category_items.pop(node.path, None)
+                if item is not None and item.parent() is not None:
+                    item.parent().removeChild(item)
+        for node in nodes:
+            if node is not root and node.parent is None:
+                continue
+            item = self.category_items.get(node.path)
+            if item is None:
+                item = QTreeWidgetItem()
+                item.setData(0, Qt.UserRole, node.path if node.path else "__all__")
+                if node.parent is None:
+                    self.category_tree.addTopLevelItem(item)
+                else:
+                    parent_item = self.category_items[node.parent.path]
+                    parent_item.insertChild(sorted(node.parent.children).index(node.name), item)
+                    parent_item.setExpanded(True)
+                self.category_items[node.path] = item
+            item.setText(0, f"{node.name if node.path else '所有工具'} ({node.count})")
+
+    def on_category_clicked(self, item, col=0):
+        path = item.data(0, Qt.UserRole)
+        self.current_category = None if path == "__all__" else path
+        if path == "__all__":
+            # 所有工具
+            self.filtered_tools = self.tools
+        elif self.tool_store is not None:
+            self.filtered_tools = self.tool_store.pages(category=path)
+        else:
+            self.filtered_tools = self.category_trie.tools_under(path)
+        self.show_tools()
+
+    def closeEvent(self, event):
+        self.search_scheduler.stop()
+        self.icon_loader.stop()
+        self.config_store.close()
+        self.launch_journal.close()
+        if self.tool_store is not None:
+            self.tool_store.close()
+        self.launch_scheduler.stop()
+        self.supervisor.stop()
+        self.health_scanner.stop()
+        self.metrics_export_timer.stop()
+        self.export_metrics()
+        if self.instance_server is not None:
+            self.instance_server.close()
+        if self.venv_pool is not None:
+            self.venv_pool.stop()
+        if self.zygotes is not None:
+            self.zygotes.stop()
+        self.installer.stop()
+        super().closeEvent(event)
+
+    def init_config_watcher(self):
+        # 监视 config.json 的外部修改（配置下发脚本、同步盘等），只对变化的工具做增量更新
+        # 同时监视所在目录，编辑器以“写临时文件再替换”方式保存时文件会被重新创建
+        if self.tool_store is not None:
+            return
+        from PyQt5.QtCore import QFileSystemWatcher
+        self.config_watcher = QFileSystemWatcher(self)
+        self.config_watcher.addPath(os.path.dirname(os.path.abspath(CONFIG_PATH)))
+        if os.path.exists(CONFIG_PATH):
+            self.config_watcher.addPath(CONFIG_PATH)
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(CONFIG_RELOAD_DELAY_MS)
+        self.config_reload_timer.timeout.connect(self.reload_config)
+        self.config_watcher.fileChanged.connect(lambda path: self.config_reload_timer.start())
+        self.config_watcher.directoryChanged.connect(lambda path: self.config_reload_timer.start())
+
+    def reload_config(self):
+        if os.path.exists(CONFIG_PATH) and CONFIG_PATH not in self.config_watcher.files():
+            self.config_watcher.addPath(CONFIG_PATH)
+        stat = ConfigStore.stat_key(CONFIG_PATH)
+        if stat is None or stat == self.config_store.last_stat:
+            return  # 本进程自己写入的，或文件暂时不存在
+        try:
+            data = self.config_store.load()
+        except (OSError, ValueError):
+            # 对方可能还没写完，稍后再试
+            self.config_reload_timer.start()
+            return
+        new_tools = [Tool.from_dict(item) for item in data.get('tools', [])]
+        with self.launch_journal.lock:
+            # 重放尚未折算进文件的启动记录，避免外部修改覆盖本地计数
+            self.launch_journal.load(new_tools, data.get('journal_seq', 0))
+        added, removed, changed = self.apply_catalog_diff(new_tools)
+        self.settings = self.config_store.extra
+        self.java_registry.configure(self.settings)
+        self.installer.offline = bool(self.settings.get('offline', False))
+        self.installer.wheelhouse = self.settings.get('wheelhouse') or WHEEL_CACHE_DIR
+        self.apply_metrics_settings()
+        self.init_zygotes()
+        if self.venv_pool is not None:
+            self.venv_pool.interpreters = self.settings.get('python_interpreters') or {}
+        if added or removed or changed:
+            self.set_status(f"🔄 配置文件已更新：新增 {added}，删除 {removed}，修改 {changed} 个工具")
+
+    def apply_catalog_diff(self, new_tools):
+        # 按 (名称, 路径) 对比新旧工具列表，保留未变化工具的对象（进程监管等按对象跟踪）
+        old_by_key = {}
+        for tool in self.tools:
+            old_by_key.setdefault(tool_key(tool), []).append(tool)
+        tools, added, changed = [], [], []
+        for new in new_tools:
+            bucket = old_by_key.get(tool_key(new))
+            if not bucket:
+                added.append(new)
+                tools.append(new)
+                continue
+            tool = bucket.pop(0)
+            tools.append(tool)
+            if tool.to_dict() != new.to_dict():
+                changed.append((tool, new))
+        removed = [tool for bucket in old_by_key.values() for tool in bucket]
+        self.tools = tools
+        for tool in removed:
+            self.search_index.remove(tool)
+            self.frecency.remove(tool)
+            self.health_scanner.forget(tool)
+            self.update_category_items(self.category_trie.remove(tool))
+            self.tool_model.remove_tool(tool)
+            self.icon_loader.forget(tool.icon_path)
+        reorder = bool(added)  # 分类或常用度变化时需要重新筛选排序
+        for tool, new in changed:
+            old_category = tool.category
+            # 图标可能换了路径或刚放到位，新旧路径的缓存（包括读取失败的记录）都作废
+            self.icon_loader.forget(tool.icon_path)
+            tool.tool_type = new.tool_type
+            tool.description = new.description
+            tool.icon_path = new.icon_path
+            self.icon_loader.forget(tool.icon_path)
+            tool.args = new.args
+            if (tool.launch_count, tool.last_launch) != (new.launch_count, new.last_launch):
+                tool.launch_count = new.launch_count
+                tool.last_launch = new.last_launch
+                self.frecency.reset(tool, self.launch_journal.history(tool))
+                reorder = True
+            if new.category != old_category:
+                self.update_category_items(self.category_trie.remove(tool))
+                tool.category = new.category
+                self.update_category_items(self.category_trie.add(tool))
+                reorder = True
+            self.search_index.update(tool)
+            self.toolUpdated.emit(tool)
+        for tool in added:
+            self.search_index.add(tool)
+            self.frecency.add(tool, self.launch_journal.history(tool))
+            self.update_category_items(self.category_trie.add(tool))
+            if self.venv_pool is not None:
+                self.venv_pool.prepare(tool)
+        if added or changed:
+            self.health_scanner.scan(added + [tool for tool, _ in changed])
+        if reorder:
+            self.apply_current_filter()
+        else:
+            if removed:
+                removed_ids = {id(t) for t in removed}
+                self.filtered_tools = [t for t in self.filtered_tools if id(t) not in removed_ids]
+            self.update_search_stats()
+        return len(added), len(removed), len(changed)
+
+    def apply_current_filter(self):
+        # 按当前的搜索词或分类重新筛选
+        text = self.search_input.text().strip()
+        if text:
+            self.search_scheduler.schedule(text)
+            return
+        if not self.current_category:
+            self.filtered_tools = self.tools
+        elif self.tool_store is not None:
+            self.filtered_tools = self.tool_store.pages(category=self.current_category)
+        else:
+            self.filtered_tools = self.category_trie.tools_under(self.current_category)
+        self.show_tools()
+
+    def start_instance_server(self):
+        self.instance_server = InstanceServer(self.handle_instance_command, self)
+        if not self.instance_server.listen():
+            self.set_status("⚠️ 单实例服务启动失败，其它进程的命令无法转发到本窗口")
+
+    def handle_instance_command(self, argv):
+        # 处理其它进程转发来的命令，基于内存中的工具目录执行
+        args = build_cli_parser().parse_args(argv)
+        if args.command in ('show', 'focus'):
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+            if args.command == 'focus':
+                if args.query:
+                    self.search_input.setText(args.query)
+                self.search_input.setFocus()
+                self.search_input.selectAll()
+            return 0, json.dumps({"ok": True}) + "\n" if args.json else "", ""
+        def launch(tool):
+            self.launch_tool(tool)
+            return True, [f"已提交启动: {tool.name}"]
+        if self.tool_store is not None:
+            query = SqliteCatalogQuery(self.tool_store)
+        else:
+            query = CatalogQuery(self.tools, self.search_index, self.category_trie, self.frecency)
+        return execute_cli(args, query, launch)
+
+    def keyPressEvent(self, event):
+        if event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_F:
+            self.search_input.setFocus()
+            self.search_input.selectAll()
+        super().keyPressEvent(event)
+
+    def set_status(self, text):
+        max_len = 60
+        if len(text) > max_len:
+            self.status_label.setText(text[:max_len] + "...")
+            self.status_label.setToolTip(text)
+        else:
+            self.status_label.setText(text)
+            self.status_label.setToolTip("")
+
+class ToolEditDialog(QDialog):
+    TYPE_MAP = [
+        ("GUI应用", "exe"),
+        ("命令行", "exe"),
+        ("java8图形化", "java8_gui"),
+        ("java11图形化", "java11_gui"),
+        ("java8", "java8"),
+        ("java11", "java11"),
+        ("python", "python"),
+        ("powershell", "powershell"),
+        ("批处理", "batch"),
+        ("VBS脚本", "vbs"),
+        ("网页", "url"),
+        ("文件夹", "folder")
+    ]
+    def __init__(self, parent=None, tool=None, categories=None):
+        super().__init__(parent)
+        self.setWindowTitle("编辑工具" if tool else "添加工具")
+        self.setMinimumWidth(600)
+        self.setMinimumHeight(600)
+        self.resize(600, 340)
+        layout = QVBoxLayout(self)
+        # 名称
+        self.name_edit = QLineEdit(tool.name if tool else "")
+        layout.addWidget(QLabel("工具名称:"))
+        layout.addWidget(self.name_edit)
+        # 类型（中文显示）
+        self.type_combo = QComboBox()
+        for zh, en in self.TYPE_MAP:
+            self.type_combo.addItem(zh, en)
+        if tool:
+            # 反查英文到中文
+            for i, (zh, en) in enumerate(self.TYPE_MAP):
+                if en == tool.tool_type:
+                    self.type_combo.setCurrentIndex(i)
+                    break
+        layout.addWidget(QLabel("工具类型:"))
+        layout.addWidget(self.type_combo)
+        # 路径
+        path_layout = QHBoxLayout()
+        self.path_edit = QLineEdit(tool.path if tool else "")
+        path_btn = QPushButton("📁")
+        path_btn.clicked.connect(self.browse_path)
+        path_layout.addWidget(self.path_edit)
+        path_layout.addWidget(path_btn)
+        layout.addWidget(QLabel("工具路径:"))
+        layout.addLayout(path_layout)
+        # 图标
+        icon_layout = QHBoxLayout()
+        self.icon_edit = QLineEdit(tool.icon_path if tool else "")
+        icon_btn = QPushButton("🖼️")
+        icon_btn.clicked.connect(self.browse_icon)
+        icon_layout.addWidget(self.icon_edit)
+        icon_layout.addWidget(icon_btn)
+        layout.addWidget(QLabel("图标路径:"))
+        layout.addLayout(icon_layout)
+        # 分类（允许自由输入）
+        self.category_edit = QLineEdit(tool.category if tool else "")
+        layout.addWidget(QLabel("工具分类:"))
+        layout.addWidget(self.category_edit)
+        # 启动参数
+        self.args_edit = QLineEdit(tool.args if tool else "")
+        layout.addWidget(QLabel("启动参数:"))
+        layout.addWidget(self.args_edit)
+        # 描述
+        self.desc_edit = QTextEdit(tool.description if tool else "")
+        layout.addWidget(QLabel("工具描述:"))
+        layout.addWidget(self.desc_edit)
+        # 按钮
+        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        layout.addWidget(btns)
+        # 美化弹窗整体风格
+        self.setStyleSheet('''
+            QDialog {
+                background: #f8fafd;
+                border-radius: 16px;
+                font-family: "Microsoft YaHei", Arial, sans-serif;
+            }
+            QLabel {
+                font-size: 15px;
+                color: #222;
+                margin-bottom: 2px;
+            }
+            QLineEdit, QTextEdit {
+                background: #fff;
+                border: 1px solid #e0e3e7;
+                border-radius: 8px;
+                font-size: 15px;
+                padding: 8px 10px;
+                margin-bottom: 8px;
+            }
+            QLineEdit:focus, QTextEdit:focus {
+                border: 1.5px solid #764ba2;
+                background: #f5f6fa;
+            }
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #667eea, stop:1 #764ba2);
+                color: #fff;
+                border: none;
+                border-radius: 8px;
+                font-size: 15px;
+                font-weight: bold;
+                padding: 8px 0;
+                min-width: 60px;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #764ba2, stop:1 #667eea);
+            }
+            QDialogButtonBox QPushButton {
+                min-width: 80px;
+                margin: 0 8px;
+            }
+        ''')
+    def browse_path(self):
+        path, _ = QFileDialog.getOpenFileName(self, "选择工具文件", "", "所有文件 (*)")
+        if path:
+            self.path_edit.setText(path)
+    def browse_icon(self):
+        path, _ = QFileDialog.getOpenFileName(self, "选择图标", "", "图标文件 (*.ico *.png *.jpg *.jpeg);;所有文件 (*)")
+        if path:
+            self.icon_edit.setText(path)
+    def get_data(self):
+        return {
+            "name": self.name_edit.text().strip(),
+            "tool_type": self.type_combo.currentData(),
+            "path": self.path_edit.text().strip(),
+            "icon_path": self.icon_edit.text().strip(),
+            "category": self.category_edit.text().strip(),
+            "args": self.args_edit.text().strip(),
+            "description": self.desc_edit.toPlainText().strip(),
+        }
+
+# 日志尾部查看：每秒检查一次文件，变化时重新读取末尾 LOG_TAIL_BYTES 字节
+class LogTailDialog(QDialog):
+    def __init__(self, path, title, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(900, 560)
+        self.path = path
+        self._stamp = None
+        layout = QVBoxLayout(self)
+        self.path_label = QLabel(f"{path}（仅显示最后 {LOG_TAIL_BYTES // 1024} KB）")
+        self.path_label.setStyleSheet("color: #888;")
+        layout.addWidget(self.path_label)
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.text.setStyleSheet("font-family: Consolas, monospace; font-size: 12px;")
+        layout.addWidget(self.text)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        bar = self.text.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 2
+        self.text.setPlainText(tail_log(self.path))
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+# 性能诊断面板：各埋点阶段的次数与分位数，选中一行时绘制其耗时分布直方图
+class HistogramView(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(160)
+        self.hist = None
+        self.buckets = ()
+
+    def set_histogram(self, hist, buckets):
+        self.hist = hist
+        self.buckets = buckets
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("white"))
+        if self.hist is None or not self.hist.count:
+            painter.setPen(QColor("#888"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "暂无数据")
+            return
+        labels = [f"≤{le:g}" for le in self.buckets] + [">" + f"{self.buckets[-1]:g}"]
+        counts = self.hist.counts
+        area = self.rect().adjusted(10, 20, -10, -30)
+        width = area.width() / len(counts)
+        peak = max(counts) or 1
+        font = QFont(self.font())
+        font.setPixelSize(10)
+        painter.setFont(font)
+        for i, n in enumerate(counts):
+            height = int(area.height() * n / peak)
+            bar = QRect(int(area.left() + i * width) + 2, area.bottom() - height, max(1, int(width) - 4), height)
+            painter.fillRect(bar, QColor("#667eea"))
+            if n:
+                painter.setPen(QColor("#212529"))
+                painter.drawText(QRect(bar.left() - 10, bar.top() - 14, bar.width() + 20, 12), Qt.AlignCenter, str(n))
+            painter.setPen(QColor("#6c757d"))
+            painter.drawText(QRect(int(area.left() + i * width), area.bottom() + 4, int(width), 20), Qt.AlignCenter, labels[i])
+
+class MetricsDialog(QDialog):
+    COLUMNS = ("阶段", "次数", "平均(ms)", "P50", "P95", "P99", "最大(ms)")
+    def __init__(self, export_path=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("📊 性能诊断")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(820, 560)
+        self.export_path = export_path
+        layout = QVBoxLayout(self)
+        top = QHBoxLayout()
+        self.enabled_box = QCheckBox("启用耗时采集")
+        self.enabled_box.setChecked(metrics.enabled)
+        self.enabled_box.toggled.connect(self.set_enabled)
+        top.addWidget(self.enabled_box)
+        top.addStretch(1)
+        reset_btn = QPushButton("清空")
+        reset_btn.clicked.connect(lambda: (metrics.reset(), self.refresh()))
+        top.addWidget(reset_btn)
+        export_btn = QPushButton("导出...")
+        export_btn.clicked.connect(self.export)
+        top.addWidget(export_btn)
+        layout.addLayout(top)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.itemSelectionChanged.connect(self.update_histogram)
+        layout.addWidget(self.table, 1)
+        self.histogram = HistogramView()
+        layout.addWidget(self.histogram)
+        self.snapshot = {}
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def set_enabled(self, enabled):
+        metrics.enabled = enabled
+
+    def refresh(self):
+        selected = self.selected_name()
+        self.snapshot = metrics.snapshot()
+        names = sorted(self.snapshot)
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            hist = self.snapshot[name]
+            values = (name, str(hist.count), f"{hist.total / hist.count:.1f}" if hist.count else "-",
+                      *(f"{hist.quantile(q, metrics.buckets):.1f}" for q in (0.5, 0.95, 0.99)), f"{hist.max:.1f}")
+            for col, value in enumerate(values):
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    self.table.setItem(row, col, item)
+                item.setText(value)
+            if name == selected:
+                self.table.selectRow(row)
+        self.table.blockSignals(False)
+        self.update_histogram()
+
+    def selected_name(self):
+        items = self.table.selectedItems()
+        return self.table.item(items[0].row(), 0).text() if items else None
+
+    def update_histogram(self):
+        name = self.selected_name()
+        self.histogram.set_histogram(self.snapshot.get(name), metrics.buckets)
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "导出性能数据", self.export_path or "metrics.prom",
+                                              "Prometheus 文本 (*.prom);;JSON (*.json)")
+        if not path:
+            return
+        try:
+            metrics.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "导出失败", str(e))
+
+class InstanceServer(QObject):
+    def __init__(self, handler, parent=None):
+        super().__init__(parent)
+        from PyQt5.QtNetwork import QLocalServer
+        self.handler = handler  # argv -> (返回码, 标准输出, 标准错误)，在界面线程执行
+        self.server = QLocalServer(self)
+        # 只允许当前用户连接：POSIX 下套接字文件权限仅限属主，Windows 下管道只授权给当前用户
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._on_connection)
+
+    def listen(self):
+        name = instance_server_name()
+        if self.server.listen(name):
+            return True
+        # 上次异常退出遗留的套接字文件：确认无人应答后清理再监听
+        if send_to_instance(['show', '--json']) is None:
+            self.server.removeServer(name)
+            return self.server.listen(name)
+        return False
+
+    def close(self):
+        self.server.close()
+
+    def _on_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.setProperty('buffer', b'')
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    @staticmethod
+    def parse_request(data):
+        # 只接受 {"argv": [字符串, ...]} 且命令在 CLI_COMMANDS 中的请求，否则返回 None
+        try:
+            request = json.loads(data.decode('utf-8'))
+        except ValueError:
+            return None
+        argv = request.get('argv') if isinstance(request, dict) else None
+        if not isinstance(argv, list) or not argv or not all(isinstance(arg, str) for arg in argv):
+            return None
+        if argv[0] not in CLI_COMMANDS:
+            return None
+        return argv
+
+    def _on_ready_read(self, socket):
+        data = socket.property('buffer') + bytes(socket.readAll())
+        if len(data) > IPC_MAX_REQUEST_BYTES:
+            socket.abort()
+            return
+        if not data.endswith(b'\n'):
+            socket.setProperty('buffer', data)
+            return
+        argv = self.parse_request(data)
+        if argv is None:
+            socket.abort()
+            return
+        try:
+            code, out, err = self.handler(argv)
+        except SystemExit:
+            code, out, err = 2, "", "参数错误\n"
+        except Exception as e:
+            code, out, err = 1, "", f"执行失败: {e}\n"
+        socket.write((json.dumps({"code": code, "stdout": out, "stderr": err}, ensure_ascii=False) + "\n").encode('utf-8'))
+        socket.flush()
+        socket.disconnectFromServer()
+
+
+def run_gui(argv, started=None):
+    # 命令行模式已由 main.py 处理；走到这里的 show/focus 表示没有运行中的实例，启动图形界面
+    if not (argv and argv[0] in CLI_COMMANDS) and '--new-instance' not in argv and send_to_instance(['show']) is not None:
+        # 已有实例在运行：激活它的窗口后退出，避免两个实例互相覆盖配置
+        return 0
+    metrics.enabled = '--metrics' in argv
+    profiler = StartupProfiler('--profile-startup' in argv, started)
+    profiler.mark("import")
+    app = QApplication([sys.argv[0]] + list(argv))
+    profiler.mark("qapplication")
+    window = QuickStartMainWindow(profiler)
+    window.show()
+    if '--new-instance' not in argv:
+        window.start_instance_server()
+    if argv and argv[0] == 'focus':
+        window.handle_instance_command(argv)
+    return app.exec_()
@@ -0,0 +1,40 @@
+# 启动日志整理频率：整理后保留的历史不计入阈值，N 次启动只触发 O(N/阈值) 次整理
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import quickstart_core as core
+
+
+def run_launches(tmp_path, tools, launches, threshold=100, keep=50):
+    journal = core.LaunchJournal(str(tmp_path / 'launches.jsonl'), compact_threshold=threshold, keep_per_tool=keep)
+    journal.load(tools)
+    compactions = 0
+    for i in range(launches):
+        tool = tools[i % len(tools)]
+        if journal.record(tool, f"2025-01-01T00:00:{i % 60:02d}"):
+            assert journal.compact(lambda: True)
+            compactions += 1
+    journal.close()
+    return journal, compactions
+
+
+def test_compactions_scale_with_new_lines(tmp_path):
+    # 60 个工具各保留 50 条历史，保留行数（3000）远超阈值
+    tools = [core.Tool({"name": f"tool{i}", "path": f"/tools/{i}.exe"}) for i in range(60)]
+    launches = 60 * 60
+    journal, compactions = run_launches(tmp_path, tools, launches)
+    assert compactions <= launches // 100
+    assert all(len(items) <= 50 + 100 for items in journal.events.values())
+    assert sum(t.launch_count for t in tools) == launches
+
+
+def test_reload_does_not_compact_retained_history(tmp_path):
+    tools = [core.Tool({"name": f"tool{i}", "path": f"/tools/{i}.exe"}) for i in range(60)]
+    journal, _ = run_launches(tmp_path, tools, 60 * 60)
+    seq = journal.seq
+    reloaded = [core.Tool({"name": t.name, "path": t.path, "launch_count": t.launch_count}) for t in tools]
+    again = core.LaunchJournal(journal.path, compact_threshold=100, keep_per_tool=50)
+    # 计数已全部折算，重新加载只读回保留的历史，不应立即要求整理
+    assert not again.load(reloaded, seq)
+    assert [t.launch_count for t in reloaded] == [t.launch_count for t in tools]